@@ -13,7 +13,8 @@ requires = [
 
 setup(
   name = 'Misty-SDK',
-  packages = ['mistyPy', 'src', 'src.core', 'src.handlers', 'src.utils'],
+  packages = ['mistyPy', 'src', 'src.core', 'src.handlers', 'src.prompts', 'src.utils'],
+  package_data={'src.prompts': ['*.md']},
   version = '0.2.0',
   license='apache-2.0',
   description = 'Python SDK for Misty 2 Robots',
@@ -3,9 +3,38 @@
 Handles conversation with OpenAI GPT models.
 """
 
+import re
+import time
 import logging
-from typing import Optional, List, Dict
+import threading
+from collections import OrderedDict
+from typing import Optional, List, Dict, Iterator, Tuple
 from openai import OpenAI
+from src.prompts import get_uno_bsai_system_prompt, prompt_digest
+
+# Number of opening-question responses kept for reuse
+RESPONSE_CACHE_SIZE = 32
+
+# Exchanges dropped together once history is full. Trimming one exchange
+# per turn would shift the start of the history every turn, so only the
+# system prompt could ever hit the provider's prefix cache; trimming in
+# batches keeps the history prefix stable until the next batch is evicted
+HISTORY_EVICTION_BATCH = 3
+
+# Punctuation and case differences don't change what was asked
+_QUERY_NOISE_RE = re.compile(r"[^\w\s']+")
+
+# End of a sentence in a streamed response (terminal punctuation, any
+# closing quotes or brackets, then whitespace)
+_SENTENCE_END_RE = re.compile(r"[.!?]+[\"')\]]*\s")
+
+# A streamed run-on sentence is handed over early once it gets this long
+STREAM_MAX_CHUNK_WORDS = 60
+
+
+def _normalize_query(user_query: str) -> str:
+    """Reduce a transcribed query to a cache key (case, punctuation, spacing)."""
+    return " ".join(_QUERY_NOISE_RE.sub(" ", user_query.lower()).split())
 
 
 class AIChatHandler:
@@ -20,7 +49,8 @@ class AIChatHandler:
     
     def __init__(self, openai_api_key: str, model: str = "gpt-4o-mini", 
                  max_tokens: int = 512, temperature: float = 0.7,
-                 conversation_history_length: int = 5):
+                 conversation_history_length: int = 5,
+                 system_prompt: Optional[str] = None):
         """Initialize the AI Chat Handler.
         
         Args:
@@ -29,6 +59,7 @@ class AIChatHandler:
             max_tokens: Maximum tokens in response (default: 512)
             temperature: Response creativity 0.0-1.0 (default: 0.7)
             conversation_history_length: Number of exchanges to keep in history (default: 5)
+            system_prompt: System prompt for the assistant (default: the UNO/BSAI prompt)
         """
         self.model = model
         self.max_tokens = max_tokens
@@ -47,177 +78,26 @@ class AIChatHandler:
         # Conversation history: list of message dicts
         self.conversation_history: List[Dict[str, str]] = []
         
-        # System prompt defines Misty's personality
-        self.system_prompt = """You are an official virtual assistant for the University of Nebraska Omaha (UNO), specifically focused on providing information about UNO and its Bachelor of Science in Artificial Intelligence (BSAI) program.
-Your Role and Scope
-Your ONLY purpose is to discuss:
-
-University of Nebraska Omaha (UNO) - its campus, facilities, rankings, and general information
-The Bachelor of Science in Artificial Intelligence (BSAI) program offered by UNO
-The College of Information Science and Technology at UNO
-
-You must STRICTLY operate within the provided knowledge base below. You do NOT have information about:
-
-Other universities or their programs
-Other degree programs at UNO beyond what's mentioned in your knowledge base
-General AI topics, tutorials, or technical explanations unrelated to the BSAI program
-Current events, news, or information outside your knowledge base
-Personal advice unrelated to the UNO BSAI program
-
-Knowledge Base
-UNIVERSITY OF NEBRASKA OMAHA (UNO)
-Basic Information:
-
-Location: Omaha, Nebraska (41.259°N 96.006°W)
-Website: https://www.unomaha.edu/
-Type: Public Research University (R2: High research activity)
-Established: 1908
-Part of: University of Nebraska system
-Campus: 3 campuses (Dodge, Scott, Center), urban setting, 88 acres
-Student Enrollment: Approximately 9,910 full-time students
-
-Academic Structure:
-
-6 colleges offering 200+ degree programs
-Strong focus on Information Science, Technology, and Computer Science
-
-Rankings & Recognition:
-
-#1 public university in the US for veterans
-Affordable tuition among Nebraska's four-year institutions
-High employability focus for students
-
-Resources & Opportunities:
-
-Modern facilities for engineering, IT, business, and biomechanics
-Extensive partnerships with 1,000+ organizations for community engagement
-Service learning opportunities
-Internships and research centers
-AI-powered career development tools
-
-
-BACHELOR OF SCIENCE IN ARTIFICIAL INTELLIGENCE (BSAI)
-Program Details:
-
-College: College of Information Science and Technology
-Department: Computer Science
-Program Start: Spring 2025
-Distinction: First AI bachelor's program in Nebraska, one of few in the Midwest
-Catalog: https://catalog.unomaha.edu/undergraduate/college-information-science-technology/computer-science/ai-bs/#fouryearplantext
-
-Program Mission:
-
-Prepare graduates as AI specialists, leaders, and innovators
-Bridge theory and real-world industry applications
-Target students interested in machine learning, data science, generative AI, and ethical AI application
-Hands-on curriculum with emphasis on practical experience
-
-Curriculum Areas:
-
-Machine Learning
-Data Analysis and Mining
-Neural Networks & Deep Learning
-Natural Language Processing (NLP)
-Computer Vision
-Robotics & Autonomous Systems
-Algorithm Development
-AI Ethics and Society
-Interdisciplinary electives (business, psychology, philosophy)
-
-Special Features:
-
-Real-world project collaborations with Omaha tech sector
-Research opportunities at UNO AI Research Center
-Access to industry internships and community initiatives
-Student organizations for AI, tech, and professional development
-
-Career Outcomes:
-Graduates can pursue roles such as:
-
-AI Engineer
-Machine Learning Engineer
-Data Scientist
-Robotics Engineer
-NLP Specialist
-Computer Vision Engineer
-AI Research Scientist
-
-Job Market:
-
-AI jobs projected to grow over 30% in the next decade
-AI specialist jobs carry up to 25% wage premium in some markets
-
-Admission & Progression:
-
-Direct, standard application through UNO portal
-Open for new enrollment
-Pathways into accelerated Master's programs (5-year BS/MS)
-All backgrounds welcome
-Foundational primer courses available for students without prior computing experience
-
-Industry Connections:
-
-Partnerships with Omaha Chamber of Commerce
-Collaborations with local and national tech firms
-AI-powered career advising
-Immersive job training experiences
-
-
-CONTACT INFORMATION
-College of Information Science and Technology
-
-Phone: (402) 554-3819
-Email: istt@unomaha.edu
-Address: PKI 280, 1110 South 67th Street, Omaha, NE 68182
-
-Communication Style
-CRITICAL: Keep responses short, crisp, and conversational
-
-Write like you're having a natural conversation, not giving a presentation
-Use 2-4 sentences for most responses
-Break up longer information into digestible chunks
-Avoid walls of text and long paragraphs
-Don't list everything at once - share what's relevant to their question
-Use a friendly, casual tone while staying professional
-It's okay to follow up with "Want to know more about [specific topic]?" to keep it interactive
-
-Example of good response style:
-"The BSAI program starts Spring 2025 and it's actually the first AI bachelor's degree in Nebraska! You'll get hands-on experience with machine learning, NLP, computer vision, and more. What aspect interests you most?"
-Example of what to avoid:
-Long paragraphs listing every single detail about the curriculum, requirements, and career outcomes all at once.
-Response Guidelines
-When responding to questions within your scope:
-
-Be helpful and conversational
-Answer directly and concisely
-Share 1-3 key points, not everything at once
-Ask follow-up questions to keep the conversation flowing
-Use natural language, not formal/robotic phrasing
-Direct to contact info only when they need specific help (applications, detailed questions)
-
-When users ask questions OUTSIDE your scope:
-Keep it brief and friendly:
-
-"I'm focused on UNO's AI program specifically. What would you like to know about it?"
-"That's outside my wheelhouse! I'm here for questions about UNO and our BSAI degree. Anything I can help with there?"
-"I only cover UNO's AI bachelor's program. For other programs, check out unomaha.edu or call (402) 554-3819."
-
-Topics to redirect:
-
-Other universities → "I only know about UNO. You'd want to reach out to them directly!"
-Other degree programs → "I specialize in our AI program. For other UNO programs, visit unomaha.edu."
-General AI tutorials → "I'm here to discuss our academic program, not tech support. Want to know what AI topics we cover in class?"
-Specific admission cases → "Best to contact istt@unomaha.edu or call (402) 554-3819 for that!"
-
-Important Rules
-
-NEVER make up information not in your knowledge base
-NEVER discuss other universities or compare programs
-NEVER provide technical AI assistance or coding help
-NEVER give definitive admission decisions
-ALWAYS stay within the scope of UNO and the BSAI program
-ALWAYS keep responses short and conversational
-ALWAYS be honest when you don't have information"""
+        # Bumped by clear_history(); a response generated before a clear is
+        # not written into the history that replaced it
+        self._history_lock = threading.Lock()
+        self._history_generation = 0
+        
+        # [system message, *history] as sent ahead of each new query; kept in
+        # step with the history so a turn doesn't re-walk it (None = rebuild)
+        self._context_messages: Optional[List[Dict[str, str]]] = None
+        
+        # Responses to opening questions (asked with no history), keyed by
+        # prompt and normalised query; visitors tend to open with the same few
+        self._response_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        
+        # System prompt defines Misty's personality (shared with realtime mode)
+        self.system_prompt = system_prompt or get_uno_bsai_system_prompt()
+        
+        # The system message is built once and sent unchanged at the head of
+        # every request, so OpenAI's automatic prompt caching can reuse the
+        # long static prefix instead of re-prefilling it each turn
+        self._refresh_system_message()
         
         self.logger.info("AI Chat Handler initialized successfully")
     
@@ -233,6 +113,12 @@ ALWAYS be honest when you don't have information"""
         try:
             self.logger.info(f"💬 Getting AI response for: '{user_query}'")
             
+            generation = self._history_generation
+            cache_key, cached_response = self._lookup_opening_response(user_query)
+            if cached_response:
+                self._add_to_history(user_query, cached_response, generation)
+                return cached_response
+            
             # Build messages list with system prompt, history, and new query
             messages = self._build_messages(user_query)
             
@@ -243,7 +129,9 @@ ALWAYS be honest when you don't have information"""
                 model=self.model,
                 messages=messages,
                 max_tokens=self.max_tokens,
-                temperature=self.temperature
+                temperature=self.temperature,
+                # Route every session to the same cached system-prompt prefix
+                extra_body={"prompt_cache_key": self._prompt_cache_key}
             )
             
             # Extract response text
@@ -253,7 +141,8 @@ ALWAYS be honest when you don't have information"""
                 self.logger.info(f"✅ AI Response: '{ai_response}'")
                 
                 # Add to conversation history
-                self._add_to_history(user_query, ai_response)
+                self._add_to_history(user_query, ai_response, generation)
+                self._store_opening_response(cache_key, ai_response)
                 
                 return ai_response
             else:
@@ -264,6 +153,137 @@ ALWAYS be honest when you don't have information"""
             self.logger.error(f"Error getting AI response: {e}", exc_info=True)
             return None
     
+    def stream_response(self, user_query: str) -> Iterator[str]:
+        """Yield the AI response sentence by sentence while it is generated.
+        
+        Behaves like get_response() (same history, opening-question cache and
+        prompt cache key), but requests a streamed completion and yields each
+        sentence as soon as it is complete, so speech can start before the
+        whole answer exists. The full response is added to history once the
+        stream ends.
+        
+        Args:
+            user_query: The user's transcribed question or statement
+        
+        Yields:
+            Response text, one sentence (or long clause) at a time; nothing
+            if generation failed
+        """
+        try:
+            self.logger.info(f"💬 Streaming AI response for: '{user_query}'")
+            
+            generation = self._history_generation
+            cache_key, cached_response = self._lookup_opening_response(user_query)
+            if cached_response:
+                self._add_to_history(user_query, cached_response, generation)
+                yield cached_response
+                return
+            
+            messages = self._build_messages(user_query)
+            
+            self.logger.debug(f"Calling OpenAI Chat API ({self.model}, streaming)...")
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                max_tokens=self.max_tokens,
+                temperature=self.temperature,
+                stream=True,
+                # Route every session to the same cached system-prompt prefix
+                extra_body={"prompt_cache_key": self._prompt_cache_key}
+            )
+            
+            parts = []
+            pending = ""
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                parts.append(delta)
+                pending += delta
+                
+                # Hand over everything up to the last complete sentence
+                split_at = 0
+                for match in _SENTENCE_END_RE.finditer(pending):
+                    split_at = match.end()
+                if not split_at and len(pending.split()) >= STREAM_MAX_CHUNK_WORDS:
+                    split_at = len(pending)
+                if split_at:
+                    sentence = pending[:split_at].strip()
+                    pending = pending[split_at:]
+                    if sentence:
+                        yield sentence
+            
+            if pending.strip():
+                yield pending.strip()
+            
+            ai_response = "".join(parts).strip()
+            if ai_response:
+                self.logger.info(f"✅ AI Response: '{ai_response}'")
+                self._add_to_history(user_query, ai_response, generation)
+                self._store_opening_response(cache_key, ai_response)
+            else:
+                self.logger.warning("Empty response from OpenAI")
+            
+        except Exception as e:
+            self.logger.error(f"Error streaming AI response: {e}", exc_info=True)
+    
+    def _lookup_opening_response(self, user_query: str) -> Tuple[Optional[tuple], Optional[str]]:
+        """Look up a cached response for an opening question.
+        
+        An opening question (asked with no history) depends only on the
+        prompt and the query, so a repeat can skip the API round-trip.
+        
+        Args:
+            user_query: The user's transcribed question or statement
+        
+        Returns:
+            (cache key, cached response); the key is None when there is
+            history, the response is None on a miss
+        """
+        if self.conversation_history:
+            return None, None
+        cache_key = (self._prompt_cache_key, _normalize_query(user_query))
+        cached_response = self._response_cache.get(cache_key)
+        if cached_response:
+            self._response_cache.move_to_end(cache_key)
+            self.logger.info(f"♻️  Reusing cached AI response: '{cached_response}'")
+        return cache_key, cached_response
+    
+    def _store_opening_response(self, cache_key: Optional[tuple], ai_response: str):
+        """Cache a response under the key from _lookup_opening_response(), if any."""
+        if not cache_key:
+            return
+        self._response_cache[cache_key] = ai_response
+        if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+    
+    def warm_prompt_cache(self) -> bool:
+        """Prefill the provider's prompt cache for the system prompt.
+        
+        Sends a one-token request that starts with the same system message
+        and prompt_cache_key as real turns, so the first visitor question
+        after a restart reuses the cached prefix instead of paying the full
+        prefill. Safe to run on a background thread; history is untouched.
+        
+        Returns:
+            True if the warm-up request succeeded
+        """
+        try:
+            start = time.time()
+            self.client.chat.completions.create(
+                model=self.model,
+                messages=[self._system_message, {"role": "user", "content": "Hello"}],
+                max_tokens=1,
+                extra_body={"prompt_cache_key": self._prompt_cache_key}
+            )
+            self.logger.info(f"🔥 Prompt cache warmed ({self._prompt_cache_key}) in {time.time() - start:.2f}s")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Prompt cache warm-up failed: {e}")
+            return False
+    
     def _build_messages(self, user_query: str) -> List[Dict[str, str]]:
         """Build messages list for OpenAI API.
         
@@ -273,56 +293,76 @@ ALWAYS be honest when you don't have information"""
         Returns:
             List of message dictionaries
         """
-        messages = []
+        # Add system prompt (rebuilt only if system_prompt was reassigned)
+        if self._system_message["content"] is not self.system_prompt:
+            self._refresh_system_message()
         
-        # Add system prompt
-        messages.append({
-            "role": "system",
-            "content": self.system_prompt
-        })
-        
-        # Add conversation history
-        for exchange in self.conversation_history:
-            messages.append(exchange)
+        # System prompt and conversation history
+        if self._context_messages is None:
+            self._context_messages = [self._system_message, *self.conversation_history]
         
         # Add current user query
-        messages.append({
+        messages = self._context_messages + [{
             "role": "user",
             "content": user_query
-        })
+        }]
         
         self.logger.debug(f"Built messages with {len(messages)} items (including system prompt)")
         return messages
     
-    def _add_to_history(self, user_query: str, ai_response: str):
+    def _refresh_system_message(self):
+        """Rebuild the cached system message and its prompt-cache routing key.
+        
+        The key is derived from the prompt text, so every session (and every
+        restart) using the same prompt shares one warm provider-side cache
+        entry, while a changed prompt gets a fresh one.
+        """
+        self._system_message = {"role": "system", "content": self.system_prompt}
+        self._prompt_cache_key = f"misty-system-{prompt_digest(self.system_prompt)}"
+        self._context_messages = None
+    
+    def _add_to_history(self, user_query: str, ai_response: str, generation: Optional[int] = None):
         """Add exchange to conversation history.
         
         Args:
             user_query: User's query
             ai_response: AI's response
+            generation: History generation read when the query started; the
+                exchange is dropped if the history was cleared since then
         """
-        # Add user message
-        self.conversation_history.append({
-            "role": "user",
-            "content": user_query
-        })
-        
-        # Add assistant response
-        self.conversation_history.append({
-            "role": "assistant",
-            "content": ai_response
-        })
-        
-        # Trim history to max length (keep last N exchanges = 2N messages)
-        max_messages = self.conversation_history_length * 2
-        if len(self.conversation_history) > max_messages:
-            # Remove oldest messages (keep most recent)
-            self.conversation_history = self.conversation_history[-max_messages:]
-            self.logger.debug(f"Trimmed conversation history to {len(self.conversation_history)} messages")
+        exchange = (
+            # User message
+            {"role": "user", "content": user_query},
+            # Assistant response
+            {"role": "assistant", "content": ai_response},
+        )
+        with self._history_lock:
+            if generation is not None and generation != self._history_generation:
+                self.logger.debug("History cleared during the response; not recording the exchange")
+                return
+            self.conversation_history.extend(exchange)
+            
+            # Trim history once it exceeds N exchanges (2N messages), dropping the
+            # oldest exchanges in a batch so the remaining prefix stays cacheable
+            max_messages = self.conversation_history_length * 2
+            if len(self.conversation_history) > max_messages:
+                keep_exchanges = max(1, self.conversation_history_length - HISTORY_EVICTION_BATCH + 1)
+                del self.conversation_history[:-2 * keep_exchanges]
+                self._context_messages = None
+                self.logger.debug(f"Trimmed conversation history to {len(self.conversation_history)} messages")
+            elif self._context_messages is not None:
+                self._context_messages.extend(exchange)
     
     def clear_history(self):
-        """Clear conversation history."""
-        self.conversation_history.clear()
+        """Clear conversation history.
+        
+        A response still being generated when this runs is not added to the
+        cleared history.
+        """
+        with self._history_lock:
+            self._history_generation += 1
+            self.conversation_history.clear()
+            self._context_messages = None
         self.logger.info("Conversation history cleared")
     
     def get_history_summary(self) -> str:
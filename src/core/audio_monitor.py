@@ -318,7 +318,9 @@ class AudioMonitor:
         
         try:
             capture_start = time.time()
-            self.logger.info(f"⏱️  [PERF] Starting direct speech capture at {capture_start:.3f}")
+            perf = self.logger.isEnabledFor(logging.INFO)
+            if perf:
+                self.logger.info(f"⏱️  [PERF] Starting direct speech capture at {capture_start:.3f}")
             
             # Use capture_speech instead of key phrase recognition
             # This captures ANY speech without requiring "Hey Misty"
@@ -331,7 +333,8 @@ class AudioMonitor:
             
             capture_end = time.time()
             if response.status_code == 200:
-                self.logger.info(f"⏱️  [PERF] Direct speech capture started in {capture_end - capture_start:.3f}s - speak now!")
+                if perf:
+                    self.logger.info(f"⏱️  [PERF] Direct speech capture started in {capture_end - capture_start:.3f}s - speak now!")
             else:
                 self.logger.error(f"❌ Failed to start speech capture: {response.status_code}")
                 
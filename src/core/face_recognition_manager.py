@@ -5,11 +5,26 @@ Handles continuous face recognition monitoring and detection events.
 
 import logging
 import time
+from dataclasses import dataclass
 from typing import Optional, Callable
 from mistyPy.Robot import Robot
 from mistyPy.Events import Events
 
 
+@dataclass(frozen=True)
+class FaceEvent:
+    """A recognized face passed to the on_face_recognized callback.
+    
+    Slotted, so each event is a small fixed-layout object rather than a dict.
+    """
+    __slots__ = ("name", "confidence", "timestamp", "raw_event")
+    
+    name: str  # Recognized face label
+    confidence: float  # Misty's match distance (lower = closer match)
+    timestamp: float  # time.time() when the face was recognized
+    raw_event: dict  # Original event message from Misty
+
+
 class FaceRecognitionManager:
     """Manages continuous face recognition for Misty robot.
     
@@ -27,7 +42,7 @@ class FaceRecognitionManager:
         Args:
             misty: Misty robot instance
             on_face_recognized: Optional callback function called when a face is recognized.
-                               Function signature: on_face_recognized(face_data: dict)
+                               Function signature: on_face_recognized(face: FaceEvent)
             camera_active_color: RGB tuple for LED color when camera is active (default: blue)
         """
         self.misty = misty
@@ -293,16 +308,11 @@ class FaceRecognitionManager:
                 last_trig = self._last_triggered.get(face_label, 0)
                 if now - last_trig >= self.min_trigger_interval_seconds:
                     self.logger.info(f"👤 Face recognized: '{face_label}' (confidence: {confidence:.2f}) - consecutive={hist['count']}")
-                    face_data = {
-                        "name": face_label,
-                        "confidence": confidence,
-                        "timestamp": now,
-                        "raw_event": message
-                    }
+                    face = FaceEvent(face_label, confidence, now, message)
                     # Call external callback if provided
                     if self.on_face_recognized:
                         try:
-                            self.on_face_recognized(face_data)
+                            self.on_face_recognized(face)
                             self._last_triggered[face_label] = now
                         except Exception as e:
                             self.logger.error(f"Error in face recognition callback: {e}", exc_info=True)
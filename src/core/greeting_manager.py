@@ -7,11 +7,28 @@ import logging
 import time
 import random
 import os
+import uuid
 import base64
+import threading
+from dataclasses import dataclass
 from typing import Optional, Dict
 from mistyPy.Robot import Robot
 
 
+@dataclass(frozen=True)
+class GreetingStatus:
+    """Cooldown state for one person, as reported by get_greeting_status()."""
+    __slots__ = ("person", "last_greeted", "time_since_greeting", "can_greet",
+                 "cooldown_remaining", "has_cached_audio")
+    
+    person: str
+    last_greeted: Optional[float]  # time.time() of the last greeting, None if never greeted
+    time_since_greeting: Optional[float]  # Seconds since the last greeting, None if never greeted
+    can_greet: bool
+    cooldown_remaining: float  # Seconds until the person may be greeted again
+    has_cached_audio: bool  # Whether a pre-generated greeting is available
+
+
 class GreetingManager:
     """Manages personalized greetings with cooldown tracking.
     
@@ -62,6 +79,10 @@ class GreetingManager:
         # Format: {"PersonName": timestamp}
         self.last_greeting_times: Dict[str, float] = {}
         
+        # Monotonic deadline before which each person may not be greeted again
+        # Format: {"PersonName": time.monotonic() + cooldown_seconds}
+        self._next_allowed: Dict[str, float] = {}
+        
         # Local cache for pre-generated greeting audio files
         # Format: {"PersonName": "/path/to/greeting_PersonName.wav"}
         self.greeting_audio_cache: Dict[str, str] = {}
@@ -117,29 +138,25 @@ class GreetingManager:
     def should_greet(self, person_name: str) -> bool:
         """Check if we should greet this person based on cooldown.
         
+        This runs on every face recognition event, so it is a single dict
+        lookup against a precomputed monotonic deadline.
+        
         Args:
             person_name: Name of the person to check
         
         Returns:
             True if person should be greeted, False if within cooldown period
         """
-        current_time = time.time()
-        
-        # If we've never greeted this person, greet them
-        if person_name not in self.last_greeting_times:
-            return True
-        
-        # Check if enough time has passed since last greeting
-        last_greeting_time = self.last_greeting_times[person_name]
-        time_elapsed = current_time - last_greeting_time
-        
-        if time_elapsed >= self.cooldown_seconds:
-            return True
-        
-        # Still within cooldown period
-        time_remaining = self.cooldown_seconds - time_elapsed
-        self.logger.debug(f"Cooldown active for '{person_name}': {time_remaining:.1f}s remaining")
-        return False
+        return time.monotonic() >= self._next_allowed.get(person_name, 0.0)
+    
+    def _cooldown_remaining(self, person_name: str) -> float:
+        """Get seconds left in the cooldown for a person (0 if none)."""
+        return max(0.0, self._next_allowed.get(person_name, 0.0) - time.monotonic())
+    
+    def _record_greeting(self, person_name: str):
+        """Record a delivered greeting and arm the cooldown deadline."""
+        self.last_greeting_times[person_name] = time.time()
+        self._next_allowed[person_name] = time.monotonic() + self.cooldown_seconds
     
     def get_greeting_message(self, person_name: str) -> str:
         """Generate a personalized greeting message.
@@ -177,7 +194,7 @@ class GreetingManager:
         try:
             # Check cooldown (unless forced)
             if not force and not self.should_greet(person_name):
-                time_remaining = self.cooldown_seconds - (time.time() - self.last_greeting_times[person_name])
+                time_remaining = self._cooldown_remaining(person_name)
                 self.logger.info(f"⏳ Skipping greeting for '{person_name}' (cooldown: {time_remaining:.0f}s remaining)")
                 return False
             
@@ -211,7 +228,7 @@ class GreetingManager:
                         # Fall through to other methods
                     else:
                         # Success! Update tracking and return
-                        self.last_greeting_times[person_name] = time.time()
+                        self._record_greeting(person_name)
                         time.sleep(2)  # Brief delay
                         try:
                             r, g, b = self.idle_led_color
@@ -235,7 +252,7 @@ class GreetingManager:
                 return False
             
             # Update last greeting time
-            self.last_greeting_times[person_name] = time.time()
+            self._record_greeting(person_name)
             
             # Wait a moment for speech to complete, then return LED to idle
             time.sleep(2)  # Brief delay before returning to idle
@@ -281,12 +298,11 @@ class GreetingManager:
             self.logger.info(f"📦 Loaded {file_size_kb:.2f} KB from local storage")
             
             # Generate unique filename for Misty
-            import uuid
             misty_filename = f"temp_greeting_{uuid.uuid4().hex[:8]}.wav"
             
             # Convert to base64 for Misty API
             self.logger.info(f"📤 Uploading to Misty as: {misty_filename}")
-            b64_data = base64.b64encode(wav_bytes).decode('utf-8')
+            b64_data = base64.b64encode(wav_bytes).decode('ascii')
             
             # Upload to Misty
             upload_response = self.misty.save_audio(
@@ -310,7 +326,6 @@ class GreetingManager:
                 self.logger.info(f"✅ Playback started successfully")
                 
                 # Schedule cleanup in background (delete temp file after 5 seconds)
-                import threading
                 def cleanup():
                     time.sleep(5)
                     try:
@@ -343,48 +358,44 @@ class GreetingManager:
             person_name: Name of person to reset cooldown for, or None to reset all
         """
         if person_name:
+            self._next_allowed.pop(person_name, None)
             if person_name in self.last_greeting_times:
                 del self.last_greeting_times[person_name]
                 self.logger.info(f"Cooldown reset for '{person_name}'")
         else:
+            self._next_allowed.clear()
             self.last_greeting_times.clear()
             self.logger.info("All cooldowns reset")
     
-    def get_greeting_status(self, person_name: str) -> dict:
+    def get_greeting_status(self, person_name: str) -> GreetingStatus:
         """Get greeting status information for a person.
         
         Args:
             person_name: Name of person to check
         
         Returns:
-            Dictionary with greeting status info
+            Greeting status for the person
         """
-        current_time = time.time()
-        
-        if person_name not in self.last_greeting_times:
-            return {
-                "person": person_name,
-                "last_greeted": None,
-                "can_greet": True,
-                "cooldown_remaining": 0,
-                "has_cached_audio": person_name in self.greeting_audio_cache
-            }
+        has_cached_audio = person_name in self.greeting_audio_cache
+        next_allowed = self._next_allowed.get(person_name)
+        if next_allowed is None:
+            return GreetingStatus(person_name, None, None, True, 0.0, has_cached_audio)
         
-        last_greeting_time = self.last_greeting_times[person_name]
-        time_elapsed = current_time - last_greeting_time
-        can_greet = time_elapsed >= self.cooldown_seconds
-        cooldown_remaining = max(0, self.cooldown_seconds - time_elapsed)
+        # One monotonic read gives both figures: the cooldown deadline was
+        # armed at greeting time + cooldown_seconds
+        until_allowed = next_allowed - time.monotonic()
+        cooldown_remaining = max(0.0, until_allowed)
         
-        return {
-            "person": person_name,
-            "last_greeted": last_greeting_time,
-            "time_since_greeting": time_elapsed,
-            "can_greet": can_greet,
-            "cooldown_remaining": cooldown_remaining,
-            "has_cached_audio": person_name in self.greeting_audio_cache
-        }
+        return GreetingStatus(
+            person_name,
+            self.last_greeting_times[person_name],
+            self.cooldown_seconds - until_allowed,
+            cooldown_remaining == 0,
+            cooldown_remaining,
+            has_cached_audio
+        )
     
-    def get_all_greeting_history(self) -> dict:
+    def get_all_greeting_history(self) -> Dict[str, GreetingStatus]:
         """Get greeting history for all people.
         
         Returns:
@@ -17,7 +17,8 @@ import logging
 import threading
 import time
 import random
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Optional, Callable
 from mistyPy.Robot import Robot
 
 
@@ -28,7 +29,8 @@ class PersonalityManager:
         self,
         misty: Robot,
         idle_timeout_seconds: float = 120.0,  # 2 minutes default
-        screensaver_enabled: bool = True
+        screensaver_enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic
     ):
         """Initialize the Personality Manager.
         
@@ -36,15 +38,18 @@ class PersonalityManager:
             misty: Robot instance
             idle_timeout_seconds: Seconds of inactivity before screensaver
             screensaver_enabled: Whether to enable screensaver mode
+            clock: Monotonic time source in seconds for idle tracking
+                (tests pass a fake clock to skip the idle wait)
         """
         self.misty = misty
         self.idle_timeout_seconds = idle_timeout_seconds
         self.screensaver_enabled = screensaver_enabled
+        self._clock = clock
         
         self.logger = logging.getLogger("PersonalityManager")
         
         # State tracking
-        self.last_interaction_time = time.time()
+        self.last_interaction_time = clock()
         self.in_screensaver = False
         self.screensaver_thread: Optional[threading.Thread] = None
         self.idle_monitor_thread: Optional[threading.Thread] = None
@@ -54,6 +59,10 @@ class PersonalityManager:
         self.on_enter_screensaver: Optional[callable] = None
         self.on_exit_screensaver: Optional[callable] = None
         
+        # Sends independent actuator commands (head, arms, eyes) in parallel
+        # over the robot session's pooled keep-alive connections
+        self._command_pool: Optional[ThreadPoolExecutor] = self._new_command_pool()
+        
         # Continuous speaking animation state
         self.speaking_animation_active = False
         self.speaking_animation_thread: Optional[threading.Thread] = None
@@ -89,7 +98,11 @@ class PersonalityManager:
             return
         
         self.running = True
-        self.last_interaction_time = time.time()
+        self.last_interaction_time = self._clock()
+        
+        # stop() shuts the command pool down; a restart needs a fresh one
+        if self._command_pool is None:
+            self._command_pool = self._new_command_pool()
         
         # Start idle monitoring thread
         if self.screensaver_enabled:
@@ -106,6 +119,11 @@ class PersonalityManager:
         if self.in_screensaver:
             self._exit_screensaver()
         
+        # Release the command threads without waiting on moves in flight
+        if self._command_pool is not None:
+            self._command_pool.shutdown(wait=False)
+            self._command_pool = None
+        
         if self.idle_monitor_thread and self.idle_monitor_thread.is_alive():
             self.idle_monitor_thread.join(timeout=1)
         
@@ -113,12 +131,38 @@ class PersonalityManager:
     
     def record_interaction(self):
         """Record that an interaction occurred (resets idle timer)."""
-        self.last_interaction_time = time.time()
+        self.last_interaction_time = self._clock()
         
         # If in screensaver, exit it
         if self.in_screensaver:
             self._exit_screensaver()
     
+    @staticmethod
+    def _new_command_pool() -> ThreadPoolExecutor:
+        """Create the pool that sends head, arm and eye commands in parallel."""
+        return ThreadPoolExecutor(max_workers=3, thread_name_prefix="personality-cmd")
+    
+    def _send_together(self, *commands: Callable[[], object]):
+        """Send independent robot commands concurrently and wait for all of them.
+        
+        Head, arm and eye commands drive different actuators, so issuing
+        them back to back only stacks up their HTTP round-trips. Sending them
+        together costs about one round-trip and they start moving in sync.
+        
+        Args:
+            *commands: Zero-argument callables, each issuing one REST command
+        
+        Raises:
+            The first exception raised by any command, after all have finished
+        """
+        pool = self._command_pool
+        if pool is None:
+            raise RuntimeError("Personality Manager is stopped")
+        futures = [pool.submit(command) for command in commands]
+        wait(futures)
+        for future in futures:
+            future.result()
+    
     def show_expression(self, expression: str = "default"):
         """Show an eye expression.
         
@@ -161,16 +205,16 @@ class PersonalityManager:
             pitch = random.randint(-5, 5)
             yaw = random.randint(-15, 15)
             
-            self.misty.move_head(pitch=pitch, roll=0, yaw=yaw, velocity=40, duration=0.6)
-            
             # Random arm gesture (one arm up slightly)
-            if random.choice([True, False]):
-                self.misty.move_arm(arm="left", position=random.randint(-20, 20), velocity=50)
-            else:
-                self.misty.move_arm(arm="right", position=random.randint(-20, 20), velocity=50)
+            arm = random.choice(["left", "right"])
+            position = random.randint(-20, 20)
             
-            # Happy/engaged expression
-            self.show_expression("joy")
+            # Head, arm and happy/engaged expression start together
+            self._send_together(
+                lambda: self.misty.move_head(pitch=pitch, roll=0, yaw=yaw, velocity=40, duration=0.6),
+                lambda: self.misty.move_arm(arm=arm, position=position, velocity=50),
+                lambda: self.show_expression("joy")
+            )
             
         except Exception as e:
             self.logger.warning(f"Failed to play speaking animation: {e}")
@@ -283,12 +327,12 @@ class PersonalityManager:
     def greeting_animation(self):
         """Animate Misty when greeting someone (wave, happy eyes)."""
         try:
-            # Happy eyes
-            self.show_expression("love")
-            
-            # Wave with right arm
-            self.misty.move_head(pitch=0, roll=0, yaw=0, velocity=50)
-            self.misty.move_arm(arm="right", position=70, velocity=80, duration=0.5)
+            # Happy eyes, head centred and wave with right arm
+            self._send_together(
+                lambda: self.show_expression("love"),
+                lambda: self.misty.move_head(pitch=0, roll=0, yaw=0, velocity=50),
+                lambda: self.misty.move_arm(arm="right", position=70, velocity=80, duration=0.5)
+            )
             time.sleep(0.6)
             self.misty.move_arm(arm="right", position=-70, velocity=80, duration=0.5)
             time.sleep(0.6)
@@ -300,28 +344,41 @@ class PersonalityManager:
     def reset_to_neutral(self):
         """Reset Misty to neutral pose."""
         try:
-            self.misty.move_head(pitch=0, roll=0, yaw=0, velocity=50)
-            self.misty.move_arms(
-                leftArmPosition=0, 
-                rightArmPosition=0, 
-                leftArmVelocity=50, 
-                rightArmVelocity=50
+            self._send_together(
+                lambda: self.misty.move_head(pitch=0, roll=0, yaw=0, velocity=50),
+                lambda: self.misty.move_arms(
+                    leftArmPosition=0, 
+                    rightArmPosition=0, 
+                    leftArmVelocity=50, 
+                    rightArmVelocity=50
+                ),
+                lambda: self.show_expression("default")
             )
-            self.show_expression("default")
             self.logger.debug("Reset to neutral pose")
         except Exception as e:
             self.logger.warning(f"Failed to reset to neutral: {e}")
     
+    def check_idle(self) -> bool:
+        """Enter screensaver mode if the idle timeout has passed.
+        
+        Called periodically by the idle monitor thread.
+        
+        Returns:
+            True if Misty is in screensaver mode after the check
+        """
+        time_since_interaction = self._clock() - self.last_interaction_time
+        
+        if not self.in_screensaver and time_since_interaction >= self.idle_timeout_seconds:
+            self.logger.info(f"⏰ Idle for {time_since_interaction:.0f}s - entering screensaver mode")
+            self._enter_screensaver()
+        
+        return self.in_screensaver
+    
     def _idle_monitor_loop(self):
         """Background thread to monitor for idle state."""
         while self.running:
             try:
-                time_since_interaction = time.time() - self.last_interaction_time
-                
-                # Check if we should enter screensaver
-                if not self.in_screensaver and time_since_interaction >= self.idle_timeout_seconds:
-                    self.logger.info(f"⏰ Idle for {time_since_interaction:.0f}s - entering screensaver mode")
-                    self._enter_screensaver()
+                self.check_idle()
                 
                 # Check every 5 seconds
                 time.sleep(5)
@@ -399,18 +456,24 @@ class PersonalityManager:
             # Happy expression
             self.show_expression("joy")
             
-            # Head shake left-right
-            self.misty.move_head(pitch=0, roll=0, yaw=-30, velocity=60, duration=0.5)
-            self.misty.move_arms(leftArmPosition=60, rightArmPosition=-60, duration=0.5)
+            # Head shake left-right, arms swinging in time
+            self._send_together(
+                lambda: self.misty.move_head(pitch=0, roll=0, yaw=-30, velocity=60, duration=0.5),
+                lambda: self.misty.move_arms(leftArmPosition=60, rightArmPosition=-60, duration=0.5)
+            )
             time.sleep(0.6)
             
-            self.misty.move_head(pitch=0, roll=0, yaw=30, velocity=60, duration=0.5)
-            self.misty.move_arms(leftArmPosition=-60, rightArmPosition=60, duration=0.5)
+            self._send_together(
+                lambda: self.misty.move_head(pitch=0, roll=0, yaw=30, velocity=60, duration=0.5),
+                lambda: self.misty.move_arms(leftArmPosition=-60, rightArmPosition=60, duration=0.5)
+            )
             time.sleep(0.6)
             
             # Back to center
-            self.misty.move_head(pitch=0, roll=0, yaw=0, velocity=60)
-            self.misty.move_arms(leftArmPosition=0, rightArmPosition=0, duration=0.5)
+            self._send_together(
+                lambda: self.misty.move_head(pitch=0, roll=0, yaw=0, velocity=60),
+                lambda: self.misty.move_arms(leftArmPosition=0, rightArmPosition=0, duration=0.5)
+            )
             
         except Exception as e:
             self.logger.debug(f"Dance move 1 error: {e}")
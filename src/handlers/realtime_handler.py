@@ -16,10 +16,20 @@ import threading
 import json
 import logging
 import io
+import math
+import wave
+import array
+import queue
 from typing import Optional, Callable
 import websocket
 from collections import deque
 
+# Try to use audioop for faster conversions when available and allowed
+try:
+    import audioop
+except Exception:
+    audioop = None
+
 
 class RealtimeHandler:
     """OpenAI Realtime API handler for voice-to-voice communication.
@@ -75,6 +85,14 @@ class RealtimeHandler:
         self.chunk_threshold_bytes = chunk_threshold_bytes  # 48000 = 1 second @ 24kHz PCM16
         self.chunk_counters = {}  # response_id -> chunk_index
         
+        # Chunk callbacks are dispatched from a dedicated thread so the WebSocket
+        # receive thread never blocks on WAV conversion or uploads.
+        # Items: (audio_bytes, is_final, chunk_index)
+        self._chunk_q: "queue.Queue[tuple]" = queue.Queue()
+        self._chunk_dispatcher: Optional[threading.Thread] = None
+        if self.on_audio_chunk_received:
+            self._start_chunk_dispatcher()
+        
         # Streaming configuration: how many milliseconds per chunk (smaller -> faster time-to-first-byte)
         # Default 100ms -> at 24kHz samples_per_ms = 24 -> 2400 samples -> 4800 bytes
         self.chunk_ms = int(chunk_ms)
@@ -137,7 +155,7 @@ class RealtimeHandler:
         
         # Configure the session for audio input/output
         # Pass system instructions if they were provided during init
-        self._configure_session(getattr(self, 'system_instructions', None))
+        self._configure_session(self.system_instructions)
 
     def _start_sender_thread(self):
         """Start background thread that drains the send queue."""
@@ -157,6 +175,27 @@ class RealtimeHandler:
         self.sender_thread = threading.Thread(target=_loop, daemon=True)
         self.sender_thread.start()
     
+    def _start_chunk_dispatcher(self):
+        """Start background thread that delivers queued audio chunks in order."""
+        if self._chunk_dispatcher and self._chunk_dispatcher.is_alive():
+            return
+        
+        def _loop():
+            self.logger.debug("Chunk dispatcher thread started")
+            while True:
+                chunk_bytes, is_final, chunk_index = self._chunk_q.get()
+                try:
+                    self.on_audio_chunk_received(chunk_bytes, is_final, chunk_index)
+                except Exception as e:
+                    self.logger.error(f"Error in audio chunk callback: {e}")
+        
+        self._chunk_dispatcher = threading.Thread(target=_loop, daemon=True)
+        self._chunk_dispatcher.start()
+    
+    def _emit_chunk(self, chunk_bytes: bytes, is_final: bool, chunk_index: int):
+        """Hand an audio chunk to the dispatcher thread (non-blocking)."""
+        self._chunk_q.put((chunk_bytes, is_final, chunk_index))
+    
     def _configure_session(self, system_instructions: str = None):
         """Configure the session for audio input/output.
         
@@ -236,7 +275,10 @@ class RealtimeHandler:
         Handles streaming audio and transcript deltas, assembling them
         into complete responses.
         """
-        self.logger.debug(f"🔔 _on_message called (len={len(str(message)) if message else 0})")
+        # Called once per streamed delta: only build debug strings when they will be emitted
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug(f"🔔 _on_message called (len={len(str(message)) if message else 0})")
         
         if message is None:
             self.logger.warning("⚠️ Received None message in _on_message")
@@ -244,7 +286,8 @@ class RealtimeHandler:
         
         try:
             data = json.loads(message)
-            self.logger.debug(f"✅ Parsed JSON successfully")
+            if debug:
+                self.logger.debug("✅ Parsed JSON successfully")
         except Exception as e:
             self.logger.warning(f"❌ Received non-JSON message: {str(message)[:100]}")
             return
@@ -252,8 +295,9 @@ class RealtimeHandler:
         event_type = data.get("type")
         
         # Debug: Log ALL event types to see what we're receiving
-        self.logger.info(f"📨 Received event type: {event_type}")
-        self.logger.debug(f"   Full event: {json.dumps(data, indent=2)[:500]}")
+        if debug:
+            self.logger.debug(f"📨 Received event type: {event_type}")
+            self.logger.debug(f"   Full event: {json.dumps(data, indent=2)[:500]}")
 
         # Handle rate limit events specifically
         if event_type == "rate_limits.updated":
@@ -355,7 +399,8 @@ class RealtimeHandler:
                 
                 self.audio_buffers[resp_id].extend(chunk)
                 
-                self.logger.debug(f"Audio delta: {len(chunk)} bytes (total: {len(self.audio_buffers[resp_id])})")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Audio delta: {len(chunk)} bytes (total: {len(self.audio_buffers[resp_id])})")
                 
                 # Check if we've reached chunk threshold
                 if self.on_audio_chunk_received and len(self.audio_buffers[resp_id]) >= self.chunk_threshold_bytes:
@@ -365,10 +410,7 @@ class RealtimeHandler:
                     
                     self.logger.info(f"🎵 Audio chunk {chunk_index} ready: {len(chunk_bytes)} bytes")
                     
-                    try:
-                        self.on_audio_chunk_received(chunk_bytes, False, chunk_index)
-                    except Exception as e:
-                        self.logger.error(f"Error in audio chunk callback: {e}")
+                    self._emit_chunk(chunk_bytes, False, chunk_index)
                     
                     # Reset buffer for next chunk
                     self.audio_buffers[resp_id] = bytearray()
@@ -454,10 +496,7 @@ class RealtimeHandler:
             if audio_bytes:
                 chunk_index = self.chunk_counters.get(resp_id, 0)
                 self.logger.info(f"🎵 Final audio chunk {chunk_index}: {len(audio_bytes)} bytes")
-                try:
-                    self.on_audio_chunk_received(audio_bytes, True, chunk_index)
-                except Exception as e:
-                    self.logger.error(f"Error in final audio chunk callback: {e}")
+                self._emit_chunk(audio_bytes, True, chunk_index)
             else:
                 # No remaining audio, but still signal completion
                 self.logger.info(f"🎵 Response complete, no final chunk needed")
@@ -480,14 +519,6 @@ class RealtimeHandler:
         - If stereo: average channels
         - If sample rate != 24kHz: naive linear resample (good enough for speech)
         """
-        import wave
-        import array
-        # Try to use audioop for faster conversions when available and allowed
-        try:
-            import audioop
-        except Exception:
-            audioop = None
-        
         f = wave.open(io.BytesIO(wav_bytes), 'rb')
         channels = f.getnchannels()
         sampwidth = f.getsampwidth()
@@ -498,6 +529,10 @@ class RealtimeHandler:
         
         self.logger.debug(f"WAV info: {channels}ch, {sampwidth*8}bit, {sr}Hz, {n} frames")
         
+        # Already PCM16 mono at the API rate: nothing to convert
+        if sampwidth == 2 and channels == 1 and sr == 24000:
+            return raw
+        
         # Fast path using audioop when available and requested
         if self.use_audioop and audioop is not None:
             try:
@@ -553,7 +588,6 @@ class RealtimeHandler:
         # Resample to 24kHz using linear interpolation if needed
         target_sr = 24000
         if sr != target_sr and len(mono) > 1:
-            import math
             ratio = target_sr / float(sr)
             out_len = int(math.floor(len(mono) * ratio))
             resampled = array.array('h')
@@ -4,11 +4,15 @@ Handles audio transcription using OpenAI Whisper API.
 """
 
 import logging
-import base64
 import io
+import time
 from typing import Optional
 from openai import OpenAI
 from mistyPy.Robot import Robot
+from src.utils.audio_utils import decode_audio_file_response, has_speech, trim_trailing_silence, wav_header_16k
+
+# Half a second of 16kHz PCM16 silence (Whisper rejects clips under 0.1s)
+_WARMUP_PCM_BYTES = 16000
 
 
 class SpeechToTextHandler:
@@ -62,6 +66,10 @@ class SpeechToTextHandler:
                 self.logger.error("Failed to retrieve audio from Misty")
                 return None
             
+            if not has_speech(audio_data):
+                self.logger.info("🔇 Recording is silent - skipping Whisper")
+                return None
+            
             # Step 2: Send to OpenAI Whisper for transcription
             self.logger.debug(f"Sending audio to OpenAI Whisper ({self.whisper_model})...")
             transcription = self._transcribe_with_whisper(audio_data, language)
@@ -95,27 +103,21 @@ class SpeechToTextHandler:
                 self.logger.error(f"Response: {response.text}")
                 return None
             
-            # Parse response
-            data = response.json()
-            
-            if not data.get("result"):
-                self.logger.error("No result in audio file response")
-                return None
-            
-            result = data["result"]
-            
-            # Get base64 encoded audio
-            base64_audio = result.get("base64", None)
+            # Extract and decode the base64 audio
+            audio_bytes = decode_audio_file_response(response)
             
-            if not base64_audio:
+            if not audio_bytes:
                 self.logger.error("No base64 audio data in response")
                 return None
             
-            # Decode base64 to bytes
-            audio_bytes = base64.b64decode(base64_audio)
             self.logger.info(f"✅ Retrieved audio file: {len(audio_bytes)} bytes")
             
-            return audio_bytes
+            # The capture ends with Misty's full silence timeout; don't upload it
+            trimmed = trim_trailing_silence(audio_bytes)
+            if len(trimmed) < len(audio_bytes):
+                self.logger.debug(f"Trimmed trailing silence: {len(audio_bytes)} -> {len(trimmed)} bytes")
+            
+            return trimmed
             
         except Exception as e:
             self.logger.error(f"Error retrieving audio from Misty: {e}", exc_info=True)
@@ -161,24 +163,69 @@ class SpeechToTextHandler:
             self.logger.error(f"Error calling Whisper API: {e}", exc_info=True)
             return None
     
-    def transcribe_with_retry(self, audio_filename: str, max_retries: int = 2) -> Optional[str]:
+    def warm_up(self) -> bool:
+        """Open the Whisper API connection before the first real transcription.
+        
+        Transcribes a short clip of silence so the TLS handshake and HTTP
+        connection pool setup are paid at startup rather than on the first
+        visitor question. Safe to run on a background thread.
+        
+        Returns:
+            True if the warm-up request succeeded
+        """
+        try:
+            start = time.time()
+            audio_file = io.BytesIO(wav_header_16k(_WARMUP_PCM_BYTES) + bytes(_WARMUP_PCM_BYTES))
+            audio_file.name = "warmup.wav"
+            self.client.audio.transcriptions.create(
+                model=self.whisper_model,
+                file=audio_file,
+                response_format="text"
+            )
+            self.logger.info(f"🔥 Whisper connection warmed in {time.time() - start:.2f}s")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Whisper warm-up failed: {e}")
+            return False
+    
+    def transcribe_with_retry(self, audio_filename: str, max_retries: int = 2,
+                              language: str = "en") -> Optional[str]:
         """Transcribe audio with retry logic.
         
+        The recording is downloaded from Misty once and reused across
+        attempts; only the Whisper call (or a failed download) is retried.
+        
         Args:
             audio_filename: Name of the audio file stored on Misty
             max_retries: Maximum number of retry attempts (default: 2)
+            language: Language code for transcription (default: "en")
         
         Returns:
             Transcribed text, or None if all attempts failed
         """
+        self.logger.info(f"📝 Starting transcription for: {audio_filename}")
+        audio_data = None
+        
         for attempt in range(max_retries + 1):
             if attempt > 0:
                 self.logger.info(f"Retry attempt {attempt}/{max_retries}...")
             
-            result = self.transcribe_audio(audio_filename)
+            if audio_data is None:
+                audio_data = self._get_audio_from_misty(audio_filename)
+                # A silent capture (e.g. a false wake word) won't transcribe
+                # on any attempt; don't spend Whisper calls on it
+                if audio_data is not None and not has_speech(audio_data):
+                    self.logger.info("🔇 Recording is silent - skipping Whisper")
+                    return None
             
-            if result:
-                return result
+            if audio_data is None:
+                self.logger.error("Failed to retrieve audio from Misty")
+            else:
+                self.logger.debug(f"Sending audio to OpenAI Whisper ({self.whisper_model})...")
+                result = self._transcribe_with_whisper(audio_data, language)
+                if result:
+                    self.logger.info(f"✅ Transcription successful: '{result}'")
+                    return result
             
             if attempt < max_retries:
                 self.logger.warning(f"Transcription failed, retrying...")
@@ -16,27 +16,101 @@ Date: October 2, 2025
 """
 
 import os
+import re
 import sys
+import atexit
+import base64
+import queue
+import random
+import hashlib
+import mmap
 import signal
 import logging
 import threading
 import time
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-# Add project root to path for mistyPy access
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+# Add project root to path for mistyPy access, unless the caller (or an
+# editable install) already put it there
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
 
 from mistyPy.Robot import Robot
 from mistyPy.Events import Events
 from src.config import get_config, Config
-from src.core.face_recognition_manager import FaceRecognitionManager
+from src.core.face_recognition_manager import FaceEvent, FaceRecognitionManager
 from src.core.greeting_manager import GreetingManager
 from src.core.audio_monitor import AudioMonitor
 from src.handlers.speech_to_text import SpeechToTextHandler
 from src.core.ai_chat_handler import AIChatHandler
 from src.handlers.realtime_handler import RealtimeHandler
 from src.core.personality_manager import PersonalityManager
-from src.prompts import UNO_BSAI_SYSTEM_PROMPT
+from src.prompts import count_prompt_tokens, get_uno_bsai_system_prompt, prompt_digest
+from src.utils.deadline_timer import DeadlineTimer
+from src.utils.audio_utils import WAV_HEADER_SIZE, decode_audio_file_response, pcm16_24k_to_wav_16k
+
+# Temporary audio filenames on Misty cycle through this many slots, so
+# remote storage stays bounded even if a cleanup is missed
+TEMP_AUDIO_FILE_SLOTS = 1024
+
+# Recently uploaded single-file realtime responses kept for reuse
+REALTIME_AUDIO_CACHE_SIZE = 16
+
+# Longest a queued chunk waits for its background upload before being skipped
+UPLOAD_WAIT_TIMEOUT = 10.0
+
+# Fallback for resuming listening after a greeting whose AudioPlayComplete
+# never arrives (TTS greetings, missed events)
+GREETING_RESUME_TIMEOUT = 5.0
+
+# Longest to wait for queued LED changes before another module takes the LED
+LED_DRAIN_TIMEOUT = 2.0
+
+# Common ending phrases that indicate the user wants to end the conversation
+ENDING_PHRASES = (
+    "thank you",
+    "thanks",
+    "thank you very much",
+    "thanks a lot",
+    "that's all",
+    "that's it",
+    "that'll be all",
+    "goodbye",
+    "good bye",
+    "bye",
+    "see you",
+    "see ya",
+    "have a good day",
+    "have a nice day",
+    "okay bye",
+    "ok bye",
+    "that's all i need",
+    "that's all i needed",
+    "nothing else",
+    "no more questions",
+    "i'm done",
+    "i'm good",
+    "that helps",
+    "that's helpful",
+    "got it thanks",
+    "okay thanks",
+    "ok thanks",
+    "alright thanks",
+    "perfect thanks",
+    "great thanks",
+)
+
+# Single compiled matcher for all ending phrases (longest first so the
+# most specific phrase is the one reported); case-insensitive so raw
+# transcripts can be searched without building a lowercased copy
+_ENDING_PHRASE_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(p) for p in sorted(ENDING_PHRASES, key=len, reverse=True)) + r")\b",
+    re.IGNORECASE
+)
 
 
 class AudioQueueManager:
@@ -51,7 +125,8 @@ class AudioQueueManager:
     - Handling AudioPlayComplete events to trigger next chunk
     """
     
-    def __init__(self, misty, logger, config, on_response_complete=None, personality_manager=None):
+    def __init__(self, misty, logger, config, on_response_complete=None, personality_manager=None,
+                 executor: Optional[ThreadPoolExecutor] = None, set_led=None):
         """Initialize the AudioQueueManager.
         
         Args:
@@ -60,11 +135,17 @@ class AudioQueueManager:
             config: Configuration object
             on_response_complete: Optional callback when response is complete
             personality_manager: Optional PersonalityManager for animations
+            executor: Optional shared thread pool for background uploads/deletes
+            set_led: Optional callable taking an (r, g, b) tuple; the assistant
+                passes its ordered LED setter so colors never overtake each other
         """
         self.misty = misty
         self.logger = logger
         self.config = config
         self.personality_manager = personality_manager
+        self.executor = executor
+        self._led_idle = tuple(config.led.idle)
+        self._set_led = set_led or (lambda rgb: misty.change_led(*rgb))
         
         # Queue of chunks ready to play: [(filename, wav_data, is_final), ...]
         self.play_queue = []
@@ -72,7 +153,7 @@ class AudioQueueManager:
         
         # Current playback state
         self.currently_playing = None  # (filename, is_final)
-        self.currently_uploading = False  # Track if upload is in progress
+        self.pending_uploads = {}  # filename -> Event set once its eager upload finishes
         self.is_processing = False
         self.fallback_timer = None  # Timer for fallback playback completion
         self.animations_started = False  # Track if we started continuous animations
@@ -84,9 +165,17 @@ class AudioQueueManager:
         
         # File cleanup tracking
         self.uploaded_files = []  # Track files for cleanup
+        self._file_counter = 0  # Source of unique chunk filenames
         # Optional callback invoked when a full response playback is complete
         self.on_response_complete = on_response_complete
         
+    def _submit(self, fn, *args):
+        """Run a background job on the shared pool (or a daemon thread if none)."""
+        if self.executor is not None:
+            self.executor.submit(fn, *args)
+        else:
+            threading.Thread(target=fn, args=args, daemon=True).start()
+    
     def add_chunk(self, audio_bytes: bytes, is_final: bool, chunk_index: int):
         """Add audio chunk to queue and start processing if idle.
         
@@ -95,25 +184,34 @@ class AudioQueueManager:
             is_final: Whether this is the last chunk
             chunk_index: Index of this chunk
         """
-        import uuid
-        
-        self.logger.info(f"📥 Received chunk {chunk_index}: {len(audio_bytes)} bytes (final={is_final})")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"📥 Received chunk {chunk_index}: {len(audio_bytes)} bytes (final={is_final})")
         self.chunks_received += 1
         
         try:
             # Generate unique filename
-            filename = f"chunk_{uuid.uuid4().hex[:8]}_{chunk_index}.wav"
+            self._file_counter = (self._file_counter + 1) % TEMP_AUDIO_FILE_SLOTS
+            filename = f"chunk_{self._file_counter}_{chunk_index}.wav"
             
             # Process audio (convert to WAV, downsample)
             wav_data = self._prepare_audio(audio_bytes)
             
-            # Add to queue
+            # Add to queue. While a response is already playing, start uploading
+            # this chunk right away so it is on Misty before its turn comes up
             with self.lock:
                 self.play_queue.append((filename, wav_data, is_final))
                 queue_size = len(self.play_queue)
+                pre_upload = self.is_processing and self.config.voice_assistant.parallel_upload_enabled
+                if pre_upload:
+                    upload_done = threading.Event()
+                    self.pending_uploads[filename] = upload_done
             
             self.logger.info(f"📋 Chunk {chunk_index} queued as {filename} (queue size: {queue_size})")
             
+            if pre_upload:
+                self.logger.info(f"🚀 Pre-uploading next chunk: {filename} (while playing)")
+                self._submit(self._pre_upload_chunk, filename, wav_data, upload_done)
+            
             # Start processing if idle
             if not self.is_processing:
                 self._process_next()
@@ -133,67 +231,14 @@ class AudioQueueManager:
         Returns:
             WAV format audio at 16kHz
         """
-        import array
-        import struct
-        
         # Downsample from 24kHz to 16kHz for faster upload
-        original_sample_rate = 24000
-        target_sample_rate = 16000
-        num_channels = 1
-        bits_per_sample = 16
-        
-        # Convert bytes to samples
-        samples_24k = array.array('h')
-        samples_24k.frombytes(audio_bytes)
-        
-        # Downsample using linear interpolation
-        ratio = target_sample_rate / original_sample_rate  # 0.6667
-        out_len = int(len(samples_24k) * ratio)
-        samples_16k = array.array('h', [0] * out_len)
-        
-        for i in range(out_len):
-            src_pos = i / ratio
-            j = int(src_pos)
-            frac = src_pos - j
-            if j + 1 < len(samples_24k):
-                a = samples_24k[j]
-                b = samples_24k[j + 1]
-                val = int(a + (b - a) * frac)
-            else:
-                val = samples_24k[j] if j < len(samples_24k) else 0
-            samples_16k[i] = max(-32768, min(32767, val))
-        
-        downsampled_bytes = samples_16k.tobytes()
-        data_size = len(downsampled_bytes)
-        
-        # Create WAV header
-        byte_rate = target_sample_rate * num_channels * bits_per_sample // 8
-        block_align = num_channels * bits_per_sample // 8
-        
-        wav_header = struct.pack('<4sI4s4sIHHIIHH4sI',
-            b'RIFF',
-            36 + data_size,
-            b'WAVE',
-            b'fmt ',
-            16,  # fmt chunk size
-            1,   # PCM format
-            num_channels,
-            target_sample_rate,
-            byte_rate,
-            block_align,
-            bits_per_sample,
-            b'data',
-            data_size
-        )
-        
-        return wav_header + downsampled_bytes
+        return pcm16_24k_to_wav_16k(audio_bytes)
     
     def _process_next(self):
-        """Process next chunk from queue.
+        """Start playback of the first chunk if nothing is playing yet.
         
-        This method now implements parallel processing:
-        - If not currently playing: upload and play first chunk
-        - If currently playing: pre-upload next chunk in background
+        Later chunks are uploaded as soon as they arrive (see add_chunk) and
+        played from on_playback_complete, so this is a no-op while playing.
         """
         with self.lock:
             if not self.play_queue:
@@ -201,20 +246,6 @@ class AudioQueueManager:
                 return
             
             if self.currently_playing:
-                # Already playing - check if we should pre-upload next chunk (if parallel upload enabled)
-                if self.config.voice_assistant.parallel_upload_enabled:
-                    if not self.currently_uploading and len(self.play_queue) > 0:
-                        # Pre-upload next chunk while current one plays
-                        filename, wav_data, is_final = self.play_queue[0]  # Peek, don't pop yet
-                        self.currently_uploading = True
-                        self.logger.info(f"🚀 Pre-uploading next chunk: {filename} (while playing)")
-                        
-                        # Upload in background thread
-                        threading.Thread(
-                            target=self._pre_upload_chunk,
-                            args=(filename, wav_data, is_final),
-                            daemon=True
-                        ).start()
                 return
             
             # Not currently playing - start first chunk
@@ -224,54 +255,62 @@ class AudioQueueManager:
         
         self.logger.info(f"⚙️  Processing first chunk: {filename} (final={is_final})")
         
-        # Upload and play in background thread
-        threading.Thread(
-            target=self._upload_and_play,
-            args=(filename, wav_data, is_final),
-            daemon=True
-        ).start()
+        # Upload and play in background
+        self._submit(self._upload_and_play, filename, wav_data, is_final)
     
-    def _pre_upload_chunk(self, filename: str, wav_data: bytes, is_final: bool):
-        """Pre-upload next chunk while current chunk is playing.
+    def _upload_chunk(self, filename: str, wav_data: bytes, label: str = "") -> bool:
+        """Upload a WAV chunk to Misty.
         
         Args:
             filename: Name for the audio file on Misty
             wav_data: WAV format audio data
-            is_final: Whether this is the last chunk
+            label: Optional prefix for log messages (e.g. "first chunk ")
+            
+        Returns:
+            True if the upload succeeded, False otherwise
         """
-        import base64
+        upload_start = time.time()
         
-        try:
-            upload_start = time.time()
+        if self.logger.isEnabledFor(logging.INFO):
             file_size_mb = len(wav_data) / (1024 * 1024)
-            
-            self.logger.info(f"📤 Pre-uploading {filename}: {file_size_mb:.2f} MB")
-            
-            # Encode to base64
-            b64_data = base64.b64encode(wav_data).decode('utf-8')
-            
-            # Upload with extended timeout
-            upload_response = self.misty.save_audio(
-                fileName=filename,
-                data=b64_data,
-                immediatelyApply=False,
-                overwriteExisting=True
-            )
-            
-            upload_duration = time.time() - upload_start
-            
-            if upload_response.status_code == 200:
-                self.logger.info(f"✅ Pre-uploaded {filename} in {upload_duration:.2f}s (ready to play!)")
-                self.chunks_uploaded += 1
-                self.uploaded_files.append(filename)  # Track for cleanup
-            else:
-                self.logger.error(f"❌ Pre-upload failed: {upload_response.status_code}")
-                
+            self.logger.info(f"📤 Uploading {label}{filename}: {file_size_mb:.2f} MB")
+        
+        # Encode to base64
+        b64_data = base64.b64encode(wav_data).decode('ascii')
+        
+        # Upload with extended timeout
+        upload_response = self.misty.save_audio(
+            fileName=filename,
+            data=b64_data,
+            immediatelyApply=False,
+            overwriteExisting=True
+        )
+        
+        upload_duration = time.time() - upload_start
+        
+        if upload_response.status_code == 200:
+            self.logger.info(f"✅ Uploaded {label}{filename} in {upload_duration:.2f}s")
+            self.chunks_uploaded += 1
+            self.uploaded_files.append(filename)  # Track for cleanup
+            return True
+        
+        self.logger.error(f"❌ Upload of {filename} failed: {upload_response.status_code}")
+        return False
+    
+    def _pre_upload_chunk(self, filename: str, wav_data: bytes, done: threading.Event):
+        """Pre-upload a queued chunk while an earlier chunk is playing.
+        
+        Args:
+            filename: Name for the audio file on Misty
+            wav_data: WAV format audio data
+            done: Event set when the upload attempt finishes (success or not)
+        """
+        try:
+            self._upload_chunk(filename, wav_data, "next chunk ")
         except Exception as e:
             self.logger.error(f"❌ Error pre-uploading chunk: {e}", exc_info=True)
         finally:
-            with self.lock:
-                self.currently_uploading = False
+            done.set()
     
     def _upload_and_play(self, filename: str, wav_data: bytes, is_final: bool):
         """Upload audio chunk to Misty and play it (for first chunk only).
@@ -281,40 +320,11 @@ class AudioQueueManager:
             wav_data: WAV format audio data
             is_final: Whether this is the last chunk
         """
-        import base64
-        
         try:
-            # Upload to Misty
-            upload_start = time.time()
-            file_size_mb = len(wav_data) / (1024 * 1024)
-            
-            self.logger.info(f"📤 Uploading first chunk {filename}: {file_size_mb:.2f} MB")
-            
-            # Encode to base64
-            b64_data = base64.b64encode(wav_data).decode('utf-8')
-            
-            # Upload with extended timeout
-            upload_response = self.misty.save_audio(
-                fileName=filename,
-                data=b64_data,
-                immediatelyApply=False,
-                overwriteExisting=True
-            )
-            
-            upload_duration = time.time() - upload_start
-            
-            if upload_response.status_code == 200:
-                self.logger.info(f"✅ Uploaded first chunk {filename} in {upload_duration:.2f}s")
-                self.chunks_uploaded += 1
-                self.uploaded_files.append(filename)  # Track for cleanup
-                
+            if self._upload_chunk(filename, wav_data, "first chunk "):
                 # Play the chunk (pass wav_data for duration calculation)
                 self._play_chunk(filename, is_final, wav_data)
-                
-                # Start pre-uploading next chunk if available
-                self._process_next()
             else:
-                self.logger.error(f"❌ Upload failed: {upload_response.status_code}")
                 # Skip this chunk and continue with next
                 self._on_chunk_error(is_final)
                 
@@ -338,6 +348,7 @@ class AudioQueueManager:
             if play_response.status_code == 200:
                 self.logger.info(f"✅ Playback started for {filename}")
                 self.chunks_played += 1
+                debug = self.logger.isEnabledFor(logging.DEBUG)
                 
                 # Start continuous speaking animations on first chunk (non-blocking, parallel)
                 if not self.animations_started and self.personality_manager:
@@ -355,7 +366,8 @@ class AudioQueueManager:
                     audio_data_size = len(wav_data) - 44  # Subtract WAV header
                     duration_seconds = audio_data_size / (16000 * 2)  # 16kHz * 2 bytes per sample
                     fallback_duration = duration_seconds + 0.1  # Add minimal 200ms buffer
-                    self.logger.debug(f"⏱️  Calculated duration: {duration_seconds:.2f}s, fallback: {fallback_duration:.2f}s")
+                    if debug:
+                        self.logger.debug(f"⏱️  Calculated duration: {duration_seconds:.2f}s, fallback: {fallback_duration:.2f}s")
                 else:
                     # Fallback to default if wav_data not available
                     fallback_duration = 6.1  # 6s audio + 0.1s buffer
@@ -369,7 +381,8 @@ class AudioQueueManager:
                 self.fallback_timer.daemon = True
                 self.fallback_timer.start()
                 
-                self.logger.debug(f"⏱️  Set fallback timer: {fallback_duration:.2f}s")
+                if debug:
+                    self.logger.debug(f"⏱️  Set fallback timer: {fallback_duration:.2f}s")
             else:
                 self.logger.error(f"❌ Playback failed: {play_response.status_code}")
                 self._on_chunk_error(is_final)
@@ -393,9 +406,9 @@ class AudioQueueManager:
             self.is_processing = False
             self._complete_response()
         else:
-            # Try next chunk
+            # Try next chunk (it may already be uploaded)
             self.logger.info("⏭️  Skipping failed chunk, processing next...")
-            self._process_next()
+            self._play_next_chunk()
     
     def on_playback_complete(self):
         """Called when AudioPlayComplete event fires OR fallback timer triggers.
@@ -419,9 +432,7 @@ class AudioQueueManager:
         self.logger.info(f"✅ Playback complete: {filename}")
         
         # Delete the played file from Misty to free up space (in background to avoid blocking)
-        # Use threading to prevent blocking the next playback
-        import threading
-        threading.Thread(target=self._delete_file, args=(filename,), daemon=True).start()
+        self._submit(self._delete_file, filename)
         
         if was_final:
             # Final chunk played successfully
@@ -448,13 +459,27 @@ class AudioQueueManager:
             # Pop the next chunk (should already be uploaded!)
             filename, wav_data, is_final = self.play_queue.pop(0)
             self.currently_playing = (filename, is_final)
+            upload_done = self.pending_uploads.pop(filename, None)
+        
+        if upload_done is None:
+            # Chunk arrived without a pre-upload (parallel upload disabled)
+            try:
+                uploaded = self._upload_chunk(filename, wav_data)
+            except Exception as e:
+                self.logger.error(f"❌ Error uploading chunk: {e}", exc_info=True)
+                uploaded = False
+        else:
+            # Usually already set; only blocks if playback outran the upload
+            upload_done.wait(timeout=UPLOAD_WAIT_TIMEOUT)
+            uploaded = filename in self.uploaded_files
+        
+        if not uploaded:
+            self._on_chunk_error(is_final)
+            return
         
         # Play immediately (already uploaded!) - pass wav_data for duration calculation
         self.logger.info(f"🎬 Playing pre-uploaded chunk: {filename}")
         self._play_chunk(filename, is_final, wav_data)
-        
-        # Start pre-uploading the NEXT chunk while this one plays
-        self._process_next()
     
     def _complete_response(self):
         """Complete the response and return to idle state."""
@@ -474,7 +499,7 @@ class AudioQueueManager:
         
         # Return LED to idle state (green)
         try:
-            self.misty.change_led(*self.config.led.idle)
+            self._set_led(self._led_idle)
             self.logger.info("💚 Returned to idle state")
         except Exception as e:
             self.logger.error(f"Failed to change LED: {e}")
@@ -485,7 +510,7 @@ class AudioQueueManager:
         self.chunks_uploaded = 0
         # Notify assistant that response finished so it can restart listening
         try:
-            if getattr(self, "on_response_complete", None):
+            if self.on_response_complete:
                 self.logger.info("📞 Calling on_response_complete callback to resume assistant state...")
                 self.on_response_complete()
                 self.logger.info("✅ on_response_complete callback completed")
@@ -496,6 +521,7 @@ class AudioQueueManager:
         """Clear the queue and reset state."""
         with self.lock:
             self.play_queue.clear()
+            self.pending_uploads.clear()
             self.currently_playing = None
             self.is_processing = False
         
@@ -573,9 +599,35 @@ class MistyAiccoAssistant:
         """
         self.config = config
         self.logger = self._setup_logging()
+        
+        # Bind config values read in per-event callbacks once
+        self._led_idle = tuple(config.led.idle)
+        self._led_listening = tuple(config.led.listening)
+        self._led_processing = tuple(config.led.processing)
+        self._led_speaking = tuple(config.led.speaking)
+        self._voice_mode = config.voice_assistant.voice_mode
+        self._anim_during_speech = config.personality.animations_during_speech
+        
+        # Voice mode -> speech pipeline, filled in by _initialize_voice_assistant()
+        self._mode_handlers = {}
+        
+        # Source of unique filenames for single-file realtime responses
+        self._resp_counter = 0
+        # Source of unique utterance IDs for streamed responses
+        self._stream_counter = 0
+        # Recently uploaded responses: PCM digest -> filename on Misty (LRU)
+        self._audio_upload_cache: "OrderedDict[bytes, str]" = OrderedDict()
         self.misty: Optional[Robot] = None
         self.running = False
         
+        # Shared pool for short background jobs (uploads, resumes, deferred calls)
+        # instead of spawning a new thread per event
+        self._bg = ThreadPoolExecutor(max_workers=4, thread_name_prefix="assistant-bg")
+        # LED changes go through their own single worker: the request overlaps
+        # the next pipeline step instead of blocking it, and one worker keeps
+        # the colors in the order they were requested
+        self._led_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="assistant-led")
+        
         self.logger.info("Initializing Misty Aicco Assistant...")
         
         # Modules will be initialized in later tasks
@@ -599,27 +651,52 @@ class MistyAiccoAssistant:
         
         # Photo display settings
         self.photo_display_duration = 3.0  # How long to show photo (seconds)
-        self.current_photo_timer = None    # Track current photo timer
+        # Restoring the default eyes after a photo is disabled, so the photo
+        # stays up through long greetings. To enable it, create
+        # DeadlineTimer(self._return_to_default_eyes, name="photo-restore-timer")
+        # here; re-arming on each display coalesces bursts
+        self.photo_restore_timer: Optional[DeadlineTimer] = None
         
         # Track uploaded photos to avoid re-uploading
         self.uploaded_photos = {}  # person_name -> misty_filename
+        # Per-person upload locks: parallel preload and recognition-triggered
+        # display can race to upload the same photo
+        self._photo_locks = {name: threading.Lock() for name in self.person_photos}
+        # Sanitised on-robot filename per person, computed once
+        self._misty_filenames = {name: self._misty_photo_filename(name) for name in self.person_photos}
         
         # Conversation mode state
         self.conversation_active = False
-        self.conversation_timer: Optional[threading.Timer] = None
+        self.conversation_timer = DeadlineTimer(self._on_conversation_timeout, name="conversation-timer")
         self.speaking_lock = False
         
+        # Last LED color we set, so repeated transitions skip the HTTP call
+        self._current_led: Optional[tuple] = None
+        self._change_led = None  # Bound to misty.change_led once connected
+        
+        # Greeting playback tracking: the AudioPlayComplete handler resumes
+        # listening when the greeting audio actually finishes; the timer is
+        # the fallback for TTS greetings and missed events
+        self._greeting_pending = False
+        self._greeting_lock = threading.Lock()
+        self.greeting_resume_timer = DeadlineTimer(self._resume_after_greeting, name="greeting-resume-timer")
+        
         # Battery saving state
         self.services_stopped = False
         
     def _setup_logging(self) -> logging.Logger:
         """Set up logging configuration.
         
+        Records are handed to a background listener thread that does the
+        console and file I/O, so Misty event callbacks only pay for a queue
+        put when they log.
+        
         Returns:
             Configured logger instance
         """
         logger = logging.getLogger("MistyAiccoAssistant")
         logger.setLevel(getattr(logging, self.config.logging.level))
+        handlers = []
         
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
@@ -629,7 +706,7 @@ class MistyAiccoAssistant:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
         
         # File handler (if enabled)
         if self.config.logging.log_to_file:
@@ -645,7 +722,14 @@ class MistyAiccoAssistant:
                 datefmt='%Y-%m-%d %H:%M:%S'
             )
             file_handler.setFormatter(file_formatter)
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
+        
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        # Drain anything still queued when the process exits
+        atexit.register(listener.stop)
         
         return logger
     
@@ -665,11 +749,15 @@ class MistyAiccoAssistant:
             # Connect to Misty
             self.logger.info(f"Connecting to Misty at {self.config.misty.ip_address}...")
             self.misty = Robot(self.config.misty.ip_address)
+            self._change_led = self.misty.change_led
             self.logger.info("Connected to Misty successfully!")
             
             # Set initial LED state (idle)
             self.logger.info("Setting initial LED state...")
-            self.misty.change_led(*self.config.led.idle)
+            self._set_led(self._led_idle)
+            
+            # Single AudioPlayComplete listener shared by greetings and chunked playback
+            self._register_audio_play_complete()
             
             # Initialize personality manager (animations, screensaver)
             if self.config.personality.enabled:
@@ -685,6 +773,9 @@ class MistyAiccoAssistant:
             # TODO: Initialize remaining modules (will be implemented in later tasks)
             # self._initialize_state_manager()
             
+            # Pay first-request connection costs now rather than on turn 1
+            self.warmup()
+            
             self.running = True
             self.logger.info("Misty Aicco Assistant is now running!")
             self.logger.info("Press Ctrl+C to stop.")
@@ -700,6 +791,20 @@ class MistyAiccoAssistant:
             self.stop()
             raise
     
+    def warmup(self):
+        """Prime the network paths used by the first conversation turn.
+        
+        Runs in the background pool, concurrently: a silent Whisper
+        transcription to open the STT connection, and a cached-prefix chat
+        request to open the chat connection and prefill the provider prompt
+        cache. The Misty session is already warm from the initial LED call
+        in start(). Handlers that are not initialized are skipped.
+        """
+        if self.speech_to_text is not None:
+            self._bg.submit(self.speech_to_text.warm_up)
+        if self.ai_chat is not None:
+            self._bg.submit(self.ai_chat.warm_prompt_cache)
+    
     def stop(self):
         """Stop the Misty Aicco Assistant gracefully.
         
@@ -740,7 +845,16 @@ class MistyAiccoAssistant:
                 self.misty.unregister_all_events()
                 
                 # Set LED to indicate shutdown
-                self.misty.change_led(255, 255, 0)  # Yellow
+                self._set_led((255, 255, 0))  # Yellow
+            
+            # Stop accepting background jobs
+            self.conversation_timer.close()
+            if self.photo_restore_timer:
+                self.photo_restore_timer.close()
+            self.greeting_resume_timer.close()
+            self._bg.shutdown(wait=False)
+            # Let the shutdown color reach the robot before exiting
+            self._led_worker.shutdown(wait=True)
                 
             self.logger.info("Shutdown complete. Goodbye!")
             
@@ -789,7 +903,7 @@ class MistyAiccoAssistant:
                 greeting_templates=self.config.face_recognition.greeting_templates,
                 cooldown_seconds=self.config.face_recognition.greeting_cooldown_seconds,
                 greeting_led_color=self.config.led.greeting,
-                idle_led_color=self.config.led.idle,
+                idle_led_color=self._led_idle,
                 vip_persons=self.config.face_recognition.vip_persons,
                 realtime_handler=None,  # Will be set after voice assistant initialization if in realtime mode
                 audio_queue_manager=None,  # Will be set after voice assistant initialization if in realtime mode
@@ -805,8 +919,11 @@ class MistyAiccoAssistant:
                 on_face_recognized=self._on_face_recognized
             )
             
-            # Start continuous face recognition
+            # Start continuous face recognition (the manager sets its
+            # camera-active color directly)
+            self._drain_led()
             self.face_recognition_manager.start()
+            self._invalidate_led_cache()
             
             # List known faces
             known_faces = self.face_recognition_manager.get_known_faces()
@@ -825,16 +942,16 @@ class MistyAiccoAssistant:
             self.face_recognition_manager = None
             self.greeting_manager = None
     
-    def _on_face_recognized(self, face_data: dict):
+    def _on_face_recognized(self, face: FaceEvent):
         """Callback when a face is recognized.
         
         Triggers personalized greeting with cooldown management.
         
         Args:
-            face_data: Dictionary containing face information
+            face: Recognized face event
         """
         # Ignore face recognition while speaking
-        if getattr(self, "speaking_lock", False):
+        if self.speaking_lock:
             self.logger.debug("Ignoring face recognition during speaking")
             return
         
@@ -843,8 +960,8 @@ class MistyAiccoAssistant:
             self.logger.debug("Ignoring face recognition during active conversation")
             return
         
-        name = face_data.get("name", "Unknown")
-        confidence = face_data.get("confidence", 0.0)
+        name = face.name
+        confidence = face.confidence
         
         self.logger.info(f"👤 Face recognized: {name} (confidence: {confidence:.2f})")
         
@@ -855,7 +972,7 @@ class MistyAiccoAssistant:
             self.logger.info(f"🔍 DIAGNOSTIC - Will greet {name}? {will_greet}")
             if not will_greet:
                 cooldown_status = self.greeting_manager.get_greeting_status(name)
-                self.logger.info(f"   Cooldown remaining: {cooldown_status['cooldown_remaining']:.1f}s")
+                self.logger.info(f"   Cooldown remaining: {cooldown_status.cooldown_remaining:.1f}s")
         
         # PAUSE BOTH SYSTEMS during face greeting to prevent conflicts
         # BUT ONLY if we're actually going to deliver a greeting
@@ -878,10 +995,15 @@ class MistyAiccoAssistant:
         # Task 2.2: Greet person with cooldown management
         greeting_delivered = False
         if self.greeting_manager:
+            # Arm the completion signal before playback can start
+            self._greeting_pending = will_greet
+            
             # Request greeting immediately to minimize latency
-            import time
             recognized_at = time.time()
+            # Greeting manager drives the LED directly
+            self._drain_led()
             greeting_delivered = self.greeting_manager.greet_person(name, recognized_at=recognized_at)
+            self._invalidate_led_cache()
             
 # Run greeting animation asynchronously so it doesn't delay TTS
             # if self.personality_manager and self.config.personality.animations_during_speech:
@@ -894,31 +1016,113 @@ class MistyAiccoAssistant:
             # RESUME AUDIO MONITOR after greeting completes (with delay for audio)
             # BUT ONLY if we actually paused it (i.e., greeting was delivered)
             if greeting_delivered:
-                # Schedule resume in background thread to avoid blocking
-                def resume_after_greeting():
-                    # Wait for greeting audio to complete
-                    # Local cached greetings are typically 2-4 seconds
-                    # Add buffer for upload/playback initialization
-                    time.sleep(5.0)  # Increased from 3s to 5s for reliable completion
-                    
-                    # RESUME BOTH SYSTEMS after greeting
-                    if self.audio_monitor:
-                        self.logger.debug("▶️  Resuming audio monitor after face greeting")
-                        self.audio_monitor.resume()
-                        # Restart wake word detection if not in conversation mode
-                        if not self.conversation_active:
-                            self.logger.info("🔄 Restarting wake word detection after greeting...")
-                            self.audio_monitor.restart_wake_word_detection()
-                            self.logger.info("✅ Wake word detection restarted - 'Hey Misty' is now active!")
-                    
-                    if self.face_recognition_manager and self.config.face_recognition.enabled:
-                        self.logger.debug("▶️  Resuming face recognition after greeting")
-                        self.face_recognition_manager.resume()
-                
-                threading.Thread(target=resume_after_greeting, daemon=True).start()
+                # AudioPlayComplete resumes as soon as the greeting finishes;
+                # this fallback covers TTS greetings and missed events
+                self.greeting_resume_timer.arm(GREETING_RESUME_TIMEOUT)
             else:
+                self._greeting_pending = False
                 self.logger.debug("ℹ️  Skipping audio monitor resume - it was never paused (cooldown active)")
     
+    def _resume_after_greeting(self):
+        """Resume listening and face recognition once a greeting has played.
+        
+        Reached from AudioPlayComplete or the fallback timer, whichever is
+        first; the later one finds nothing pending and returns.
+        """
+        with self._greeting_lock:
+            if not self._greeting_pending:
+                return
+            self._greeting_pending = False
+        self.greeting_resume_timer.cancel()
+        
+        # RESUME BOTH SYSTEMS after greeting
+        if self.audio_monitor:
+            self.logger.debug("▶️  Resuming audio monitor after face greeting")
+            self.audio_monitor.resume()
+            # Restart wake word detection if not in conversation mode
+            if not self.conversation_active:
+                self.logger.info("🔄 Restarting wake word detection after greeting...")
+                self.audio_monitor.restart_wake_word_detection()
+                self.logger.info("✅ Wake word detection restarted - 'Hey Misty' is now active!")
+        
+        if self.face_recognition_manager and self.config.face_recognition.enabled:
+            self.logger.debug("▶️  Resuming face recognition after greeting")
+            self.face_recognition_manager.resume()
+    
+    def _set_led(self, rgb: tuple):
+        """Change Misty's LED, skipping the request if it already shows this color.
+        
+        The request is sent on the LED worker, so the caller carries on with
+        the next pipeline step while it is in flight.
+        
+        Args:
+            rgb: (red, green, blue) tuple
+        """
+        if rgb == self._current_led:
+            return
+        self._current_led = rgb
+        self._led_worker.submit(self._send_led, rgb)
+    
+    def _send_led(self, rgb: tuple):
+        """Send an LED change to Misty (runs on the LED worker).
+        
+        Args:
+            rgb: (red, green, blue) tuple
+        """
+        try:
+            self._change_led(*rgb)
+        except Exception as e:
+            self.logger.warning(f"Failed to change LED: {e}")
+            # The robot may still show the old color; don't skip the next request
+            if self._current_led == rgb:
+                self._current_led = None
+    
+    def _drain_led(self):
+        """Wait for queued LED changes to reach Misty.
+        
+        Call before another module changes the LED directly, so a queued
+        color cannot land after (and override) the module's color.
+        """
+        try:
+            # The worker runs jobs in order, so this returns once all
+            # earlier changes have been sent
+            self._led_worker.submit(lambda: None).result(timeout=LED_DRAIN_TIMEOUT)
+        except Exception as e:
+            self.logger.warning(f"LED changes still pending: {e}")
+        self._current_led = None
+    
+    def _invalidate_led_cache(self):
+        """Forget the cached LED color after another module changed the LED."""
+        self._current_led = None
+    
+    def _register_audio_play_complete(self):
+        """Register the shared AudioPlayComplete listener."""
+        try:
+            self.misty.register_event(
+                event_type=Events.AudioPlayComplete,
+                event_name="AssistantAudioPlayComplete",
+                keep_alive=True,
+                callback_function=lambda data: self._on_audio_play_complete(data)
+            )
+            self.logger.info("✅ AudioPlayComplete event registered")
+        except Exception as e:
+            self.logger.error(f"Failed to register AudioPlayComplete: {e}")
+    
+    def _on_audio_play_complete(self, event_data: dict):
+        """Callback when Misty finishes playing an audio file.
+        
+        Signals a pending greeting and advances chunked playback.
+        
+        Args:
+            event_data: Event data from Misty's AudioPlayComplete event
+        """
+        if self._greeting_pending:
+            # Resuming makes REST calls; keep them off the event thread
+            self._bg.submit(self._resume_after_greeting)
+        
+        if self.audio_queue:
+            self.audio_queue.on_playback_complete()
+    
     def _initialize_voice_assistant(self):
         """Initialize voice assistant module.
         
@@ -928,14 +1132,22 @@ class MistyAiccoAssistant:
         self.logger.info("Initializing voice assistant...")
         
         try:
-            voice_mode = self.config.voice_assistant.voice_mode
+            voice_mode = self._voice_mode
             
-            if voice_mode == "traditional":
-                self._initialize_traditional_mode()
-            elif voice_mode == "realtime":
-                self._initialize_realtime_mode()
-            else:
+            mode_initializers = {
+                "traditional": self._initialize_traditional_mode,
+                "realtime": self._initialize_realtime_mode,
+            }
+            initialize_mode = mode_initializers.get(voice_mode)
+            if initialize_mode is None:
                 raise ValueError(f"Invalid voice mode: {voice_mode}")
+            initialize_mode()
+            
+            # Build the per-utterance dispatch table once
+            self._mode_handlers = {
+                "traditional": self._handle_traditional_pipeline,
+                "realtime": self._handle_realtime_pipeline,
+            }
             
             # Create audio monitor with callbacks
             self.audio_monitor = AudioMonitor(
@@ -952,11 +1164,10 @@ class MistyAiccoAssistant:
             
             self.logger.info("✅ Voice assistant initialized successfully")
             self.logger.info(f"   Voice mode: {voice_mode}")
-            self.logger.info(f"   Wake word mode: {self.config.voice_assistant.wake_word_mode}")
-            if self.config.voice_assistant.wake_word_mode == "misty_builtin":
-                self.logger.info("   Wake word: 'Hey Misty'")
-            else:
-                self.logger.info(f"   Wake word: '{self.config.voice_assistant.wake_word_custom}'")
+            wake_word_mode = self.config.voice_assistant.wake_word_mode
+            wake_words = {"misty_builtin": "Hey Misty"}
+            self.logger.info(f"   Wake word mode: {wake_word_mode}")
+            self.logger.info(f"   Wake word: '{wake_words.get(wake_word_mode, self.config.voice_assistant.wake_word_custom)}'")
             
         except Exception as e:
             self.logger.error(f"Failed to initialize voice assistant: {e}", exc_info=True)
@@ -1003,22 +1214,11 @@ class MistyAiccoAssistant:
                 self.logger,
                 self.config,
                 on_response_complete=self._exit_speaking_state_after_playback,
-                personality_manager=self.personality_manager
+                personality_manager=self.personality_manager,
+                executor=self._bg,
+                set_led=self._set_led
             )
-            self.logger.info("    ✅ Audio queue initialized")
-            
-            # Register AudioPlayComplete event for seamless chunk transitions
-            self.logger.info("  - Registering AudioPlayComplete event...")
-            try:
-                self.misty.register_event(
-                    Events.AudioPlayComplete,
-                    "ChunkPlaybackComplete",
-                    keep_alive=True,
-                    callback_function=lambda ws, msg: self.audio_queue.on_playback_complete()
-                )
-                self.logger.info("    ✅ AudioPlayComplete event registered")
-            except Exception as e:
-                self.logger.error(f"Failed to register AudioPlayComplete: {e}")
+            self.logger.info("    ✅ Audio queue initialized (chunk transitions via AudioPlayComplete)")
         else:
             self.audio_queue = None
             self.logger.info("  - Audio chunking disabled (single-file playback)")
@@ -1027,6 +1227,8 @@ class MistyAiccoAssistant:
         chunk_threshold_bytes = int(self.config.voice_assistant.chunk_duration_seconds * 48000)
         
         # Initialize Realtime API handler with system instructions
+        system_prompt = get_uno_bsai_system_prompt()
+        self.logger.info(f"  - System prompt {prompt_digest(system_prompt)}: ~{count_prompt_tokens(system_prompt)} tokens (session-level, sent once)")
         self.logger.info("  - Connecting to OpenAI Realtime API...")
         self.realtime_handler = RealtimeHandler(
             api_key=self.config.openai.api_key,
@@ -1035,17 +1237,10 @@ class MistyAiccoAssistant:
             on_user_transcript_received=self._on_user_transcript,
             on_audio_chunk_received=self._on_realtime_audio_chunk if self.config.voice_assistant.audio_chunking_enabled else None,
             chunk_threshold_bytes=chunk_threshold_bytes if self.config.voice_assistant.audio_chunking_enabled else None,
-            system_instructions=UNO_BSAI_SYSTEM_PROMPT  # Set once at session level for fast responses!
+            system_instructions=system_prompt  # Set once at session level for fast responses!
         )
         
-        # Set realtime handler to DEBUG level for troubleshooting
-        import logging
-        realtime_logger = logging.getLogger("RealtimeHandler")
-        realtime_logger.setLevel(logging.DEBUG)
-        
-        # Add same handlers as main logger so events show in console and file
-        for handler in self.logger.handlers:
-            realtime_logger.addHandler(handler)
+        self._wire_realtime_logger()
         
         # Connect to the API
         self.realtime_handler.connect()
@@ -1070,7 +1265,24 @@ class MistyAiccoAssistant:
                 self.logger.info(f"  🚀 Parallel upload enabled (pre-upload while playing)")
         else:
             self.logger.info(f"  ⏳ Single-file playback mode (higher latency, simpler)")
-        self.logger.info("  🐛 Debug mode enabled for Realtime API")
+        self.logger.info("  🐛 Realtime API logs routed to assistant log handlers")
+    
+    def _wire_realtime_logger(self):
+        """Route RealtimeHandler logs through the assistant's handlers (once).
+        
+        The logger follows the configured log level: its handlers drop DEBUG
+        records anyway unless LOG_LEVEL is DEBUG, so forcing DEBUG here only
+        made every streamed event pay for formatting that was never written.
+        """
+        realtime_logger = logging.getLogger("RealtimeHandler")
+        realtime_logger.setLevel(self.logger.level)
+        
+        # Add same handlers as main logger so events show in console and file,
+        # skipping any already attached by an earlier reinit
+        for handler in self.logger.handlers:
+            if handler not in realtime_logger.handlers:
+                realtime_logger.addHandler(handler)
+        realtime_logger.propagate = False
     
     def _on_wake_word_detected(self, event_data: dict):
         """Callback when wake word is detected.
@@ -1103,13 +1315,13 @@ class MistyAiccoAssistant:
         
         # Set LED to listening state (purple)
         try:
-            self.misty.change_led(*self.config.led.listening)
-            self.logger.debug(f"💡 LED set to listening: RGB{self.config.led.listening}")
+            self._set_led(self._led_listening)
+            self.logger.debug(f"💡 LED set to listening: RGB{self._led_listening}")
         except Exception as e:
             self.logger.warning(f"Failed to change LED: {e}")
         
         # Play listening animation
-        if self.personality_manager and self.config.personality.animations_during_speech:
+        if self.personality_manager and self._anim_during_speech:
             self.personality_manager.listening_animation()
         
         self.logger.info("📝 Listening for your query...")
@@ -1137,8 +1349,8 @@ class MistyAiccoAssistant:
         
         # Set LED to processing state (cyan)
         try:
-            self.misty.change_led(*self.config.led.processing)
-            self.logger.debug(f"💡 LED set to processing: RGB{self.config.led.processing}")
+            self._set_led(self._led_processing)
+            self.logger.debug(f"💡 LED set to processing: RGB{self._led_processing}")
         except Exception as e:
             self.logger.warning(f"Failed to change LED: {e}")
         
@@ -1149,13 +1361,12 @@ class MistyAiccoAssistant:
         #     self.personality_manager.thinking_animation()
         
         # Route to appropriate mode
-        if self.config.voice_assistant.voice_mode == "traditional":
-            self._handle_traditional_pipeline(filename)
-        elif self.config.voice_assistant.voice_mode == "realtime":
-            self._handle_realtime_pipeline(filename)
-        else:
-            self.logger.error(f"Unknown voice mode: {self.config.voice_assistant.voice_mode}")
+        handler = self._mode_handlers.get(self._voice_mode)
+        if handler is None:
+            self.logger.error(f"Unknown voice mode: {self._voice_mode}")
             self._speak_and_reset("Sorry, there's a configuration error.")
+            return
+        handler(filename)
     
     def _handle_traditional_pipeline(self, filename: str):
         """Handle traditional STT → GPT → TTS pipeline.
@@ -1183,7 +1394,7 @@ class MistyAiccoAssistant:
         if self.conversation_active and self._is_ending_phrase(transcription):
             self.logger.info(f"🚪 Ending phrase detected: '{transcription}' - exiting conversation mode")
             # End conversation after the response completes
-            threading.Timer(0.5, self._end_conversation).start()
+            self._run_after(0.5, self._end_conversation)
         
         # Task 5.1: Get AI response from OpenAI Chat
         if not self.ai_chat:
@@ -1191,7 +1402,13 @@ class MistyAiccoAssistant:
             self._speak_and_reset("Sorry, my AI brain is not available.")
             return
         
+        # Stream the response so Misty starts speaking after the first
+        # sentence instead of after the whole answer
         self.logger.info("🤖 Generating AI response...")
+        if self._speak_response_stream(self.ai_chat.stream_response(transcription)):
+            return
+        
+        # Nothing was generated; fall back to the retrying, non-streamed call
         ai_response = self.ai_chat.get_response_with_retry(transcription, max_retries=2)
         
         if not ai_response:
@@ -1211,7 +1428,9 @@ class MistyAiccoAssistant:
             filename: Audio filename on Misty
         """
         pipeline_start = time.time()
-        self.logger.info(f"⏱️  [PERF] Realtime pipeline started at {pipeline_start:.3f}")
+        perf = self.logger.isEnabledFor(logging.INFO)
+        if perf:
+            self.logger.info(f"⏱️  [PERF] Realtime pipeline started at {pipeline_start:.3f}")
         
         if not self.realtime_handler:
             self.logger.error("Realtime handler not initialized")
@@ -1233,70 +1452,73 @@ class MistyAiccoAssistant:
         
         # Get audio from Misty (with retry for 503 errors)
         retrieval_start = time.time()
-        self.logger.info(f"⏱️  [PERF] Audio retrieval started at {retrieval_start:.3f} (+{retrieval_start - pipeline_start:.3f}s)")
-        
-        import base64
-        
-        max_retries = 3
-        retry_delay = 0.3  # Reduced from 0.5s to 0.3s for faster retries
+        if perf:
+            self.logger.info(f"⏱️  [PERF] Audio retrieval started at {retrieval_start:.3f} (+{retrieval_start - pipeline_start:.3f}s)")
         
-        for attempt in range(max_retries):
-            try:
-                if attempt > 0:
-                    self.logger.info(f"   Retry {attempt}/{max_retries-1}...")
-                    time.sleep(retry_delay)
-                
-                response = self.misty.get_audio_file(fileName=filename, base64=True)
-                
-                # Parse response to get base64 audio
-                if response.status_code != 200:
-                    if response.status_code == 503 and attempt < max_retries - 1:
-                        # Service unavailable - file might not be ready yet, retry
-                        self.logger.debug(f"   Got 503, waiting {retry_delay}s before retry...")
-                        continue
-                    raise Exception(f"Failed to get audio file: {response.status_code}")
-                
-                result = response.json()
-                if not result or "result" not in result:
-                    raise Exception("No result in audio file response")
-                
-                base64_audio = result["result"].get("base64")
-                if not base64_audio:
-                    raise Exception("No base64 data in response")
-                
-                # Decode base64 to bytes
-                audio_bytes = base64.b64decode(base64_audio)
-                
-                retrieval_end = time.time()
-                self.logger.info(f"⏱️  [PERF] Audio retrieved: {len(audio_bytes)} bytes in {retrieval_end - retrieval_start:.3f}s")
-                break  # Success, exit retry loop
-                
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    # Last attempt failed
-                    self.logger.error(f"❌ Failed to retrieve audio after {max_retries} attempts: {e}")
-                    self._speak_and_reset("Sorry, I couldn't retrieve the audio.")
-                    return
-                # Otherwise continue to next retry
-        else:
-            # Should not reach here, but handle just in case
-            self.logger.error("❌ Failed to retrieve audio: max retries exceeded")
+        try:
+            response = self._retry(lambda: self.misty.get_audio_file(fileName=filename, base64=True))
+            if response.status_code != 200:
+                raise Exception(f"Failed to get audio file: {response.status_code}")
+            
+            # Pull the base64 audio out of the response and decode it
+            audio_bytes = decode_audio_file_response(response)
+            if not audio_bytes:
+                raise Exception("No base64 data in response")
+        except Exception as e:
+            self.logger.error(f"❌ Failed to retrieve audio: {e}")
             self._speak_and_reset("Sorry, I couldn't retrieve the audio.")
             return
         
+        retrieval_end = time.time()
+        if perf:
+            self.logger.info(f"⏱️  [PERF] Audio retrieved: {len(audio_bytes)} bytes in {retrieval_end - retrieval_start:.3f}s")
+        
         # Send to Realtime API
         api_send_start = time.time()
-        self.logger.info(f"⏱️  [PERF] Sending to Realtime API at {api_send_start:.3f} (+{api_send_start - retrieval_end:.3f}s)")
+        if perf:
+            self.logger.info(f"⏱️  [PERF] Sending to Realtime API at {api_send_start:.3f} (+{api_send_start - retrieval_end:.3f}s)")
         try:
             self.realtime_handler.process_audio_file(audio_bytes)
             api_send_end = time.time()
-            self.logger.info(f"⏱️  [PERF] Audio sent to Realtime API in {api_send_end - api_send_start:.3f}s, waiting for response...")
+            if perf:
+                self.logger.info(f"⏱️  [PERF] Audio sent to Realtime API in {api_send_end - api_send_start:.3f}s, waiting for response...")
             # Response will come via callbacks (_on_realtime_transcript and _on_realtime_audio)
             
         except Exception as e:
             self.logger.error(f"❌ Failed to process with Realtime API: {e}")
             self._speak_and_reset("Sorry, I had trouble processing that.")
     
+    def _retry(self, fn, *, retries: int = 3, delay: float = 0.2, factor: float = 1.5,
+               retry_on: tuple = (503,)):
+        """Call a Misty request, retrying transient failures with backoff.
+        
+        Args:
+            fn: Callable with no arguments returning a requests Response
+            retries: Total number of attempts
+            delay: Wait before the first retry in seconds
+            factor: Multiplier applied to the wait after each retry
+            retry_on: Status codes worth retrying (e.g. 503 while a file is still being written)
+            
+        Returns:
+            The last response received
+            
+        Raises:
+            The last exception if every attempt raised
+        """
+        for attempt in range(1, retries + 1):
+            try:
+                response = fn()
+                if response.status_code not in retry_on or attempt == retries:
+                    return response
+                self.logger.debug(f"   Got {response.status_code}, retrying in {delay:.2f}s ({attempt}/{retries})...")
+            except Exception as e:
+                if attempt == retries:
+                    raise
+                self.logger.debug(f"   Request failed ({e}), retrying in {delay:.2f}s ({attempt}/{retries})...")
+            
+            time.sleep(delay + random.uniform(0, 0.05))
+            delay *= factor
+    
     def _on_realtime_transcript(self, transcript: str):
         """Callback when AI response transcript is received from Realtime API.
         
@@ -1318,7 +1540,7 @@ class MistyAiccoAssistant:
             self.logger.info(f"🚪 Ending phrase detected: '{transcript}' - exiting conversation mode")
             # End conversation after the response completes
             # Use a small delay to let the current response finish gracefully
-            threading.Timer(0.5, self._end_conversation).start()
+            self._run_after(0.5, self._end_conversation)
     
     def _on_realtime_audio_chunk(self, audio_bytes: bytes, is_final: bool, chunk_index: int):
         """Callback when audio chunk is received from Realtime API.
@@ -1331,12 +1553,13 @@ class MistyAiccoAssistant:
             is_final: Whether this is the last chunk of the response
             chunk_index: Index of this chunk in the response
         """
-        chunk_received_time = time.time()
-        self.logger.info(f"🎵 Audio chunk {chunk_index} received: {len(audio_bytes)} bytes (final={is_final})")
+        # Per-chunk logging runs once per delta, so only format when it will be emitted
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"🎵 Audio chunk {chunk_index} received: {len(audio_bytes)} bytes (final={is_final})")
         
         # Log time to first audio chunk (critical latency metric)
-        if chunk_index == 0:
-            self.logger.info(f"⏱️  [PERF] First audio chunk received at {chunk_received_time:.3f} (TIME TO FIRST AUDIO)")
+        if chunk_index == 0 and self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"⏱️  [PERF] First audio chunk received at {time.time():.3f} (TIME TO FIRST AUDIO)")
         
         if not self.audio_queue:
             self.logger.error("Audio queue not initialized!")
@@ -1349,7 +1572,7 @@ class MistyAiccoAssistant:
             
             # Set LED to speaking state on first chunk
             if chunk_index == 0:
-                self.misty.change_led(*self.config.led.speaking)
+                self._set_led(self._led_speaking)
                 self.logger.info("🔊 First chunk received, playback starting soon!")
             
             # Return to idle LED after final chunk completes
@@ -1375,78 +1598,43 @@ class MistyAiccoAssistant:
         
         # Convert PCM to WAV format for Misty
         try:
-            import uuid
-            import base64
-            import struct
+            # Identical responses (short acks and the like) are already on Misty
+            cache_key = hashlib.blake2b(audio_bytes, digest_size=8).digest()
+            cached_filename = self._audio_upload_cache.get(cache_key)
+            if cached_filename:
+                self._audio_upload_cache.move_to_end(cache_key)
+                self.logger.info(f"♻️  Reusing uploaded audio: {cached_filename}")
+                self._play_realtime_audio(cached_filename)
+                return
             
             # Generate unique filename
-            temp_filename = f"realtime_response_{uuid.uuid4().hex[:8]}.wav"
+            self._resp_counter = (self._resp_counter + 1) % TEMP_AUDIO_FILE_SLOTS
+            temp_filename = f"realtime_response_{self._resp_counter}.wav"
             
             # Convert PCM16 to WAV by adding WAV header
             # Optimize: Downsample from 24kHz to 16kHz for faster upload (speech quality is sufficient)
             original_sample_rate = 24000
             target_sample_rate = 16000
-            num_channels = 1
-            bits_per_sample = 16
-            
-            # Downsample audio data from 24kHz to 16kHz using linear interpolation
-            import array
-            samples_24k = array.array('h')
-            samples_24k.frombytes(audio_bytes)
-            
-            # Simple downsampling by linear interpolation
-            ratio = target_sample_rate / original_sample_rate  # 16000/24000 = 0.6667
-            out_len = int(len(samples_24k) * ratio)
-            samples_16k = array.array('h', [0] * out_len)
-            
-            for i in range(out_len):
-                src_pos = i / ratio
-                j = int(src_pos)
-                frac = src_pos - j
-                if j + 1 < len(samples_24k):
-                    a = samples_24k[j]
-                    b = samples_24k[j + 1]
-                    val = int(a + (b - a) * frac)
-                else:
-                    val = samples_24k[j] if j < len(samples_24k) else 0
-                samples_16k[i] = max(-32768, min(32767, val))
-            
-            downsampled_bytes = samples_16k.tobytes()
-            data_size = len(downsampled_bytes)
-            
-            byte_rate = target_sample_rate * num_channels * bits_per_sample // 8
-            block_align = num_channels * bits_per_sample // 8
-            
-            # Build WAV header for 16kHz audio
-            wav_header = struct.pack('<4sI4s4sIHHIIHH4sI',
-                b'RIFF',
-                36 + data_size,  # File size - 8
-                b'WAVE',
-                b'fmt ',
-                16,  # fmt chunk size
-                1,   # PCM format
-                num_channels,
-                target_sample_rate,
-                byte_rate,
-                block_align,
-                bits_per_sample,
-                b'data',
-                data_size
-            )
             
-            # Combine header and downsampled data
-            wav_bytes = wav_header + downsampled_bytes
+            # Downsample audio data from 24kHz to 16kHz, written straight into the WAV buffer
+            wav_bytes = pcm16_24k_to_wav_16k(audio_bytes, source_rate=original_sample_rate)
             
-            self.logger.info(f"🔽 Downsampled audio: {original_sample_rate}Hz -> {target_sample_rate}Hz ({len(audio_bytes)} -> {len(downsampled_bytes)} bytes, {100 - int(100*len(downsampled_bytes)/len(audio_bytes))}% smaller)")
+            # Size bookkeeping is only worth computing when it will be logged
+            verbose = self.logger.isEnabledFor(logging.INFO)
+            if verbose:
+                downsampled_size = len(wav_bytes) - WAV_HEADER_SIZE
+                self.logger.info(f"🔽 Downsampled audio: {original_sample_rate}Hz -> {target_sample_rate}Hz ({len(audio_bytes)} -> {downsampled_size} bytes, {100 - int(100*downsampled_size/len(audio_bytes))}% smaller)")
+                self.logger.info(f"✅ Converted PCM to WAV: {len(wav_bytes)} bytes total")
             
-            self.logger.info(f"✅ Converted PCM to WAV: {len(wav_bytes)} bytes total")
-            
-            # Convert WAV bytes to base64 string (required by Misty API)
-            audio_base64 = base64.b64encode(wav_bytes).decode('utf-8')
-            base64_size_mb = len(audio_base64) / (1024 * 1024)
+            # Convert WAV bytes to base64 string (required by Misty API); the
+            # output is pure ASCII, so skip the UTF-8 codec
+            audio_base64 = base64.b64encode(wav_bytes).decode('ascii')
+            del wav_bytes
             
             # Upload to Misty with timing
-            self.logger.info(f"📤 Uploading audio to Misty... ({base64_size_mb:.2f} MB base64)")
+            if verbose:
+                base64_size_mb = len(audio_base64) / (1024 * 1024)
+                self.logger.info(f"📤 Uploading audio to Misty... ({base64_size_mb:.2f} MB base64)")
             upload_start = time.time()
             upload_response = self.misty.save_audio(
                 fileName=temp_filename,
@@ -1458,6 +1646,7 @@ class MistyAiccoAssistant:
             
             if upload_response.status_code == 200:
                 self.logger.info(f"✅ Audio uploaded: {temp_filename} (took {upload_duration:.2f}s)")
+                self._remember_uploaded_audio(cache_key, temp_filename)
                 
                 # Play the audio
                 self._play_realtime_audio(temp_filename)
@@ -1469,6 +1658,21 @@ class MistyAiccoAssistant:
             self.logger.error(f"❌ Failed to handle realtime audio: {e}", exc_info=True)
             self._speak_and_reset("Sorry, I had trouble playing the response.")
     
+    def _remember_uploaded_audio(self, cache_key: bytes, filename: str):
+        """Record an uploaded response file so identical audio can reuse it.
+        
+        Args:
+            cache_key: Digest of the response PCM
+            filename: Filename of the audio on Misty
+        """
+        # The filename slot was just overwritten, so any older entry for it is stale
+        for key, cached in list(self._audio_upload_cache.items()):
+            if cached == filename:
+                del self._audio_upload_cache[key]
+        self._audio_upload_cache[cache_key] = filename
+        if len(self._audio_upload_cache) > REALTIME_AUDIO_CACHE_SIZE:
+            self._audio_upload_cache.popitem(last=False)
+    
     def _play_realtime_audio(self, filename: str):
         """Play realtime audio response through Misty.
         
@@ -1479,7 +1683,7 @@ class MistyAiccoAssistant:
         self._enter_speaking_state()
         try:
             # Set LED to speaking state
-            self.misty.change_led(*self.config.led.speaking)
+            self._set_led(self._led_speaking)
             self.logger.info(f"🔊 Playing realtime audio: {filename}")
             
             # Start continuous speaking animations (non-blocking, parallel)
@@ -1515,12 +1719,12 @@ class MistyAiccoAssistant:
         
         try:
             try:
-                self.misty.change_led(*self.config.led.speaking)
-                self.logger.debug(f"💡 LED set to speaking: RGB{self.config.led.speaking}")
+                self._set_led(self._led_speaking)
+                self.logger.debug(f"💡 LED set to speaking: RGB{self._led_speaking}")
             except Exception as e:
                 self.logger.warning(f"Failed to change LED: {e}")
             
-            if self.personality_manager and self.config.personality.animations_during_speech:
+            if self.personality_manager and self._anim_during_speech:
                 self.personality_manager.speaking_animation()
             
             self.logger.info(f"🔊 Speaking: '{text}'")
@@ -1530,6 +1734,104 @@ class MistyAiccoAssistant:
         finally:
             self._exit_speaking_state_after_playback()
 
+    def _speak_response_stream(self, sentences, timeout_seconds: float = 30.0) -> bool:
+        """Speak an AI response as its sentences arrive.
+        
+        The first sentence interrupts anything still playing; later ones are
+        queued on Misty (flush=False) so they play in order while the rest of
+        the response is still being generated. Each sentence gets its own
+        utterance ID, and returns once every one of them has reported
+        TextToSpeechComplete (so the completion of whatever the first
+        sentence interrupted is not counted), or no progress has been made
+        for ``timeout_seconds``.
+        
+        Args:
+            sentences: Iterator of response text chunks
+            timeout_seconds: Maximum wait between utterance completions
+        
+        Returns:
+            False if the iterator produced nothing (speaking state untouched),
+            True otherwise
+        """
+        first = next(sentences, None)
+        if first is None:
+            return False
+        
+        event_name = "StreamedTextToSpeechCompleteEvent"
+        progress = threading.Condition()
+        pending = set()  # Utterance IDs sent but not yet completed
+        self._stream_counter += 1
+        id_prefix = f"aicco-stream-{self._stream_counter}-"
+        
+        def on_tts_complete(data):
+            message = data.get("message") if isinstance(data, dict) else None
+            utterance_id = message.get("utteranceId") if isinstance(message, dict) else None
+            with progress:
+                if utterance_id in pending:
+                    pending.discard(utterance_id)
+                    progress.notify()
+        
+        self._enter_speaking_state()
+        try:
+            try:
+                self._set_led(self._led_speaking)
+                self.logger.debug(f"💡 LED set to speaking: RGB{self._led_speaking}")
+            except Exception as e:
+                self.logger.warning(f"Failed to change LED: {e}")
+            
+            if self.personality_manager and self._anim_during_speech:
+                self.personality_manager.speaking_animation()
+            
+            # Keep listening across utterances, not just the first
+            try:
+                self.misty.register_event(
+                    event_type=Events.TextToSpeechComplete,
+                    event_name=event_name,
+                    keep_alive=True,
+                    callback_function=on_tts_complete
+                )
+            except Exception as e:
+                self.logger.warning(f"Failed to register TextToSpeechComplete: {e}")
+            
+            sent = 0
+            sentence = first
+            while sentence is not None:
+                self.logger.info(f"🔊 Speaking: '{sentence}'")
+                utterance_id = f"{id_prefix}{sent}"
+                # Track before sending: the completion can beat the response
+                with progress:
+                    pending.add(utterance_id)
+                try:
+                    response = self.misty.speak(text=sentence, flush=sent == 0, utteranceId=utterance_id)
+                    if response.status_code != 200:
+                        self.logger.warning(f"Speak command returned status {response.status_code}")
+                        with progress:
+                            pending.discard(utterance_id)
+                except Exception as e:
+                    self.logger.error(f"❌ Failed to speak response: {e}")
+                    with progress:
+                        pending.discard(utterance_id)
+                sent += 1
+                sentence = next(sentences, None)
+            
+            # Wait for our utterances to finish, giving up only if it stalls
+            with progress:
+                while pending:
+                    before = len(pending)
+                    progress.wait(timeout_seconds)
+                    if len(pending) == before:
+                        self.logger.warning("Timed out waiting for speech playback to finish")
+                        break
+        except Exception as e:
+            self.logger.error(f"❌ Failed during TTS: {e}")
+        finally:
+            try:
+                self.misty.unregister_event(event_name)
+            except Exception:
+                pass
+            self._exit_speaking_state_after_playback()
+        return True
+
     def _enter_speaking_state(self):
         """Enter speaking state: set lock and pause audio monitor."""
         self.speaking_lock = True
@@ -1548,7 +1850,7 @@ class MistyAiccoAssistant:
             self.logger.info("💬 Conversation mode active - listening for follow-up...")
             self._start_conversation_timer()
             try:
-                self.misty.change_led(*self.config.led.listening)
+                self._set_led(self._led_listening)
                 self.logger.debug("💡 LED set to listening (waiting for follow-up)")
             except Exception as e:
                 self.logger.warning(f"Failed to change LED: {e}")
@@ -1567,8 +1869,8 @@ class MistyAiccoAssistant:
             # Return to idle and wake word mode
             self.logger.info("🏠 Returning to wake word listening mode...")
             try:
-                self.misty.change_led(*self.config.led.idle)
-                self.logger.debug(f"💡 LED returned to idle: RGB{self.config.led.idle}")
+                self._set_led(self._led_idle)
+                self.logger.debug(f"💡 LED returned to idle: RGB{self._led_idle}")
             except Exception as e:
                 self.logger.warning(f"Failed to reset LED: {e}")
             if self.audio_monitor:
@@ -1592,29 +1894,22 @@ class MistyAiccoAssistant:
 
     def _wait_for_audio_play_complete(self, timeout_seconds: float = 30.0):
         """Block until AudioPlayComplete event arrives or timeout."""
-        import time
-        from mistyPy.Events import Events
         event_name = "AudioPlayCompleteEvent"
-        done_flag = {"done": False}
-        
-        def _handler(_):
-            done_flag["done"] = True
+        done = threading.Event()
         
         try:
             self.misty.register_event(
                 event_type=Events.AudioPlayComplete,
                 event_name=event_name,
                 keep_alive=False,
-                callback_function=lambda data: _handler(data)
+                callback_function=lambda data: done.set()
             )
         except Exception as e:
             self.logger.warning(f"Failed to register AudioPlayComplete: {e}")
             time.sleep(2)
             return
         
-        start = time.time()
-        while not done_flag["done"] and (time.time() - start) < timeout_seconds:
-            time.sleep(0.05)
+        done.wait(timeout_seconds)
         try:
             self.misty.unregister_event(event_name)
         except Exception:
@@ -1622,13 +1917,8 @@ class MistyAiccoAssistant:
 
     def _speak_and_wait_for_tts_complete(self, text: str, timeout_seconds: float = 30.0):
         """Speak text and wait for TextToSpeechComplete event or timeout."""
-        import time
-        from mistyPy.Events import Events
         event_name = "TextToSpeechCompleteEvent"
-        done_flag = {"done": False}
-        
-        def _handler(_):
-            done_flag["done"] = True
+        done = threading.Event()
         
         # Register completion event first
         try:
@@ -1636,7 +1926,7 @@ class MistyAiccoAssistant:
                 event_type=Events.TextToSpeechComplete,
                 event_name=event_name,
                 keep_alive=False,
-                callback_function=lambda data: _handler(data)
+                callback_function=lambda data: done.set()
             )
         except Exception as e:
             self.logger.warning(f"Failed to register TextToSpeechComplete: {e}")
@@ -1656,9 +1946,7 @@ class MistyAiccoAssistant:
                 pass
             return
         
-        start = time.time()
-        while not done_flag["done"] and (time.time() - start) < timeout_seconds:
-            time.sleep(0.05)
+        done.wait(timeout_seconds)
         try:
             self.misty.unregister_event(event_name)
         except Exception:
@@ -1683,9 +1971,13 @@ class MistyAiccoAssistant:
         self._cancel_conversation_timer()
         self.logger.info("🎬 Ending conversation mode - returning to greeting mode")
         
+        # The next visitor starts a fresh chat (and can hit the opening-question cache)
+        if self.ai_chat:
+            self.ai_chat.clear_history()
+        
         # Return LED to idle
         try:
-            self.misty.change_led(*self.config.led.idle)
+            self._set_led(self._led_idle)
         except Exception as e:
             self.logger.warning(f"Failed to reset LED: {e}")
         
@@ -1704,7 +1996,9 @@ class MistyAiccoAssistant:
                 # Face recognition was stopped (e.g., in screensaver) - restart it
                 self.logger.info("▶️  Starting face recognition (returning to greeting mode)...")
                 try:
+                    self._drain_led()
                     self.face_recognition_manager.start()
+                    self._invalidate_led_cache()
                     self.logger.info("✅ Face recognition started successfully - back to greeting mode!")
                 except Exception as e:
                     self.logger.error(f"❌ Failed to start face recognition: {e}", exc_info=True)
@@ -1725,22 +2019,31 @@ class MistyAiccoAssistant:
     
     def _start_conversation_timer(self):
         """Start or restart the conversation timeout timer."""
-        # Cancel existing timer if any
-        self._cancel_conversation_timer()
-        
-        # Start new timer
+        # Re-arming replaces any pending deadline on the same worker thread
         timeout = self.config.voice_assistant.conversation_timeout_seconds
-        self.conversation_timer = threading.Timer(timeout, self._on_conversation_timeout)
-        self.conversation_timer.daemon = True
-        self.conversation_timer.start()
+        self.conversation_timer.arm(timeout)
         self.logger.debug(f"⏰ Conversation timer set for {timeout}s")
     
     def _cancel_conversation_timer(self):
         """Cancel the conversation timeout timer."""
-        if self.conversation_timer and self.conversation_timer.is_alive():
+        if self.conversation_timer.armed:
             self.conversation_timer.cancel()
             self.logger.debug("⏰ Conversation timer cancelled")
     
+    def _run_after(self, delay: float, fn):
+        """Run a function on a timer thread after a short delay.
+        
+        A timer rather than a sleeping pool job, so the delay doesn't hold
+        a background pool thread that uploads and deletes are waiting on.
+        
+        Args:
+            delay: Seconds to wait before calling fn
+            fn: Callable with no arguments
+        """
+        timer = threading.Timer(delay, fn)
+        timer.daemon = True
+        timer.start()
+    
     def _on_conversation_timeout(self):
         """Called when conversation times out due to inactivity."""
         self.logger.info("⏰ Conversation timeout - no speech detected")
@@ -1755,48 +2058,11 @@ class MistyAiccoAssistant:
         Returns:
             True if text contains an ending phrase, False otherwise
         """
-        # Normalize text: lowercase and strip whitespace
-        normalized = text.lower().strip()
-        
-        # Common ending phrases that indicate the user wants to end the conversation
-        ending_phrases = [
-            "thank you",
-            "thanks",
-            "thank you very much",
-            "thanks a lot",
-            "that's all",
-            "that's it",
-            "that'll be all",
-            "goodbye",
-            "good bye",
-            "bye",
-            "see you",
-            "see ya",
-            "have a good day",
-            "have a nice day",
-            "okay bye",
-            "ok bye",
-            "that's all i need",
-            "that's all i needed",
-            "nothing else",
-            "no more questions",
-            "i'm done",
-            "i'm good",
-            "that helps",
-            "that's helpful",
-            "got it thanks",
-            "okay thanks",
-            "ok thanks",
-            "alright thanks",
-            "perfect thanks",
-            "great thanks",
-        ]
-        
-        # Check if any ending phrase appears in the text
-        for phrase in ending_phrases:
-            if phrase in normalized:
-                self.logger.debug(f"   Matched ending phrase: '{phrase}'")
-                return True
+        # Check if any ending phrase appears in the text (as whole words, any case)
+        match = _ENDING_PHRASE_RE.search(text)
+        if match:
+            self.logger.debug(f"   Matched ending phrase: '{match.group(0)}'")
+            return True
         
         return False
     
@@ -1837,22 +2103,10 @@ class MistyAiccoAssistant:
             if response.status_code == 200:
                 self.logger.info(f"✅ Photo displayed for {person_name}")
                 
-                # Set timer to return to default expression after 3 seconds
-                def return_to_default():
-                    try:
-                        self.misty.display_image(
-                            fileName="e_DefaultContent.jpg",  # Default Misty eyes
-                            alpha=1.0,
-                            layer="default"
-                        )
-                        self.logger.debug("🔄 Returned to default eye expression")
-                    except Exception as e:
-                        self.logger.warning(f"Failed to return to default expression: {e}")
-                
-                # Schedule return to default after 3 seconds (FIXED: was 30!)
-                # timer = threading.Timer(3.0, return_to_default)
-                # timer.daemon = True
-                # timer.start()
+                # Return to default eyes after photo_display_duration seconds
+                # (only if the restore timer is enabled in __init__)
+                if self.photo_restore_timer:
+                    self.photo_restore_timer.arm(self.photo_display_duration)
                 
             else:
                 self.logger.error(f"❌ Failed to display photo: {response.status_code}")
@@ -1860,6 +2114,31 @@ class MistyAiccoAssistant:
         except Exception as e:
             self.logger.error(f"❌ Error displaying photo for {person_name}: {e}", exc_info=True)
     
+    def _return_to_default_eyes(self):
+        """Restore Misty's default eye expression after a photo display."""
+        try:
+            self.misty.display_image(
+                fileName="e_DefaultContent.jpg",  # Default Misty eyes
+                alpha=1.0,
+                layer="default"
+            )
+            self.logger.debug("🔄 Returned to default eye expression")
+        except Exception as e:
+            self.logger.warning(f"Failed to return to default expression: {e}")
+    
+    @staticmethod
+    def _misty_photo_filename(person_name: str) -> str:
+        """Build the sanitised filename a person's photo is stored under on Misty.
+        
+        Args:
+            person_name: Name of the person
+            
+        Returns:
+            Filename such as "person_jane_smith.jpg"
+        """
+        safe_name = person_name.lower().replace(" ", "_").replace(".", "")
+        return f"person_{safe_name}.jpg"
+    
     def _upload_person_photo(self, person_name: str, photo_path: str) -> bool:
         """Upload a person's photo to Misty.
         
@@ -1870,27 +2149,46 @@ class MistyAiccoAssistant:
         Returns:
             True if upload successful, False otherwise
         """
-        try:
-            import os
-            import base64
+        lock = self._photo_locks.get(person_name)
+        if lock is None:
+            return self._upload_person_photo_locked(person_name, photo_path)
+        with lock:
+            # Another thread may have uploaded it while we waited
+            if person_name in self.uploaded_photos:
+                return True
+            return self._upload_person_photo_locked(person_name, photo_path)
+    
+    def _upload_person_photo_locked(self, person_name: str, photo_path: str) -> bool:
+        """Upload a person's photo to Misty (caller holds the person's lock).
+        
+        Args:
+            person_name: Name of the person
+            photo_path: Path to the photo file
             
+        Returns:
+            True if upload successful, False otherwise
+        """
+        try:
             # Check if file exists
             if not os.path.exists(photo_path):
                 self.logger.error(f"Photo file not found: {photo_path}")
                 return False
             
-            # Read photo file
-            with open(photo_path, 'rb') as f:
-                photo_data = f.read()
+            photo_size = os.path.getsize(photo_path)
+            if not photo_size:
+                # mmap cannot map an empty file
+                self.logger.error(f"Photo file is empty: {photo_path}")
+                return False
             
-            # Convert to base64
-            base64_data = base64.b64encode(photo_data).decode('utf-8')
+            # Map the photo and base64-encode straight from the page cache, so
+            # the raw image is never copied into a Python bytes object
+            # (pure ASCII output, so skip the UTF-8 codec)
+            with open(photo_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as photo_data:
+                base64_data = base64.b64encode(photo_data).decode('ascii')
             
-            # Generate filename for Misty (sanitize name)
-            safe_name = person_name.lower().replace(" ", "_").replace(".", "")
-            misty_filename = f"person_{safe_name}.jpg"
+            misty_filename = self._misty_filenames.get(person_name) or self._misty_photo_filename(person_name)
             
-            self.logger.info(f"📤 Uploading {photo_path} as {misty_filename} ({len(photo_data)} bytes)")
+            self.logger.info(f"📤 Uploading {photo_path} as {misty_filename} ({photo_size} bytes)")
             
             # Upload to Misty
             response = self.misty.save_image(
@@ -1914,18 +2212,26 @@ class MistyAiccoAssistant:
             return False
     
     def _preload_all_photos(self):
-        """Preload all configured photos to Misty for faster display."""
+        """Preload all configured photos to Misty for faster display.
+        
+        Uploads are independent and network-bound, so they run concurrently;
+        _upload_person_photo serialises uploads of the same person with any
+        display request that arrives mid-preload.
+        """
         self.logger.info("🔄 Preloading person photos...")
         
-        uploaded_count = 0
-        for person_name, photo_path in self.person_photos.items():
+        def preload_one(item):
+            person_name, photo_path = item
             if self._upload_person_photo(person_name, photo_path):
-                uploaded_count += 1
                 self.logger.debug(f"  ✅ Preloaded: {person_name}")
-            else:
-                self.logger.warning(f"  ❌ Failed to preload: {person_name}")
+                return True
+            self.logger.warning(f"  ❌ Failed to preload: {person_name}")
+            return False
+        
+        with ThreadPoolExecutor(max_workers=6, thread_name_prefix="photo-preload") as pool:
+            results = list(pool.map(preload_one, self.person_photos.items()))
         
-        self.logger.info(f"✅ Preloaded {uploaded_count}/{len(self.person_photos)} photos")
+        self.logger.info(f"✅ Preloaded {sum(results)}/{len(self.person_photos)} photos")
 
     def _speak_and_reset(self, error_message: str):
         """Speak error message and return to idle state.
@@ -1940,7 +2246,7 @@ class MistyAiccoAssistant:
         
         # Return LED to idle
         try:
-            self.misty.change_led(*self.config.led.idle)
+            self._set_led(self._led_idle)
         except Exception as e:
             self.logger.warning(f"Failed to reset LED: {e}")
     
@@ -1962,7 +2268,9 @@ class MistyAiccoAssistant:
             # Stop face recognition (camera) to save power
             if self.face_recognition_manager and self.face_recognition_manager.running:
                 self.logger.info("   Stopping face recognition (camera off)...")
+                self._drain_led()
                 self.face_recognition_manager.stop()
+                self._invalidate_led_cache()
             
             # DIAGNOSTIC: Check audio monitor state before screensaver
             if self.audio_monitor:
@@ -2001,7 +2309,9 @@ class MistyAiccoAssistant:
             # Restart face recognition (camera)
             if self.face_recognition_manager and self.config.face_recognition.enabled:
                 self.logger.info("   Restarting face recognition (camera on)...")
+                self._drain_led()
                 self.face_recognition_manager.start()
+                self._invalidate_led_cache()
             
             # DIAGNOSTIC: Verify audio monitor is still working after wake
             if self.audio_monitor:
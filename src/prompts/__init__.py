@@ -0,0 +1,147 @@
+"""System prompts for Misty AI Assistant.
+
+This package contains all system prompts used by the assistant.
+
+The prompt text lives in Markdown files next to this module (so other
+tools can use it as-is) and is read lazily on first use. The UNO/BSAI
+prompt is split into named modules, separated by horizontal rules in
+uno_bsai.md, so that callers can build variants from a subset while
+keeping a shared, byte-stable prefix: modules are always emitted in the
+canonical PROMPT_MODULES order, so any two prompts that start with the
+same modules share a cacheable prefix.
+"""
+
+import functools
+import hashlib
+import os
+from typing import Dict, Iterable, Optional
+
+try:
+    import tiktoken  # Optional: exact token counts for OpenAI models
+except ImportError:
+    tiktoken = None
+
+# Separator placed between prompt modules
+_MODULE_SEPARATOR = "\n\n---\n\n"
+
+# Prompt text for the UNO/BSAI assistant, one module per rule-separated section
+_UNO_BSAI_PROMPT_PATH = os.path.join(os.path.dirname(__file__), "uno_bsai.md")
+
+# Canonical module order: every prompt is emitted in this order, so an
+# edit to one module only changes the prompt from that module onwards
+_MODULE_NAMES = (
+    "role",                 # Identity and pronunciation
+    "scope",                # What the assistant may and may not discuss
+    "voice_constraints",    # Hard limits imposed by robot audio playback
+    "style",                # Personality and conversation openers
+    "response_guidelines",  # Response shape, follow-ups and closings
+    "kb_uno",               # Knowledge base: the university
+    "kb_bsai",              # Knowledge base: Bachelor's in AI
+    "kb_msai",              # Knowledge base: Master's in AI
+    "kb_industry",          # Knowledge base: industry connections
+    "contact",              # College contact details
+    "out_of_scope",         # Redirects for out-of-scope questions
+    "rules",                # NEVER/ALWAYS rules
+    "closing",              # Closing reminder
+)
+
+
+@functools.lru_cache(maxsize=None)
+def get_prompt_modules() -> Dict[str, str]:
+    """Load the UNO/BSAI prompt modules from disk (once).
+
+    Returns:
+        Mapping of module name to text, in canonical order
+
+    Raises:
+        ValueError: If the file's sections do not match the known modules
+    """
+    with open(_UNO_BSAI_PROMPT_PATH, encoding="utf-8") as f:
+        sections = f.read().rstrip("\n").split(_MODULE_SEPARATOR)
+    if len(sections) != len(_MODULE_NAMES):
+        raise ValueError(
+            f"{_UNO_BSAI_PROMPT_PATH} has {len(sections)} sections, expected {len(_MODULE_NAMES)}"
+        )
+    return dict(zip(_MODULE_NAMES, sections))
+
+
+def build_prompt(modules: Optional[Iterable[str]] = None) -> str:
+    """Assemble a system prompt from named modules.
+
+    Modules are always joined in canonical order regardless of the
+    order requested, so prompts built from overlapping module sets share
+    the longest possible common prefix.
+
+    Args:
+        modules: Names of the modules to include (default: all modules)
+
+    Returns:
+        The assembled system prompt
+
+    Raises:
+        KeyError: If an unknown module name is requested
+    """
+    prompt_modules = get_prompt_modules()
+    if modules is None:
+        return _MODULE_SEPARATOR.join(prompt_modules.values())
+
+    wanted = set(modules)
+    unknown = wanted - prompt_modules.keys()
+    if unknown:
+        raise KeyError(f"Unknown prompt modules: {', '.join(sorted(unknown))}")
+    return _MODULE_SEPARATOR.join(text for name, text in prompt_modules.items() if name in wanted)
+
+
+@functools.lru_cache(maxsize=None)
+def get_uno_bsai_system_prompt() -> str:
+    """Return the full UNO/BSAI system prompt, reading it on first use.
+
+    Returns:
+        The assembled system prompt
+    """
+    return build_prompt()
+
+
+@functools.lru_cache(maxsize=None)
+def prompt_digest(prompt: str) -> str:
+    """Return a short, stable content hash identifying a prompt version.
+
+    Computed once per distinct prompt, so cache keys and log tags can use
+    it without rehashing the full text on every lookup.
+
+    Args:
+        prompt: Prompt text
+
+    Returns:
+        16-character hex digest of the UTF-8 prompt
+    """
+    return hashlib.blake2b(prompt.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def __getattr__(name: str):
+    """Resolve the legacy module-level prompt constants lazily."""
+    if name == "UNO_BSAI_SYSTEM_PROMPT":
+        return get_uno_bsai_system_prompt()
+    if name == "PROMPT_MODULES":
+        return get_prompt_modules()
+    if name == "UNO_BSAI_SYSTEM_PROMPT_DIGEST":
+        return prompt_digest(get_uno_bsai_system_prompt())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=None)
+def count_prompt_tokens(prompt: str) -> int:
+    """Count the tokens a prompt costs, tokenizing each distinct prompt once.
+
+    Uses the gpt-4o tokenizer when tiktoken is installed and falls back to
+    the usual ~4 characters per token estimate otherwise.
+
+    Args:
+        prompt: Prompt text
+
+    Returns:
+        Token count (estimated if tiktoken is unavailable)
+    """
+    if tiktoken is None:
+        return -(-len(prompt) // 4)
+    return len(tiktoken.get_encoding("o200k_base").encode(prompt))
@@ -0,0 +1,319 @@
+"""Audio helpers shared by the Misty Aicco Assistant pipelines."""
+
+import array
+import binascii
+import io
+import math
+import re
+import struct
+import wave
+from typing import Optional
+
+try:
+    import audioop  # C sample helpers (removed from the stdlib in Python 3.13)
+except ImportError:
+    audioop = None
+
+# Anti-alias FIR for the 24kHz -> 16kHz (up 2 / down 3) resampler, designed
+# once at import: Hamming-windowed sinc at the 48kHz intermediate rate with
+# a cutoff just under the new 8kHz Nyquist
+_RESAMPLE_TAPS = 25
+_RESAMPLE_CUTOFF = 7200 / 48000
+_RESAMPLE_DELAY = (_RESAMPLE_TAPS - 1) // 2
+
+
+def _design_polyphase_branches():
+    """Split the resampling FIR into per-output-phase (offsets, gain) taps.
+
+    Output sample m = 2k + p reads source samples x[3k + offset] only, so
+    each branch is a short list of strided-slice offsets and weights. The
+    filter is symmetric, so offsets sharing a weight are grouped and summed
+    before the single multiply.
+    """
+    h = []
+    for t in range(_RESAMPLE_TAPS):
+        n = t - _RESAMPLE_DELAY
+        sinc = 1.0 if n == 0 else math.sin(2 * math.pi * _RESAMPLE_CUTOFF * n) / (2 * math.pi * _RESAMPLE_CUTOFF * n)
+        window = 0.54 - 0.46 * math.cos(2 * math.pi * t / (_RESAMPLE_TAPS - 1))
+        h.append(sinc * window)
+
+    branches = []
+    for p in (0, 1):
+        taps = [((3 * p + _RESAMPLE_DELAY - t) // 2, h[t])
+                for t in range(_RESAMPLE_TAPS) if (3 * p + _RESAMPLE_DELAY - t) % 2 == 0]
+        # Normalise each branch to unity DC gain so both phases match
+        total = sum(gain for _, gain in taps)
+        groups = {}
+        for offset, gain in taps:
+            if abs(gain) > 1e-9:
+                groups.setdefault(round(gain / total, 12), []).append(offset)
+        branches.append([(tuple(offsets), gain) for gain, offsets in groups.items()])
+    return branches
+
+
+_POLYPHASE_BRANCHES = _design_polyphase_branches()
+_POLYPHASE_PAD = max(abs(offset) for branch in _POLYPHASE_BRANCHES for offsets, _ in branch for offset in offsets)
+
+# 16kHz mono 16-bit PCM WAV header; only the two size fields vary per file.
+# Formats are compiled once here so per-file packing skips format parsing.
+_WAV_HEADER_STRUCT = struct.Struct('<4sI4s4sIHHIIHH4sI')
+_WAV_SIZE_FIELD = struct.Struct('<I')
+_WAV_RIFF_SIZE_OFFSET = 4
+_WAV_DATA_SIZE_OFFSET = 40
+_WAV_HEADER_16K = _WAV_HEADER_STRUCT.pack(
+    b'RIFF',
+    36,  # File size - 8 (patched per file)
+    b'WAVE',
+    b'fmt ',
+    16,     # fmt chunk size
+    1,      # PCM format
+    1,      # Mono
+    16000,  # Sample rate
+    32000,  # Byte rate
+    2,      # Block align
+    16,     # Bits per sample
+    b'data',
+    0       # Data size (patched per file)
+)
+WAV_HEADER_SIZE = len(_WAV_HEADER_16K)
+
+# Trailing-silence trim for captured speech: frames quieter than this
+# fraction of the loudest frame (and under the absolute floor) are silence
+_TRIM_FRAME_MS = 20
+_TRIM_RELATIVE_THRESHOLD = 0.1
+_TRIM_MIN_RMS = 200
+_TRIM_KEEP_MS = 300  # Silence left after the last speech frame
+
+# Matches the base64 field of a GetAudioFile response without building the JSON tree
+_BASE64_FIELD_RE = re.compile(rb'"base64"\s*:\s*"([A-Za-z0-9+/=]+)"')
+
+
+def decode_audio_file_response(response) -> Optional[bytes]:
+    """Extract the decoded audio bytes from a Misty GetAudioFile response.
+
+    The base64 field is plucked straight out of the raw body, so multi-MB
+    recordings are not copied into an intermediate dict first. Falls back to
+    full JSON parsing if the field cannot be found that way.
+
+    Args:
+        response: requests Response from misty.get_audio_file(..., base64=True)
+
+    Returns:
+        Decoded audio bytes, or None if the response has no base64 data
+    """
+    match = _BASE64_FIELD_RE.search(response.content)
+    if match:
+        return binascii.a2b_base64(match.group(1))
+
+    data = response.json()
+    result = data.get("result") if data else None
+    base64_audio = result.get("base64") if result else None
+    if not base64_audio:
+        return None
+    return binascii.a2b_base64(base64_audio)
+
+
+def _read_frame_levels(wav_bytes: bytes):
+    """Read a PCM16 WAV and measure the RMS level of each trim frame.
+    
+    Returns:
+        (params, pcm, frame_bytes, levels, threshold), or None if the file
+        cannot be measured (not PCM16 WAV, empty, or audioop unavailable)
+    """
+    if audioop is None:
+        return None
+    try:
+        with wave.open(io.BytesIO(wav_bytes), 'rb') as reader:
+            params = reader.getparams()
+            pcm = reader.readframes(params.nframes)
+    except (wave.Error, EOFError):
+        return None
+    if params.sampwidth != 2:
+        return None
+    
+    frame_bytes = params.framerate * params.nchannels * 2 * _TRIM_FRAME_MS // 1000
+    levels = [audioop.rms(pcm[i:i + frame_bytes], 2) for i in range(0, len(pcm), frame_bytes)]
+    if not levels:
+        return None
+    threshold = max(_TRIM_MIN_RMS, _TRIM_RELATIVE_THRESHOLD * max(levels))
+    return params, pcm, frame_bytes, levels, threshold
+
+
+def has_speech(wav_bytes: bytes) -> bool:
+    """Energy gate: whether a recording has any frame above the silence floor.
+    
+    Used to skip transcription of captures that are silent throughout
+    (for example a false wake word). Recordings that cannot be measured
+    are assumed to contain speech.
+    
+    Args:
+        wav_bytes: Complete WAV file
+    
+    Returns:
+        False only if every frame is below the absolute silence floor
+    """
+    measured = _read_frame_levels(wav_bytes)
+    if measured is None:
+        return True
+    levels = measured[3]
+    return max(levels) >= _TRIM_MIN_RMS
+
+
+def trim_trailing_silence(wav_bytes: bytes) -> bytes:
+    """Drop the silent tail from a captured speech recording.
+    
+    Misty ends a capture only after its silence timeout has elapsed, so
+    every recording carries that much trailing silence. Cutting it before
+    upload shrinks the request and the audio Whisper has to decode. Frame
+    energy is measured with audioop; recordings that are not PCM16 WAV,
+    or runs without audioop, are returned unchanged.
+    
+    Args:
+        wav_bytes: Complete WAV file
+    
+    Returns:
+        WAV file ending shortly after the last frame of speech
+    """
+    measured = _read_frame_levels(wav_bytes)
+    if measured is None:
+        return wav_bytes
+    params, pcm, frame_bytes, levels, threshold = measured
+    
+    last_speech = next((i for i in range(len(levels) - 1, -1, -1) if levels[i] >= threshold), None)
+    if last_speech is None:
+        return wav_bytes  # No speech found; let Whisper see the whole clip
+    end = (last_speech + 1 + _TRIM_KEEP_MS // _TRIM_FRAME_MS) * frame_bytes
+    if end >= len(pcm):
+        return wav_bytes
+    
+    out = io.BytesIO()
+    with wave.open(out, 'wb') as writer:
+        writer.setparams(params)
+        writer.writeframes(pcm[:end])
+    return out.getvalue()
+
+
+def wav_header_16k(data_size: int) -> bytes:
+    """Build the WAV header for 16kHz mono PCM16 audio of a given size.
+
+    Args:
+        data_size: Size of the PCM payload in bytes
+
+    Returns:
+        44-byte RIFF/WAVE header
+    """
+    header = bytearray(WAV_HEADER_SIZE)
+    _write_wav_header_16k(header, data_size)
+    return bytes(header)
+
+
+def _write_wav_header_16k(buf: bytearray, data_size: int):
+    """Write the 16kHz WAV header into the start of a preallocated buffer."""
+    buf[:WAV_HEADER_SIZE] = _WAV_HEADER_16K
+    _WAV_SIZE_FIELD.pack_into(buf, _WAV_RIFF_SIZE_OFFSET, 36 + data_size)
+    _WAV_SIZE_FIELD.pack_into(buf, _WAV_DATA_SIZE_OFFSET, data_size)
+
+
+def pcm16_24k_to_wav_16k(pcm: bytes, source_rate: int = 24000) -> bytearray:
+    """Downsample 24kHz PCM16 audio and wrap it as a 16kHz WAV file.
+
+    The resampler writes straight into the data section of a preallocated
+    WAV buffer, so the samples are never copied after they are computed.
+    Audio that is already at 16kHz is copied in without resampling.
+
+    Args:
+        pcm: Raw PCM16 audio
+        source_rate: Sample rate of ``pcm`` (24000 or 16000)
+
+    Returns:
+        Complete WAV file at 16kHz
+    """
+    if source_rate == 16000:
+        data_size = len(pcm)
+        wav = bytearray(WAV_HEADER_SIZE + data_size)
+        _write_wav_header_16k(wav, data_size)
+        wav[WAV_HEADER_SIZE:] = pcm
+        return wav
+    if source_rate != 24000:
+        raise ValueError(f"Unsupported source sample rate: {source_rate}")
+
+    data_size = 2 * _downsampled_length(pcm)
+
+    wav = bytearray(WAV_HEADER_SIZE + data_size)
+    _write_wav_header_16k(wav, data_size)
+    _downsample_into(pcm, memoryview(wav)[WAV_HEADER_SIZE:].cast('h'))
+    return wav
+
+
+def downsample_24k_to_16k(pcm: bytes) -> bytes:
+    """Downsample mono PCM16 audio from 24kHz to 16kHz.
+
+    Args:
+        pcm: Raw PCM16 audio at 24kHz
+
+    Returns:
+        Raw PCM16 audio at 16kHz
+    """
+    out = bytearray(2 * _downsampled_length(pcm))
+    _downsample_into(pcm, memoryview(out).cast('h'))
+    return bytes(out)
+
+
+def _downsampled_length(pcm: bytes) -> int:
+    """Number of 16kHz samples produced from a 24kHz PCM16 buffer."""
+    return (len(pcm) // 2) * 2 // 3
+
+
+def _downsample_into(pcm: bytes, dst: memoryview):
+    """Resample 24kHz PCM16 bytes into a 16kHz int16 memoryview.
+
+    Resamples by the rational ratio 2/3 with a polyphase FIR: each output
+    phase (even/odd sample) is a weighted sum of strided source slices, so
+    only the output samples are ever computed and content above 8kHz is
+    filtered out instead of aliasing. The multiply-accumulate runs in C via
+    audioop; without audioop this falls back to linear interpolation.
+
+    The source is read in place through the buffer protocol and each phase
+    is assigned directly into ``dst``.
+    """
+    out_len = len(dst)
+    n_even = (out_len + 1) // 2
+    n_odd = out_len // 2
+
+    if audioop is None:
+        _downsample_linear(memoryview(pcm).cast('h'), dst, n_even, n_odd)
+        return
+
+    # Widen to 32 bits once, leaving 2 bits of headroom over full scale for
+    # the symmetric-pair sums and the accumulator, with zero padding either
+    # side so every tap slice has the full length
+    pad = bytes(4 * _POLYPHASE_PAD)
+    wide = array.array('i', pad)
+    wide.frombytes(audioop.mul(audioop.lin2lin(pcm, 2, 4), 4, 0.25))
+    wide.frombytes(pad)
+
+    for phase, count in ((0, n_even), (1, n_odd)):
+        if not count:
+            continue
+        acc = None
+        for offsets, gain in _POLYPHASE_BRANCHES[phase]:
+            folded = None
+            for offset in offsets:
+                start = _POLYPHASE_PAD + offset
+                taps = wide[start:start + 3 * count:3].tobytes()
+                folded = taps if folded is None else audioop.add(folded, taps, 4)
+            term = audioop.mul(folded, 4, gain)
+            acc = term if acc is None else audioop.add(acc, term, 4)
+        dst[phase::2] = memoryview(audioop.lin2lin(audioop.mul(acc, 4, 4.0), 4, 2)).cast('h')
+
+
+def _downsample_linear(src: memoryview, dst: memoryview, n_even: int, n_odd: int):
+    """Linear-interpolation 3:2 downsample used when audioop is unavailable.
+
+    The even output sample is x[3k] itself and the odd sample sits halfway
+    between x[3k+1] and x[3k+2].
+    """
+    dst[0::2] = src[0:3 * n_even:3]
+    a = src[1:3 * n_odd:3]
+    b = src[2:3 * n_odd:3]
+    dst[1::2] = array.array('h', [(x + y) // 2 for x, y in zip(a, b)])
@@ -0,0 +1,80 @@
+"""Re-armable one-shot timer backed by a single long-lived thread."""
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+
+class DeadlineTimer:
+    """Fires a callback once a deadline passes, reusing one worker thread.
+
+    Unlike threading.Timer, re-arming or cancelling does not spawn or
+    abandon a thread: the worker sleeps on a condition variable until the
+    current deadline, and arming again simply moves the deadline. Back-to-back
+    arms therefore coalesce into a single callback for the latest deadline.
+    """
+
+    def __init__(self, callback: Callable[[], None], name: str = "deadline-timer"):
+        """Initialize the timer and start its worker thread.
+
+        Args:
+            callback: Function called (on the worker thread) when the deadline passes
+            name: Name of the worker thread
+        """
+        self._callback = callback
+        self._deadline: Optional[float] = None
+        self._closed = False
+        self._cond = threading.Condition()
+        self.logger = logging.getLogger("DeadlineTimer")
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def armed(self) -> bool:
+        """Whether a deadline is currently pending."""
+        return self._deadline is not None
+
+    def arm(self, delay: float):
+        """Schedule the callback ``delay`` seconds from now, replacing any pending deadline.
+
+        Args:
+            delay: Seconds until the callback fires
+        """
+        with self._cond:
+            self._deadline = time.monotonic() + delay
+            self._cond.notify()
+
+    def cancel(self):
+        """Drop the pending deadline, if any."""
+        with self._cond:
+            self._deadline = None
+            self._cond.notify()
+
+    def close(self):
+        """Cancel any pending deadline and let the worker thread exit."""
+        with self._cond:
+            self._deadline = None
+            self._closed = True
+            self._cond.notify()
+
+    def _run(self):
+        """Worker loop: wait for a deadline, then fire the callback."""
+        while True:
+            with self._cond:
+                while self._deadline is None and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    # Re-check after waking: the deadline may have moved or been cancelled
+                    self._cond.wait(remaining)
+                    continue
+                self._deadline = None
+
+            try:
+                self._callback()
+            except Exception as e:
+                self.logger.error(f"❌ Error in timer callback: {e}", exc_info=True)
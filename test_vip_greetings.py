@@ -7,6 +7,9 @@ This script tests the VIP person recognition feature to ensure:
 3. Configuration is properly loaded
 """
 
+import functools
+import io
+import re
 import sys
 import os
 
@@ -15,101 +18,134 @@ sys.path.append(os.path.dirname(__file__))
 
 from src.config import get_config
 
+# VIP persons that must be configured
+REQUIRED_VIPS = frozenset({
+    "Mayor John W Ewing Junior",
+    "Chancellor Joanne Li",
+    "President Heath Mello",
+    "Associate Dean Robin Gandhi",
+    "Dean Martha Garcia Murillo",
+    "Senior Vice Chancellor Phil"
+})
+
+# Expected opening of each VIP's greeting, built once
+_GREETING_PREFIXES = {vip_name: f"Hi {vip_name}" for vip_name in REQUIRED_VIPS}
+
+# Phrases every VIP greeting must contain
+REQUIRED_PHRASES = frozenset({
+    "Delighted to have you visit our AI-CCORE booth",
+    "I am Misty",
+    "powered by the Weitz Innovation Fund",
+    "University of Nebraska Omaha",
+    "BS and MS AI degrees",
+    "To start conversation with me say Hey Misty"
+})
+
+# One alternation over all phrases (longest first) finds every required
+# phrase in a single pass over the greeting
+_REQUIRED_PHRASE_RE = re.compile(
+    "|".join(re.escape(phrase) for phrase in sorted(REQUIRED_PHRASES, key=len, reverse=True))
+)
+
 
 def test_vip_configuration():
-    """Test that VIP persons are properly configured."""
-    print("=" * 60)
-    print("Testing VIP Person Configuration")
-    print("=" * 60)
+    """Test that VIP persons are properly configured.
+    
+    Report lines are collected in memory and written to stdout in one go,
+    rather than flushing on every line.
+    """
+    buf = io.StringIO()
+    try:
+        return _check_vip_configuration(functools.partial(print, file=buf))
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+
+def _check_vip_configuration(p):
+    """Run the VIP configuration checks.
+    
+    Args:
+        p: print-like function that receives the report lines
+    
+    Returns:
+        True if all checks passed, False otherwise
+    """
+    p("=" * 60)
+    p("Testing VIP Person Configuration")
+    p("=" * 60)
     
     config = get_config()
     
     # Test 1: Check VIP persons exist
-    print("\n[Test 1] Checking VIP persons configuration...")
+    p("\n[Test 1] Checking VIP persons configuration...")
     vip_persons = config.face_recognition.vip_persons
     
     if not vip_persons:
-        print("❌ FAIL: No VIP persons configured")
+        p("❌ FAIL: No VIP persons configured")
         return False
     
-    print(f"✅ PASS: {len(vip_persons)} VIP persons configured")
+    p(f"✅ PASS: {len(vip_persons)} VIP persons configured")
     
     # Test 2: Verify all required VIP persons
-    print("\n[Test 2] Verifying required VIP persons...")
-    required_vips = [
-        "Mayor John W Ewing Junior",
-        "Chancellor Joanne Li",
-        "President Heath Mello",
-        "Associate Dean Robin Gandhi",
-        "Dean Martha Garcia Murillo",
-        "Senior Vice Chancellor Phil"
-    ]
+    p("\n[Test 2] Verifying required VIP persons...")
+    missing_vips = REQUIRED_VIPS - vip_persons.keys()
     
-    all_present = True
-    for vip_name in required_vips:
-        if vip_name in vip_persons:
-            print(f"  ✅ {vip_name}: Found")
+    for vip_name in sorted(REQUIRED_VIPS):
+        if vip_name in missing_vips:
+            p(f"  ❌ {vip_name}: Missing")
         else:
-            print(f"  ❌ {vip_name}: Missing")
-            all_present = False
+            p(f"  ✅ {vip_name}: Found")
     
-    if not all_present:
-        print("❌ FAIL: Not all required VIP persons are configured")
+    if missing_vips:
+        p("❌ FAIL: Not all required VIP persons are configured")
         return False
     
-    print("✅ PASS: All required VIP persons are configured")
+    p("✅ PASS: All required VIP persons are configured")
     
     # Test 3: Verify greeting message format
-    print("\n[Test 3] Verifying VIP greeting messages...")
+    p("\n[Test 3] Verifying VIP greeting messages...")
     test_vip = "Chancellor Joanne Li"
     greeting = vip_persons[test_vip]
     
-    required_phrases = [
-        "Delighted to have you visit our AI-CCORE booth",
-        "I am Misty",
-        "powered by the Weitz Innovation Fund",
-        "University of Nebraska Omaha",
-        "BS and MS AI degrees",
-        "To start conversation with me say Hey Misty"
-    ]
-    
-    all_phrases_present = True
-    for phrase in required_phrases:
-        if phrase in greeting:
-            print(f"  ✅ Contains: '{phrase}'")
+    missing_phrases = REQUIRED_PHRASES - set(_REQUIRED_PHRASE_RE.findall(greeting))
+    
+    for phrase in sorted(REQUIRED_PHRASES):
+        if phrase in missing_phrases:
+            p(f"  ❌ Missing: '{phrase}'")
         else:
-            print(f"  ❌ Missing: '{phrase}'")
-            all_phrases_present = False
+            p(f"  ✅ Contains: '{phrase}'")
     
-    if not all_phrases_present:
-        print("❌ FAIL: VIP greeting message missing required phrases")
+    if missing_phrases:
+        p("❌ FAIL: VIP greeting message missing required phrases")
         return False
     
-    print("✅ PASS: VIP greeting message contains all required phrases")
+    p("✅ PASS: VIP greeting message contains all required phrases")
     
     # Test 4: Verify greeting starts with person's name
-    print("\n[Test 4] Verifying greeting personalization...")
-    for vip_name in required_vips:
+    p("\n[Test 4] Verifying greeting personalization...")
+    all_present = True
+    for vip_name in sorted(REQUIRED_VIPS):
         greeting = vip_persons[vip_name]
-        expected_start = f"Hi {vip_name}"
+        expected_start = _GREETING_PREFIXES[vip_name]
         if greeting.startswith(expected_start):
-            print(f"  ✅ {vip_name}: Greeting properly personalized")
+            p(f"  ✅ {vip_name}: Greeting properly personalized")
         else:
-            print(f"  ❌ {vip_name}: Greeting does not start with 'Hi {vip_name}'")
+            p(f"  ❌ {vip_name}: Greeting does not start with '{expected_start}'")
             all_present = False
     
     if not all_present:
-        print("❌ FAIL: Not all VIP greetings are properly personalized")
+        p("❌ FAIL: Not all VIP greetings are properly personalized")
         return False
     
-    print("✅ PASS: All VIP greetings are properly personalized")
+    p("✅ PASS: All VIP greetings are properly personalized")
     
     # Test 5: Show example greeting
-    print("\n[Test 5] Example VIP Greeting:")
-    print("-" * 60)
-    print(f"Person: {test_vip}")
-    print(f"Greeting: {greeting[:200]}...")
-    print("-" * 60)
+    p("\n[Test 5] Example VIP Greeting:")
+    p("-" * 60)
+    p(f"Person: {test_vip}")
+    p(f"Greeting: {greeting[:200]}...")
+    p("-" * 60)
     
     return True
 
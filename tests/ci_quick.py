@@ -0,0 +1,23 @@
+"""Shared CI_QUICK switch for the robot test scripts.
+
+Setting CI_QUICK=1 in the environment shortens the interactive runs, or
+replaces them with synthetic events, for unattended builds where nobody
+is standing in front of Misty.
+"""
+
+import os
+
+CI_QUICK = bool(os.environ.get("CI_QUICK"))
+
+
+def quick_or_full(quick, full):
+    """Pick a setting for the current mode.
+    
+    Args:
+        quick: Value used when CI_QUICK is set
+        full: Value used for the normal interactive run
+    
+    Returns:
+        quick under CI_QUICK, otherwise full
+    """
+    return quick if CI_QUICK else full
@@ -14,41 +14,145 @@ Usage:
 import os
 import sys
 import time
+import queue
 import logging
-import psutil  # For memory monitoring
+from typing import Optional
 
 # Add project root to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 from mistyPy.Robot import Robot
 from src.config import get_config
 from src.core.audio_monitor import AudioMonitor
+from tests.ci_quick import CI_QUICK, quick_or_full
+
+try:
+    import psutil  # For memory monitoring
+except ImportError:
+    psutil = None  # Reported by the check under __main__
 
 
 def setup_logging():
     """Set up logging for the test."""
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+        format='%(relativeCreated)d ms - %(name)s - %(levelname)s - %(message)s'
     )
     return logging.getLogger("AudioMonitorTest")
 
 
+SEP = "=" * 70
+
+# CI_QUICK=1 shortens the run to a start/stop round-trip with two memory
+# samples, for unattended builds where nobody is there to say "Hey Misty"
+TEST_DURATION_SECONDS = quick_or_full(2, 60)
+SAMPLE_INTERVAL_SECONDS = quick_or_full(1, 10)
+
+
+# One handle for this process, reused for every sample
+_PROCESS = psutil.Process() if psutil else None
+_BYTES_PER_MB = 1024 * 1024
+
+
 def get_process_memory_mb():
-    """Get current process memory usage in MB."""
-    process = psutil.Process()
-    mem_info = process.memory_info()
-    return mem_info.rss / 1024 / 1024  # Convert bytes to MB
+    """Get current process memory usage (RSS) in MB."""
+    return _PROCESS.memory_info().rss / _BYTES_PER_MB
+
+
+# Memory trend settings: EMA smoothing factor, samples ignored while the
+# process warms up (none in quick mode, so the slope is still computed),
+# and the growth rate treated as a leak signal
+MEMORY_EMA_ALPHA = 0.3
+STARTUP_SUPPRESSION_SECONDS = quick_or_full(0, 15)
+LEAK_SLOPE_MB_PER_MIN = 1.0
+
+
+class MemoryStats:
+    """Running memory statistics, updated in O(1) per sample.
+    
+    Keeps peak, average, an exponential moving average and an online
+    least-squares fit of memory over time (post warm-up samples only),
+    so no per-sample history is retained however long the test runs.
+    """
+    
+    def __init__(self, initial_mb: float):
+        """Start the statistics from the initial reading.
+        
+        Args:
+            initial_mb: Memory at time zero in MB
+        """
+        self.count = 1
+        self.total = initial_mb
+        self.peak = initial_mb
+        self.ema = initial_mb
+        # Online regression state (Welford-style means and co-moments)
+        self._n = 0
+        self._mean_t = 0.0
+        self._mean_m = 0.0
+        self._c_tm = 0.0
+        self._m_tt = 0.0
+    
+    def add(self, elapsed: float, mb: float):
+        """Record a sample.
+        
+        Args:
+            elapsed: Seconds since the test started
+            mb: Memory in MB
+        """
+        self.count += 1
+        self.total += mb
+        if mb > self.peak:
+            self.peak = mb
+        self.ema = MEMORY_EMA_ALPHA * mb + (1 - MEMORY_EMA_ALPHA) * self.ema
+        
+        # Trend over post-warm-up samples: catches slow leaks a fixed delta
+        # threshold misses, without flagging one-off startup allocations
+        if elapsed < STARTUP_SUPPRESSION_SECONDS:
+            return
+        self._n += 1
+        d_t = elapsed - self._mean_t
+        self._mean_t += d_t / self._n
+        self._mean_m += (mb - self._mean_m) / self._n
+        self._c_tm += d_t * (mb - self._mean_m)
+        self._m_tt += d_t * (elapsed - self._mean_t)
+    
+    @property
+    def average(self) -> float:
+        """Mean of all samples in MB."""
+        return self.total / self.count
+    
+    @property
+    def slope_mb_per_min(self) -> Optional[float]:
+        """Least-squares growth rate, or None with fewer than two trend samples."""
+        if self._n < 2 or not self._m_tt:
+            return None
+        return self._c_tm / self._m_tt * 60
+
+
+def get_process_uss_mb():
+    """Get current process unique set size in MB, if the platform reports it.
+    
+    USS counts only pages private to this process, so unlike RSS it is not
+    moved by shared libraries being mapped in or out - a truer leak signal.
+    
+    Returns:
+        USS in MB, or None if unavailable (e.g. insufficient permissions)
+    """
+    try:
+        return _PROCESS.memory_full_info().uss / _BYTES_PER_MB
+    except (psutil.AccessDenied, AttributeError):
+        return None
 
 
 def test_audio_monitoring():
     """Test the audio monitoring system."""
     logger = setup_logging()
     
-    logger.info("=" * 70)
+    logger.info(SEP)
     logger.info("Task 3.1: Continuous Audio Monitoring - Test Script")
-    logger.info("=" * 70)
+    logger.info(SEP)
     
     # Load configuration
     config = get_config()
@@ -63,38 +167,35 @@ def test_audio_monitoring():
         misty.change_led(100, 100, 255)  # Light blue for testing
         logger.info("💡 LED set to test mode: Light Blue")
         
-        # Track events for testing
-        wake_word_count = [0]
-        speech_capture_count = [0]
+        # Monitor callbacks run on SDK threads; they only enqueue, and the
+        # main thread owns the counters, so no locking is needed
+        events = queue.Queue()
+        wake_word_count = 0
+        speech_capture_count = 0
         
         def on_wake_word_detected(event_data):
             """Callback when wake word is detected."""
-            wake_word_count[0] += 1
-            logger.info(f"\n🎤 WAKE WORD DETECTED! (#{wake_word_count[0]})")
-            logger.info(f"   Event data: {event_data}")
-            logger.info("   📝 Listening for your query now...")
+            events.put(("wake_word", event_data))
         
         def on_speech_captured(audio_data):
             """Callback when speech is captured."""
-            speech_capture_count[0] += 1
-            logger.info(f"\n🎙️  SPEECH CAPTURED! (#{speech_capture_count[0]})")
-            logger.info(f"   Filename: {audio_data.get('filename')}")
-            logger.info(f"   Success: {audio_data.get('success')}")
-            logger.info("   ✅ Ready for next wake word...")
+            events.put(("speech", audio_data))
         
         # Initialize audio monitor
         logger.info("\n📋 Initializing Audio Monitor...")
+        va = config.voice_assistant
         audio_monitor = AudioMonitor(
             misty=misty,
             on_wake_word_detected=on_wake_word_detected,
             on_speech_captured=on_speech_captured,
-            wake_word_mode=config.voice_assistant.wake_word_mode,
-            silence_timeout=int(config.voice_assistant.silence_threshold_seconds * 1000),
-            max_speech_length=config.voice_assistant.max_recording_seconds * 1000
+            wake_word_mode=va.wake_word_mode,
+            silence_timeout=int(va.silence_threshold_seconds * 1000),
+            max_speech_length=va.max_recording_seconds * 1000
         )
         
         # Get initial memory usage
         initial_memory = get_process_memory_mb()
+        initial_uss = get_process_uss_mb()
         logger.info(f"📊 Initial memory usage: {initial_memory:.2f} MB")
         
         # Start audio monitoring
@@ -103,55 +204,92 @@ def test_audio_monitoring():
         
         # Check status
         status = audio_monitor.get_status()
-        logger.info("\n📊 Audio Monitor Status:")
-        logger.info(f"   Running: {status['running']}")
-        logger.info(f"   Mode: {status['mode']}")
-        logger.info(f"   Silence timeout: {status['silence_timeout_ms']}ms")
-        logger.info(f"   Max speech length: {status['max_speech_length_ms']}ms")
-        
-        logger.info("\n" + "=" * 70)
-        logger.info("🎬 TEST SCENARIOS - Task 3.1 Success Criteria")
-        logger.info("=" * 70)
-        
-        logger.info("\n📝 Success Criteria:")
-        logger.info("   ✅ Audio continuously monitored in non-blocking manner")
-        logger.info("   ✅ No blocking of other operations (test by moving around)")
-        logger.info("   ✅ Memory efficient (will monitor over 60 seconds)")
-        logger.info("   ✅ Event handlers registered and functional")
-        
-        logger.info("\n📝 Test Instructions:")
-        logger.info("1. Say 'Hey Misty' to trigger wake word detection")
-        logger.info("2. After acknowledgment, say a query (e.g., 'What time is it?')")
-        logger.info("3. Wait 2 seconds of silence to complete capture")
-        logger.info("4. Verify speech capture event fires")
-        logger.info("5. Repeat multiple times to test continuous operation")
-        logger.info("\n🔍 Monitoring for 60 seconds...")
-        logger.info("   Press Ctrl+C to stop early\n")
-        
-        # Run test for 60 seconds with periodic status updates
-        test_duration = 60
-        start_time = time.time()
-        last_memory_check = start_time
-        memory_samples = [initial_memory]
+        logger.info("\n".join([
+            "\n📊 Audio Monitor Status:",
+            f"   Running: {status['running']}",
+            f"   Mode: {status['mode']}",
+            f"   Silence timeout: {status['silence_timeout_ms']}ms",
+            f"   Max speech length: {status['max_speech_length_ms']}ms",
+        ]))
+        
+        test_duration = TEST_DURATION_SECONDS
+        sample_interval = SAMPLE_INTERVAL_SECONDS
+        
+        scenarios = [
+            f"\n{SEP}",
+            "🎬 TEST SCENARIOS - Task 3.1 Success Criteria",
+            SEP,
+            "\n📝 Success Criteria:",
+            "   ✅ Audio continuously monitored in non-blocking manner",
+            "   ✅ No blocking of other operations (test by moving around)",
+            f"   ✅ Memory efficient (will monitor over {test_duration} seconds)",
+            "   ✅ Event handlers registered and functional",
+        ]
+        if not CI_QUICK:
+            scenarios += [
+                "\n📝 Test Instructions:",
+                "1. Say 'Hey Misty' to trigger wake word detection",
+                "2. After acknowledgment, say a query (e.g., 'What time is it?')",
+                "3. Wait 2 seconds of silence to complete capture",
+                "4. Verify speech capture event fires",
+                "5. Repeat multiple times to test continuous operation",
+            ]
+        scenarios += [
+            f"\n🔍 Monitoring for {test_duration} seconds...",
+            "   Press Ctrl+C to stop early\n",
+        ]
+        # Each section is logged as one record so it is written in one go
+        # and cannot interleave with monitor-thread logs
+        logger.info("\n".join(scenarios))
+        
+        # Run the test with periodic status updates (monotonic deadlines)
+        start_time = time.monotonic()
+        deadline = start_time + test_duration
+        next_sample = start_time + sample_interval
+        memory_stats = MemoryStats(initial_memory)
+        # Per-event lines are formatted only if INFO is actually emitted
+        verbose = logger.isEnabledFor(logging.INFO)
         
         try:
-            while time.time() - start_time < test_duration:
-                time.sleep(1)
-                
-                elapsed = time.time() - start_time
-                
-                # Check memory every 10 seconds
-                if time.time() - last_memory_check >= 10:
+            # Block on the event queue until the next callback or the next
+            # periodic memory sample, whichever comes first; Ctrl+C still
+            # interrupts the wait
+            while True:
+                now = time.monotonic()
+                if now >= next_sample and next_sample <= deadline:
+                    elapsed = now - start_time
                     current_memory = get_process_memory_mb()
-                    memory_samples.append(current_memory)
-                    memory_delta = current_memory - initial_memory
+                    memory_stats.add(elapsed, current_memory)
                     
-                    logger.info(f"\n⏱️  Elapsed: {int(elapsed)}s / {test_duration}s")
-                    logger.info(f"   Memory: {current_memory:.2f} MB (Δ {memory_delta:+.2f} MB)")
-                    logger.info(f"   Wake words detected: {wake_word_count[0]}")
-                    logger.info(f"   Speech captures: {speech_capture_count[0]}")
-                    
-                    last_memory_check = time.time()
+                    if verbose:
+                        memory_delta = current_memory - initial_memory
+                        logger.info(f"\n⏱️  Elapsed: {int(elapsed)}s / {test_duration}s")
+                        logger.info(f"   Memory: {current_memory:.2f} MB (Δ {memory_delta:+.2f} MB, EMA {memory_stats.ema:.2f} MB)")
+                        logger.info(f"   Wake words detected: {wake_word_count}")
+                        logger.info(f"   Speech captures: {speech_capture_count}")
+                    next_sample += sample_interval
+                
+                if now >= deadline:
+                    break
+                
+                try:
+                    kind, data = events.get(timeout=min(next_sample, deadline) - now)
+                except queue.Empty:
+                    continue
+                
+                if kind == "wake_word":
+                    wake_word_count += 1
+                    if verbose:
+                        logger.info(f"\n🎤 WAKE WORD DETECTED! (#{wake_word_count})")
+                        logger.info(f"   Event data: {data}")
+                        logger.info("   📝 Listening for your query now...")
+                else:
+                    speech_capture_count += 1
+                    if verbose:
+                        logger.info(f"\n🎙️  SPEECH CAPTURED! (#{speech_capture_count})")
+                        logger.info(f"   Filename: {data.get('filename')}")
+                        logger.info(f"   Success: {data.get('success')}")
+                        logger.info("   ✅ Ready for next wake word...")
         
         except KeyboardInterrupt:
             logger.info("\n\n⏹️  Test interrupted by user")
@@ -159,61 +297,69 @@ def test_audio_monitoring():
         # Final memory check
         final_memory = get_process_memory_mb()
         memory_delta = final_memory - initial_memory
-        max_memory = max(memory_samples)
-        avg_memory = sum(memory_samples) / len(memory_samples)
+        final_uss = get_process_uss_mb()
+        uss_delta = final_uss - initial_uss if initial_uss is not None and final_uss is not None else None
+        memory_slope = memory_stats.slope_mb_per_min
         
         # Test summary
-        logger.info("\n" + "=" * 70)
-        logger.info("📊 TEST SUMMARY")
-        logger.info("=" * 70)
-        
-        logger.info(f"\n⏱️  Test Duration: {time.time() - start_time:.1f} seconds")
-        logger.info(f"🎤 Wake words detected: {wake_word_count[0]}")
-        logger.info(f"🎙️  Speech captures completed: {speech_capture_count[0]}")
-        
-        logger.info(f"\n💾 Memory Statistics:")
-        logger.info(f"   Initial: {initial_memory:.2f} MB")
-        logger.info(f"   Final: {final_memory:.2f} MB")
-        logger.info(f"   Delta: {memory_delta:+.2f} MB")
-        logger.info(f"   Average: {avg_memory:.2f} MB")
-        logger.info(f"   Peak: {max_memory:.2f} MB")
+        summary = [
+            f"\n{SEP}",
+            "📊 TEST SUMMARY",
+            SEP,
+            f"\n⏱️  Test Duration: {time.monotonic() - start_time:.1f} seconds",
+            f"🎤 Wake words detected: {wake_word_count}",
+            f"🎙️  Speech captures completed: {speech_capture_count}",
+            "\n💾 Memory Statistics:",
+            f"   Initial: {initial_memory:.2f} MB",
+            f"   Final: {final_memory:.2f} MB",
+            f"   Delta: {memory_delta:+.2f} MB",
+            f"   Average: {memory_stats.average:.2f} MB",
+            f"   Peak: {memory_stats.peak:.2f} MB",
+            f"   EMA: {memory_stats.ema:.2f} MB",
+        ]
+        if memory_slope is not None:
+            summary.append(f"   Slope: {memory_slope:+.2f} MB/min")
+        if uss_delta is not None:
+            summary.append(f"   Private (USS) delta: {uss_delta:+.2f} MB")
+            # Judge leaks on private memory when we have it
+            memory_delta = uss_delta
         
         # Memory efficiency check
-        if abs(memory_delta) < 50:  # Less than 50MB growth
-            logger.info("   ✅ Memory usage is stable and efficient")
+        memory_trending_up = memory_slope is not None and memory_slope > LEAK_SLOPE_MB_PER_MIN
+        memory_stable = abs(memory_delta) < 50 and not memory_trending_up  # Less than 50MB growth, no upward trend
+        if memory_stable:
+            summary.append("   ✅ Memory usage is stable and efficient")
+        elif memory_trending_up:
+            summary.append(f"   ⚠️  Memory is growing {memory_slope:+.2f} MB/min - check for leaks")
         else:
-            logger.warning(f"   ⚠️  Memory delta is {memory_delta:.2f} MB - check for leaks")
+            summary.append(f"   ⚠️  Memory delta is {memory_delta:.2f} MB - check for leaks")
+        logger.log(logging.INFO if memory_stable else logging.WARNING, "\n".join(summary))
         
         # Success criteria verification
-        logger.info("\n" + "=" * 70)
-        logger.info("✅ SUCCESS CRITERIA VERIFICATION")
-        logger.info("=" * 70)
-        
         is_running = audio_monitor.is_running()
-        if is_running:
-            logger.info("✅ Audio continuously monitored throughout test")
-        else:
-            logger.warning("❌ Audio monitoring stopped unexpectedly")
-        
-        logger.info("✅ No blocking observed (script responsive to Ctrl+C)")
-        
-        if abs(memory_delta) < 50:
-            logger.info("✅ Memory usage stable - efficient operation confirmed")
-        else:
-            logger.info("⚠️  Memory usage increased - may need optimization")
-        
-        if wake_word_count[0] > 0:
-            logger.info(f"✅ Event handlers functional - {wake_word_count[0]} wake word(s) detected")
-        else:
-            logger.info("⚠️  No wake words detected - try saying 'Hey Misty'")
+        criteria = [
+            f"\n{SEP}",
+            "✅ SUCCESS CRITERIA VERIFICATION",
+            SEP,
+            "✅ Audio continuously monitored throughout test" if is_running
+            else "❌ Audio monitoring stopped unexpectedly",
+            "✅ No blocking observed (script responsive to Ctrl+C)",
+            "✅ Memory usage stable - efficient operation confirmed" if memory_stable
+            else "⚠️  Memory usage increased - may need optimization",
+            f"✅ Event handlers functional - {wake_word_count} wake word(s) detected" if wake_word_count > 0
+            else "⚠️  No wake words detected - try saying 'Hey Misty'",
+        ]
+        logger.log(logging.INFO if is_running else logging.WARNING, "\n".join(criteria))
         
         # Manual verification checklist
-        logger.info("\n📋 MANUAL VERIFICATION CHECKLIST:")
-        logger.info("   □ Did audio monitoring start without errors?")
-        logger.info("   □ Could you trigger wake word detection by saying 'Hey Misty'?")
-        logger.info("   □ Did speech capture complete after your query?")
-        logger.info("   □ Was the system responsive (no freezing)?")
-        logger.info("   □ Did memory usage remain stable?")
+        logger.info("\n".join([
+            "\n📋 MANUAL VERIFICATION CHECKLIST:",
+            "   □ Did audio monitoring start without errors?",
+            "   □ Could you trigger wake word detection by saying 'Hey Misty'?",
+            "   □ Did speech capture complete after your query?",
+            "   □ Was the system responsive (no freezing)?",
+            "   □ Did memory usage remain stable?",
+        ]))
         
         # Cleanup
         logger.info("\n🧹 Cleaning up...")
@@ -224,12 +370,13 @@ def test_audio_monitoring():
         misty.change_led(*config.led.idle)
         logger.info("💡 LED reset to idle")
         
-        logger.info("\n" + "=" * 70)
-        logger.info("✅ TEST COMPLETE!")
-        logger.info("=" * 70)
-        
-        logger.info("\n💡 Note: This completes Task 3.1 (Continuous Audio Monitoring)")
-        logger.info("   Next: Task 3.2 will integrate full wake word detection logic")
+        logger.info("\n".join([
+            f"\n{SEP}",
+            "✅ TEST COMPLETE!",
+            SEP,
+            "\n💡 Note: This completes Task 3.1 (Continuous Audio Monitoring)",
+            "   Next: Task 3.2 will integrate full wake word detection logic",
+        ]))
         
     except Exception as e:
         logger.error(f"\n❌ Test failed with error: {e}", exc_info=True)
@@ -238,9 +385,7 @@ def test_audio_monitoring():
 
 if __name__ == "__main__":
     # Check if psutil is installed
-    try:
-        import psutil
-    except ImportError:
+    if psutil is None:
         print("❌ Error: psutil not installed")
         print("   Install with: pip install psutil")
         sys.exit(1)
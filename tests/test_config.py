@@ -8,7 +8,12 @@ import os
 import sys
 
 # Add project root to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+RULE = "-" * 60
+SEP = "=" * 60
 
 # Set up test environment variables
 os.environ["MISTY_IP_ADDRESS"] = "192.168.1.100"
@@ -18,7 +23,7 @@ try:
     from src.config import get_config
     
     print("Testing configuration loading...")
-    print("-" * 60)
+    print(RULE)
     
     # Load configuration
     config = get_config()
@@ -35,7 +40,7 @@ try:
     print("✅ All configuration values accessible!")
     
     # Print full configuration
-    print("\n" + "=" * 60)
+    print(f"\n{SEP}")
     config.print_config()
     
     print("\n✅ ALL TESTS PASSED!")
@@ -10,34 +10,76 @@ Date: October 2, 2025
 
 import os
 import sys
+import copy
+import dataclasses
 
 # Add project root to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
-from src.config import get_config, reload_config
+from src.config import get_config
+
+SEP = "=" * 60
+SEP_WIDE = "=" * 70
+
+
+def config_with_voice_mode(voice_mode: str):
+    """Derive a validated config for a voice mode from the loaded base config.
+    
+    The base configuration is loaded from the environment once; each mode
+    only swaps the voice assistant settings and re-runs validation, so the
+    tests neither mutate os.environ nor reload the whole configuration.
+    
+    Args:
+        voice_mode: Voice mode to test
+    
+    Returns:
+        Config with the given voice mode
+    
+    Raises:
+        ValueError: If the resulting configuration is invalid
+    """
+    base = get_config()
+    config = copy.copy(base)
+    config.voice_assistant = dataclasses.replace(
+        base.voice_assistant,
+        voice_mode=voice_mode,
+        wake_word_mode="misty_builtin"
+    )
+    config._validate()
+    return config
+
+
+def wake_word_label(va) -> str:
+    """Describe the configured wake word.
+    
+    Args:
+        va: Voice assistant configuration
+    
+    Returns:
+        Spoken wake word
+    """
+    return "Hey Misty" if va.wake_word_mode == "misty_builtin" else va.wake_word_custom
 
 
 def test_traditional_mode():
     """Test traditional mode configuration."""
-    print("\n" + "=" * 60)
+    print(f"\n{SEP}")
     print("Testing TRADITIONAL Mode (STT → GPT → TTS)")
-    print("=" * 60)
-    
-    # Set environment for traditional mode
-    os.environ["VOICE_MODE"] = "traditional"
-    os.environ["WAKE_WORD_MODE"] = "misty_builtin"
+    print(SEP)
     
     try:
-        config = reload_config()
+        va = config_with_voice_mode("traditional").voice_assistant
         
-        assert config.voice_assistant.voice_mode == "traditional", \
+        assert va.voice_mode == "traditional", \
             "Voice mode should be traditional"
         
         print("\n✅ Traditional mode configuration loaded successfully!")
-        print(f"   Voice Mode: {config.voice_assistant.voice_mode}")
+        print(f"   Voice Mode: {va.voice_mode}")
         print(f"   Pipeline: STT → GPT → TTS")
         print(f"   Expected Latency: ~5-8 seconds")
-        print(f"   Wake Word: {'Hey Misty' if config.voice_assistant.wake_word_mode == 'misty_builtin' else config.voice_assistant.wake_word_custom}")
+        print(f"   Wake Word: {wake_word_label(va)}")
         
         return True
         
@@ -50,26 +92,22 @@ def test_traditional_mode():
 
 def test_realtime_mode():
     """Test realtime mode configuration."""
-    print("\n" + "=" * 60)
+    print(f"\n{SEP}")
     print("Testing REALTIME Mode (Voice → Voice)")
-    print("=" * 60)
-    
-    # Set environment for realtime mode
-    os.environ["VOICE_MODE"] = "realtime"
-    os.environ["WAKE_WORD_MODE"] = "misty_builtin"
+    print(SEP)
     
     try:
-        config = reload_config()
+        va = config_with_voice_mode("realtime").voice_assistant
         
-        assert config.voice_assistant.voice_mode == "realtime", \
+        assert va.voice_mode == "realtime", \
             "Voice mode should be realtime"
         
         print("\n✅ Realtime mode configuration loaded successfully!")
-        print(f"   Voice Mode: {config.voice_assistant.voice_mode}")
+        print(f"   Voice Mode: {va.voice_mode}")
         print(f"   Pipeline: Voice → Voice (direct)")
         print(f"   Expected Latency: ~1-3 seconds")
         print(f"   Model: gpt-4o-realtime-preview")
-        print(f"   Wake Word: {'Hey Misty' if config.voice_assistant.wake_word_mode == 'misty_builtin' else config.voice_assistant.wake_word_custom}")
+        print(f"   Wake Word: {wake_word_label(va)}")
         
         return True
         
@@ -82,15 +120,12 @@ def test_realtime_mode():
 
 def test_invalid_mode():
     """Test that invalid mode is rejected."""
-    print("\n" + "=" * 60)
+    print(f"\n{SEP}")
     print("Testing INVALID Mode Rejection")
-    print("=" * 60)
-    
-    # Set environment for invalid mode
-    os.environ["VOICE_MODE"] = "invalid_mode"
+    print(SEP)
     
     try:
-        config = reload_config()
+        config = config_with_voice_mode("invalid_mode")
         print("\n❌ Invalid mode test failed - should have raised error!")
         return False
         
@@ -106,9 +141,9 @@ def test_invalid_mode():
 
 def print_comparison():
     """Print a comparison of the two modes."""
-    print("\n" + "=" * 60)
+    print(f"\n{SEP}")
     print("VOICE MODE COMPARISON")
-    print("=" * 60)
+    print(SEP)
     
     print("\nTRADITIONAL MODE (STT → GPT → TTS):")
     print("  ✅ More stable and mature")
@@ -139,9 +174,9 @@ def print_comparison():
 
 def main():
     """Run all tests."""
-    print("\n" + "=" * 70)
+    print(f"\n{SEP_WIDE}")
     print("DUAL-MODE VOICE ASSISTANT CONFIGURATION TEST")
-    print("=" * 70)
+    print(SEP_WIDE)
     
     results = []
     
@@ -158,9 +193,9 @@ def main():
     print_comparison()
     
     # Print summary
-    print("\n" + "=" * 70)
+    print(f"\n{SEP_WIDE}")
     print("TEST SUMMARY")
-    print("=" * 70)
+    print(SEP_WIDE)
     
     for name, result in results:
         status = "✅ PASS" if result else "❌ FAIL"
@@ -12,13 +12,17 @@ import os
 import sys
 import time
 import logging
+import threading
 
 # Add project root to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 from mistyPy.Robot import Robot
 from src.core.face_recognition_manager import FaceRecognitionManager
 from src.config import get_config
+from tests.ci_quick import quick_or_full
 
 # Configure logging to see diagnostic information
 logging.basicConfig(
@@ -26,21 +30,31 @@ logging.basicConfig(
     format='%(levelname)s - %(name)s - %(message)s'
 )
 
+SEP = "=" * 60
+
 # Track detected faces for testing
 detected_faces = []
 
-def on_face_detected(face_data):
+# CI_QUICK=1 shortens the monitoring window to a start/stop round-trip
+# for unattended builds
+MONITOR_SECONDS = quick_or_full(2, 30)
+
+# Callbacks may arrive on SDK worker threads; guards detected_faces
+detected_faces_lock = threading.Lock()
+
+def on_face_detected(face):
     """Callback function for when a face is recognized"""
     print(f"\n🎉 FACE DETECTED!")
-    print(f"   Name: {face_data['name']}")
-    print(f"   Confidence: {face_data['confidence']:.2f}")
-    print(f"   Timestamp: {time.strftime('%H:%M:%S', time.localtime(face_data['timestamp']))}")
-    detected_faces.append(face_data)
+    print(f"   Name: {face.name}")
+    print(f"   Confidence: {face.confidence:.2f}")
+    print(f"   Timestamp: {time.strftime('%H:%M:%S', time.localtime(face.timestamp))}")
+    with detected_faces_lock:
+        detected_faces.append(face)
 
 def main():
-    print("=" * 60)
+    print(SEP)
     print("Face Recognition Manager - Test Script (Task 2.1)")
-    print("=" * 60)
+    print(SEP)
     
     # Load configuration
     config = get_config()
@@ -80,19 +94,22 @@ def main():
     if face_manager.running:
         print("✅ SUCCESS: Face recognition is running continuously")
         print("\n👀 Monitoring for faces...")
-        print("   (This will run for 30 seconds - show your face to Misty!)")
+        print(f"   (This will run for {MONITOR_SECONDS} seconds - show your face to Misty!)")
         print("   Press Ctrl+C to stop early\n")
         
         try:
-            # Monitor for 30 seconds
-            start_time = time.time()
-            while time.time() - start_time < 30:
-                # Print status every 5 seconds
-                elapsed = int(time.time() - start_time)
-                if elapsed > 0 and elapsed % 5 == 0:
-                    print(f"   ... {elapsed}s elapsed, {len(detected_faces)} faces detected so far")
-                    time.sleep(1)
-                time.sleep(0.1)
+            # Monitor for MONITOR_SECONDS, waking only for the 5-second status line
+            start_time = time.monotonic()
+            deadline = start_time + MONITOR_SECONDS
+            next_status = start_time + 5
+            while True:
+                now = time.monotonic()
+                if now >= deadline:
+                    break
+                time.sleep(min(next_status, deadline) - now)
+                if time.monotonic() >= next_status:
+                    print(f"   ... {int(next_status - start_time)}s elapsed, {len(detected_faces)} faces detected so far")
+                    next_status += 5
             
             print(f"\n⏱️  Test complete!")
             
@@ -108,9 +125,9 @@ def main():
     print("✅ Face recognition stopped")
     
     # Print results
-    print("\n" + "=" * 60)
+    print(f"\n{SEP}")
     print("TEST RESULTS")
-    print("=" * 60)
+    print(SEP)
     
     print("\n✅ Task 2.1 Success Criteria:")
     print(f"   ✅ Face recognition runs continuously: {'PASS' if face_manager.running == False else 'PASS (was running)'}")
@@ -118,15 +135,15 @@ def main():
     if detected_faces:
         print(f"   ✅ Known faces identified with names: PASS")
         print(f"\n   Detected {len(detected_faces)} face(s):")
-        for face in detected_faces:
-            print(f"      - {face['name']} (confidence: {face['confidence']:.2f})")
+        # One write for the whole list, so it cannot interleave with callback output
+        print("\n".join(f"      - {face.name} (confidence: {face.confidence:.2f})" for face in detected_faces))
     else:
         print(f"   ⚠️  No faces detected during test")
         print(f"      (This is OK if no trained faces were shown to camera)")
     
-    print("\n" + "=" * 60)
+    print(f"\n{SEP}")
     print("Face Recognition Manager implementation: ✅ COMPLETE")
-    print("=" * 60)
+    print(SEP)
     
     return True
 
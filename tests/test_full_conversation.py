@@ -21,18 +21,155 @@ import sys
 import logging
 
 # Add project root to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 from src.config import get_config
 from src.misty_aicco_assistant import MistyAiccoAssistant
 
+SEP = "=" * 70
+
+INTRO_BANNER = "\n".join([
+    SEP,
+    "🎉 FULL CONVERSATIONAL AI - Complete System Test",
+    SEP,
+])
+
+USAGE_GUIDE = "\n".join([
+    f"\n{SEP}",
+    "✨ COMPLETE PIPELINE - Phase 1-5 Integration",
+    SEP,
+    "\n🎯 What's Being Tested:",
+    "   ✅ Phase 1: Configuration & Setup",
+    "   ✅ Phase 2: Face Recognition & Greetings",
+    "   ✅ Phase 3: Wake Word Detection",
+    "   ✅ Phase 4: Speech-to-Text (Whisper)",
+    "   ✅ Phase 5: AI Chat (GPT) + Text-to-Speech",
+    "\n📝 Success Criteria (Phase 5):",
+    "   ✅ Task 5.1: AI response generation",
+    "      - Query sent to OpenAI GPT successfully",
+    "      - Response received and formatted",
+    "      - Response time < 5 seconds",
+    "      - Conversation context maintained",
+    "   ✅ Task 5.2: Text-to-Speech response",
+    "      - Response spoken clearly through Misty",
+    "      - LED yellow-green during speaking",
+    "      - System ready for next query after speaking",
+    f"\n{SEP}",
+    "🎬 HOW TO USE MISTY AICCO ASSISTANT",
+    SEP,
+    "\n📝 Full Conversation Flow:",
+    "   1️⃣  Say 'Hey Misty'",
+    "      → LED turns PURPLE (listening)",
+    "      → Misty is waiting for your query",
+    "",
+    "   2️⃣  Ask your question, for example:",
+    "      • 'What is artificial intelligence?'",
+    "      • 'Tell me a joke'",
+    "      • 'What's the capital of France?'",
+    "      • 'How are you doing today?'",
+    "      • 'Explain quantum physics simply'",
+    "",
+    "   3️⃣  Wait for 2 seconds of silence",
+    "      → LED turns CYAN (processing)",
+    "      → Speech is being transcribed...",
+    "      → AI is generating response...",
+    "",
+    "   4️⃣  Misty speaks the answer!",
+    "      → LED turns YELLOW-GREEN (speaking)",
+    "      → Listen to Misty's response",
+    "",
+    "   5️⃣  After response completes",
+    "      → LED turns GREEN (idle)",
+    "      → Ready for next 'Hey Misty'!",
+    "",
+    "   🔁 REPEAT AS MANY TIMES AS YOU WANT!",
+    f"\n{SEP}",
+    "💡 EXAMPLE CONVERSATIONS TO TRY",
+    SEP,
+    "\n🗣️  Example 1: General Knowledge",
+    "   You: 'Hey Misty'",
+    "   You: 'What is the tallest mountain in the world?'",
+    "   Misty: [Responds with answer about Mount Everest]",
+    "\n🗣️  Example 2: Fun & Entertainment",
+    "   You: 'Hey Misty'",
+    "   You: 'Tell me a fun fact about robots'",
+    "   Misty: [Shares an interesting robot fact]",
+    "\n🗣️  Example 3: Follow-up Questions (Context)",
+    "   You: 'Hey Misty'",
+    "   You: 'Who wrote Romeo and Juliet?'",
+    "   Misty: [Responds: William Shakespeare]",
+    "   You: 'Hey Misty'",
+    "   You: 'What other plays did he write?'",
+    "   Misty: [Responds with other Shakespeare plays]",
+    "   ✨ (Maintains conversation history!)",
+    "\n🗣️  Example 4: Personal Interaction",
+    "   You: 'Hey Misty'",
+    "   You: 'How are you doing today?'",
+    "   Misty: [Responds with friendly personality]",
+    f"\n{SEP}",
+    "🌟 LED STATE LEGEND",
+    SEP,
+    "   🟢 GREEN     = Idle (waiting for 'Hey Misty')",
+    "   🟣 PURPLE    = Listening (speak your query)",
+    "   🔵 CYAN      = Processing (transcribing & thinking)",
+    "   🟡 YELLOW-GREEN = Speaking (Misty is responding)",
+    "   🔴 RED       = Error (something went wrong)",
+    f"\n{SEP}",
+    "🚀 STARTING FULL ASSISTANT NOW...",
+    SEP,
+    "\n   Press Ctrl+C to stop\n",
+])
+
+SESSION_SUMMARY = "\n".join([
+    f"\n{SEP}",
+    "📊 TEST SESSION COMPLETE",
+    SEP,
+    "\n✅ All systems functional:",
+    "   ✓ Face recognition with greetings",
+    "   ✓ Wake word detection",
+    "   ✓ Speech capture",
+    "   ✓ Speech-to-Text transcription",
+    "   ✓ AI response generation",
+    "   ✓ Text-to-Speech output",
+    "   ✓ Conversation history",
+    "   ✓ LED state feedback",
+    "   ✓ Continuous operation",
+])
+
+CLOSING_CHECKLIST = "\n".join([
+    "\n📋 MANUAL VERIFICATION CHECKLIST:",
+    "   □ Did wake word 'Hey Misty' work reliably?",
+    "   □ Did speech capture work after your query?",
+    "   □ Was transcription accurate?",
+    "   □ Did AI generate appropriate responses?",
+    "   □ Did Misty speak the responses clearly?",
+    "   □ Did LED states change correctly?",
+    "   □ Did follow-up questions maintain context?",
+    "   □ Could you have multiple conversations?",
+    "   □ Did face recognition still work?",
+    "   □ Was the overall experience smooth?",
+    f"\n{SEP}",
+    "🎉 CONGRATULATIONS!",
+    SEP,
+    "\n   You have a fully functional AI assistant on Misty!",
+    "   Phases 1-5 are COMPLETE! 🚀",
+    "",
+    "   Next steps (Optional - Phase 6-10):",
+    "   - State management for conflict prevention",
+    "   - Advanced error handling",
+    "   - Performance optimization",
+    "   - Additional features",
+    f"\n{SEP}",
+])
+
 
 def setup_logging():
     """Set up logging for the test."""
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+        format='%(relativeCreated)d ms - %(name)s - %(levelname)s - %(message)s'
     )
     return logging.getLogger("FullConversationTest")
 
@@ -41,107 +178,12 @@ def test_full_conversation():
     """Test the complete conversational AI system."""
     logger = setup_logging()
     
-    logger.info("=" * 70)
-    logger.info("🎉 FULL CONVERSATIONAL AI - Complete System Test")
-    logger.info("=" * 70)
+    logger.info(INTRO_BANNER)
     
     # Load configuration
     config = get_config()
     
-    logger.info("\n" + "=" * 70)
-    logger.info("✨ COMPLETE PIPELINE - Phase 1-5 Integration")
-    logger.info("=" * 70)
-    
-    logger.info("\n🎯 What's Being Tested:")
-    logger.info("   ✅ Phase 1: Configuration & Setup")
-    logger.info("   ✅ Phase 2: Face Recognition & Greetings")
-    logger.info("   ✅ Phase 3: Wake Word Detection")
-    logger.info("   ✅ Phase 4: Speech-to-Text (Whisper)")
-    logger.info("   ✅ Phase 5: AI Chat (GPT) + Text-to-Speech")
-    
-    logger.info("\n📝 Success Criteria (Phase 5):")
-    logger.info("   ✅ Task 5.1: AI response generation")
-    logger.info("      - Query sent to OpenAI GPT successfully")
-    logger.info("      - Response received and formatted")
-    logger.info("      - Response time < 5 seconds")
-    logger.info("      - Conversation context maintained")
-    logger.info("   ✅ Task 5.2: Text-to-Speech response")
-    logger.info("      - Response spoken clearly through Misty")
-    logger.info("      - LED yellow-green during speaking")
-    logger.info("      - System ready for next query after speaking")
-    
-    logger.info("\n" + "=" * 70)
-    logger.info("🎬 HOW TO USE MISTY AICCO ASSISTANT")
-    logger.info("=" * 70)
-    
-    logger.info("\n📝 Full Conversation Flow:")
-    logger.info("   1️⃣  Say 'Hey Misty'")
-    logger.info("      → LED turns PURPLE (listening)")
-    logger.info("      → Misty is waiting for your query")
-    logger.info("")
-    logger.info("   2️⃣  Ask your question, for example:")
-    logger.info("      • 'What is artificial intelligence?'")
-    logger.info("      • 'Tell me a joke'")
-    logger.info("      • 'What's the capital of France?'")
-    logger.info("      • 'How are you doing today?'")
-    logger.info("      • 'Explain quantum physics simply'")
-    logger.info("")
-    logger.info("   3️⃣  Wait for 2 seconds of silence")
-    logger.info("      → LED turns CYAN (processing)")
-    logger.info("      → Speech is being transcribed...")
-    logger.info("      → AI is generating response...")
-    logger.info("")
-    logger.info("   4️⃣  Misty speaks the answer!")
-    logger.info("      → LED turns YELLOW-GREEN (speaking)")
-    logger.info("      → Listen to Misty's response")
-    logger.info("")
-    logger.info("   5️⃣  After response completes")
-    logger.info("      → LED turns GREEN (idle)")
-    logger.info("      → Ready for next 'Hey Misty'!")
-    logger.info("")
-    logger.info("   🔁 REPEAT AS MANY TIMES AS YOU WANT!")
-    
-    logger.info("\n" + "=" * 70)
-    logger.info("💡 EXAMPLE CONVERSATIONS TO TRY")
-    logger.info("=" * 70)
-    
-    logger.info("\n🗣️  Example 1: General Knowledge")
-    logger.info("   You: 'Hey Misty'")
-    logger.info("   You: 'What is the tallest mountain in the world?'")
-    logger.info("   Misty: [Responds with answer about Mount Everest]")
-    
-    logger.info("\n🗣️  Example 2: Fun & Entertainment")
-    logger.info("   You: 'Hey Misty'")
-    logger.info("   You: 'Tell me a fun fact about robots'")
-    logger.info("   Misty: [Shares an interesting robot fact]")
-    
-    logger.info("\n🗣️  Example 3: Follow-up Questions (Context)")
-    logger.info("   You: 'Hey Misty'")
-    logger.info("   You: 'Who wrote Romeo and Juliet?'")
-    logger.info("   Misty: [Responds: William Shakespeare]")
-    logger.info("   You: 'Hey Misty'")
-    logger.info("   You: 'What other plays did he write?'")
-    logger.info("   Misty: [Responds with other Shakespeare plays]")
-    logger.info("   ✨ (Maintains conversation history!)")
-    
-    logger.info("\n🗣️  Example 4: Personal Interaction")
-    logger.info("   You: 'Hey Misty'")
-    logger.info("   You: 'How are you doing today?'")
-    logger.info("   Misty: [Responds with friendly personality]")
-    
-    logger.info("\n" + "=" * 70)
-    logger.info("🌟 LED STATE LEGEND")
-    logger.info("=" * 70)
-    logger.info("   🟢 GREEN     = Idle (waiting for 'Hey Misty')")
-    logger.info("   🟣 PURPLE    = Listening (speak your query)")
-    logger.info("   🔵 CYAN      = Processing (transcribing & thinking)")
-    logger.info("   🟡 YELLOW-GREEN = Speaking (Misty is responding)")
-    logger.info("   🔴 RED       = Error (something went wrong)")
-    
-    logger.info("\n" + "=" * 70)
-    logger.info("🚀 STARTING FULL ASSISTANT NOW...")
-    logger.info("=" * 70)
-    logger.info("\n   Press Ctrl+C to stop\n")
+    logger.info(USAGE_GUIDE)
     
     try:
         # Create and start the full assistant
@@ -159,47 +201,10 @@ def test_full_conversation():
         sys.exit(1)
     
     # Test summary
-    logger.info("\n" + "=" * 70)
-    logger.info("📊 TEST SESSION COMPLETE")
-    logger.info("=" * 70)
-    
-    logger.info("\n✅ All systems functional:")
-    logger.info("   ✓ Face recognition with greetings")
-    logger.info("   ✓ Wake word detection")
-    logger.info("   ✓ Speech capture")
-    logger.info("   ✓ Speech-to-Text transcription")
-    logger.info("   ✓ AI response generation")
-    logger.info("   ✓ Text-to-Speech output")
-    logger.info("   ✓ Conversation history")
-    logger.info("   ✓ LED state feedback")
-    logger.info("   ✓ Continuous operation")
+    logger.info(SESSION_SUMMARY)
     
     # Manual verification checklist
-    logger.info("\n📋 MANUAL VERIFICATION CHECKLIST:")
-    logger.info("   □ Did wake word 'Hey Misty' work reliably?")
-    logger.info("   □ Did speech capture work after your query?")
-    logger.info("   □ Was transcription accurate?")
-    logger.info("   □ Did AI generate appropriate responses?")
-    logger.info("   □ Did Misty speak the responses clearly?")
-    logger.info("   □ Did LED states change correctly?")
-    logger.info("   □ Did follow-up questions maintain context?")
-    logger.info("   □ Could you have multiple conversations?")
-    logger.info("   □ Did face recognition still work?")
-    logger.info("   □ Was the overall experience smooth?")
-    
-    logger.info("\n" + "=" * 70)
-    logger.info("🎉 CONGRATULATIONS!")
-    logger.info("=" * 70)
-    logger.info("\n   You have a fully functional AI assistant on Misty!")
-    logger.info("   Phases 1-5 are COMPLETE! 🚀")
-    logger.info("")
-    logger.info("   Next steps (Optional - Phase 6-10):")
-    logger.info("   - State management for conflict prevention")
-    logger.info("   - Advanced error handling")
-    logger.info("   - Performance optimization")
-    logger.info("   - Additional features")
-    
-    logger.info("\n" + "=" * 70)
+    logger.info(CLOSING_CHECKLIST)
 
 
 if __name__ == "__main__":
@@ -15,23 +15,45 @@ Usage:
 import os
 import sys
 import time
+import queue
 import logging
 
 # Add project root to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 from mistyPy.Robot import Robot
 from src.config import get_config
 from src.core.face_recognition_manager import FaceRecognitionManager
 from src.core.greeting_manager import GreetingManager
 
+SEP = "=" * 70
+
+INTRO_BANNER = "\n".join([
+    SEP,
+    "Task 2.2: Greeting System with Cooldown - Test Script",
+    SEP,
+])
+
+TEST_COMPLETE = "\n".join([
+    f"\n{SEP}",
+    "✅ TEST COMPLETE!",
+    SEP,
+])
+
+NO_FACES_HINT = "\n".join([
+    "⚠️  No faces trained yet!",
+    "   To test greetings, you need to train at least one face.",
+    "   Run the face training script first or uncomment training section below.",
+])
+
 
 def setup_logging():
     """Set up logging for the test."""
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+        format='%(relativeCreated)d ms - %(name)s - %(levelname)s - %(message)s'
     )
     return logging.getLogger("GreetingTest")
 
@@ -40,12 +62,14 @@ def test_greeting_system():
     """Test the greeting system with cooldown."""
     logger = setup_logging()
     
-    logger.info("=" * 70)
-    logger.info("Task 2.2: Greeting System with Cooldown - Test Script")
-    logger.info("=" * 70)
+    logger.info(INTRO_BANNER)
     
     # Load configuration
     config = get_config()
+    cfg_fr = config.face_recognition
+    cfg_led = config.led
+    cooldown = cfg_fr.greeting_cooldown_seconds
+    templates = cfg_fr.greeting_templates
     logger.info(f"\nConnecting to Misty at {config.misty.ip_address}...")
     
     try:
@@ -54,43 +78,66 @@ def test_greeting_system():
         logger.info("✅ Connected to Misty successfully!")
         
         # Set initial LED to idle
-        misty.change_led(*config.led.idle)
-        logger.info(f"💡 LED set to idle: RGB{config.led.idle}")
+        misty.change_led(*cfg_led.idle)
+        logger.info(f"💡 LED set to idle: RGB{cfg_led.idle}")
         
         # Initialize greeting manager
         logger.info("\n📋 Initializing Greeting Manager...")
         greeting_manager = GreetingManager(
             misty=misty,
-            greeting_templates=config.face_recognition.greeting_templates,
-            cooldown_seconds=config.face_recognition.greeting_cooldown_seconds,
-            greeting_led_color=config.led.greeting,
-            idle_led_color=config.led.idle
+            greeting_templates=templates,
+            cooldown_seconds=cooldown,
+            greeting_led_color=cfg_led.greeting,
+            idle_led_color=cfg_led.idle
         )
         logger.info(f"✅ Greeting Manager initialized")
-        logger.info(f"   - Cooldown period: {config.face_recognition.greeting_cooldown_seconds} seconds")
-        logger.info(f"   - Available templates: {len(config.face_recognition.greeting_templates)}")
-        logger.info(f"   - Greeting LED color: RGB{config.led.greeting}")
+        logger.info(f"   - Cooldown period: {cooldown} seconds")
+        logger.info(f"   - Available templates: {len(templates)}")
+        logger.info(f"   - Greeting LED color: RGB{cfg_led.greeting}")
         
-        # Callback for face recognition
-        greeting_count = [0]  # Use list to allow modification in nested function
+        # Bound once for the per-face handler
+        greet = greeting_manager.greet_person
+        greeting_status = greeting_manager.get_greeting_status
         
-        def on_face_detected(face_data):
+        # Someone who has never been greeted has no history and no cooldown
+        status = greeting_status("Never Greeted Visitor")
+        if (status.last_greeted is not None or status.time_since_greeting is not None
+                or not status.can_greet or status.cooldown_remaining != 0):
+            raise AssertionError(f"Unexpected status for a never-greeted person: {status}")
+        logger.info("✅ Never-greeted person can be greeted immediately")
+        
+        # The face recognition callback runs on an SDK thread; it only
+        # enqueues, which wakes the main loop at once, and the main thread
+        # greets and owns the counter
+        faces = queue.Queue()
+        greeting_count = 0
+        
+        def on_face_detected(face):
             """Callback when face is detected."""
-            name = face_data.get("name", "Unknown")
-            confidence = face_data.get("confidence", 0.0)
+            faces.put(face)
+        
+        def handle_face(face) -> bool:
+            """Greet a detected face and report its cooldown status.
             
-            logger.info(f"\n👤 Face detected: {name} (confidence: {confidence:.2f})")
+            Args:
+                face: Recognized face event
+            
+            Returns:
+                True if a greeting was delivered
+            """
+            name = face.name
+            logger.info("\n👤 Face detected: %s (confidence: %.2f)", name, face.confidence)
             
             # Attempt to greet
-            greeted = greeting_manager.greet_person(name)
-            if greeted:
-                greeting_count[0] += 1
+            greeted = greet(name)
             
             # Show greeting status
-            status = greeting_manager.get_greeting_status(name)
-            logger.info(f"📊 Greeting Status for '{name}':")
-            logger.info(f"   - Can greet now: {status['can_greet']}")
-            logger.info(f"   - Cooldown remaining: {status['cooldown_remaining']:.1f}s")
+            status = greeting_status(name)
+            logger.info(
+                "📊 Greeting Status for '%s':\n   - Can greet now: %s\n   - Cooldown remaining: %.1fs",
+                name, status.can_greet, status.cooldown_remaining
+            )
+            return greeted
         
         # Initialize face recognition
         logger.info("\n📹 Initializing Face Recognition...")
@@ -104,9 +151,7 @@ def test_greeting_system():
         if known_faces:
             logger.info(f"✅ Known faces in database: {', '.join(known_faces)}")
         else:
-            logger.info("⚠️  No faces trained yet!")
-            logger.info("   To test greetings, you need to train at least one face.")
-            logger.info("   Run the face training script first or uncomment training section below.")
+            logger.info(NO_FACES_HINT)
             
             # Optional: Train a face for testing (uncomment to use)
             # logger.info("\n🔄 Starting face training for 'TestUser'...")
@@ -118,91 +163,108 @@ def test_greeting_system():
         # Start face recognition
         face_recognition.start()
         
-        logger.info("\n" + "=" * 70)
-        logger.info("🎬 TEST SCENARIOS")
-        logger.info("=" * 70)
-        logger.info("\n📝 Test Instructions:")
-        logger.info("1. Show your face to Misty's camera")
-        logger.info("2. Verify you hear a personalized greeting")
-        logger.info("3. Verify LED changes to greeting color (green-cyan)")
-        logger.info("4. Show your face again immediately")
-        logger.info("5. Verify NO second greeting (cooldown active)")
-        logger.info(f"6. Wait {config.face_recognition.greeting_cooldown_seconds} seconds")
-        logger.info("7. Show your face again")
-        logger.info("8. Verify you hear a greeting again (cooldown expired)")
-        logger.info("\n🔍 Monitoring for face detection events...")
-        logger.info(f"   Cooldown period: {config.face_recognition.greeting_cooldown_seconds} seconds")
-        logger.info("   Press Ctrl+C to stop\n")
-        
-        # Monitor for 2 minutes (or until interrupted)
+        logger.info("\n".join([
+            f"\n{SEP}",
+            "🎬 TEST SCENARIOS",
+            SEP,
+            "\n📝 Test Instructions:",
+            "1. Show your face to Misty's camera",
+            "2. Verify you hear a personalized greeting",
+            "3. Verify LED changes to greeting color (green-cyan)",
+            "4. Show your face again immediately",
+            "5. Verify NO second greeting (cooldown active)",
+            f"6. Wait {cooldown} seconds",
+            "7. Show your face again",
+            "8. Verify you hear a greeting again (cooldown expired)",
+            "\n🔍 Monitoring for face detection events...",
+            f"   Cooldown period: {cooldown} seconds",
+            "   Press Ctrl+C to stop\n",
+        ]))
+        
+        # Monitor for 2 minutes (or until interrupted), blocking until a face
+        # arrives or the next 30-second status line is due instead of polling
         test_duration = 120  # 2 minutes
-        start_time = time.time()
+        status_interval = 30
+        start_time = time.monotonic()
+        deadline = start_time + test_duration
+        next_status = start_time + status_interval
         
         try:
-            while time.time() - start_time < test_duration:
-                time.sleep(1)
+            while True:
+                now = time.monotonic()
+                if now >= deadline:
+                    break
+                try:
+                    face = faces.get(timeout=min(next_status, deadline) - now)
+                except queue.Empty:
+                    pass
+                else:
+                    if handle_face(face):
+                        greeting_count += 1
                 
                 # Show periodic status
-                elapsed = time.time() - start_time
-                if int(elapsed) % 30 == 0 and elapsed > 0:
-                    logger.info(f"\n⏱️  Test running for {int(elapsed)}s...")
-                    logger.info(f"   Total greetings delivered: {greeting_count[0]}")
+                if next_status < deadline and time.monotonic() >= next_status:
+                    status_lines = [
+                        f"\n⏱️  Test running for {int(next_status - start_time)}s...",
+                        f"   Total greetings delivered: {greeting_count}",
+                    ]
                     
                     # Show greeting history
                     history = greeting_manager.get_all_greeting_history()
                     if history:
-                        logger.info("   Greeting history:")
-                        for name, status in history.items():
-                            logger.info(f"      - {name}: cooldown remaining {status['cooldown_remaining']:.0f}s")
+                        status_lines.append("   Greeting history:")
+                        status_lines.extend(
+                            f"      - {name}: cooldown remaining {status.cooldown_remaining:.0f}s"
+                            for name, status in history.items()
+                        )
+                    logger.info("\n".join(status_lines))
+                    next_status += status_interval
         
         except KeyboardInterrupt:
             logger.info("\n\n⏹️  Test interrupted by user")
         
         # Test summary
-        logger.info("\n" + "=" * 70)
-        logger.info("📊 TEST SUMMARY")
-        logger.info("=" * 70)
-        logger.info(f"Total greetings delivered: {greeting_count[0]}")
-        
+        summary = [
+            f"\n{SEP}",
+            "📊 TEST SUMMARY",
+            SEP,
+            f"Total greetings delivered: {greeting_count}",
+        ]
         history = greeting_manager.get_all_greeting_history()
         if history:
-            logger.info(f"\nGreeted {len(history)} unique person(s):")
-            for name, status in history.items():
-                time_since = status.get('time_since_greeting', 0)
-                logger.info(f"  - {name}: last greeted {time_since:.1f}s ago")
+            summary.append(f"\nGreeted {len(history)} unique person(s):")
+            summary.extend(
+                f"  - {name}: last greeted {status.time_since_greeting:.1f}s ago"
+                for name, status in history.items()
+            )
         else:
-            logger.info("No one was greeted during this test.")
-        
-        # Success criteria verification
-        logger.info("\n" + "=" * 70)
-        logger.info("✅ SUCCESS CRITERIA VERIFICATION")
-        logger.info("=" * 70)
-        
-        if greeting_count[0] > 0:
-            logger.info("✅ Greetings were spoken when faces detected")
-        else:
-            logger.info("❌ No greetings delivered (check if faces are trained)")
-        
-        logger.info("✅ Cooldown logic implemented")
-        logger.info("✅ LED animations during greeting")
-        logger.info("✅ Personalized greeting messages")
+            summary.append("No one was greeted during this test.")
+        logger.info("\n".join(summary))
         
-        # Manual verification reminders
-        logger.info("\n📋 MANUAL VERIFICATION CHECKLIST:")
-        logger.info("   □ Did you hear personalized greetings? (e.g., 'Hello, [Name]!')")
-        logger.info("   □ Did LED turn green-cyan during greeting?")
-        logger.info("   □ Did LED return to green (idle) after greeting?")
-        logger.info("   □ Were duplicate greetings prevented within cooldown?")
-        logger.info(f"   □ Did greeting work again after {config.face_recognition.greeting_cooldown_seconds}s cooldown?")
+        # Success criteria verification and manual verification reminders
+        logger.info("\n".join([
+            f"\n{SEP}",
+            "✅ SUCCESS CRITERIA VERIFICATION",
+            SEP,
+            "✅ Greetings were spoken when faces detected" if greeting_count > 0
+            else "❌ No greetings delivered (check if faces are trained)",
+            "✅ Cooldown logic implemented",
+            "✅ LED animations during greeting",
+            "✅ Personalized greeting messages",
+            "\n📋 MANUAL VERIFICATION CHECKLIST:",
+            "   □ Did you hear personalized greetings? (e.g., 'Hello, [Name]!')",
+            "   □ Did LED turn green-cyan during greeting?",
+            "   □ Did LED return to green (idle) after greeting?",
+            "   □ Were duplicate greetings prevented within cooldown?",
+            f"   □ Did greeting work again after {cooldown}s cooldown?",
+        ]))
         
         # Cleanup
         logger.info("\n🧹 Cleaning up...")
         face_recognition.stop()
         logger.info("✅ Face recognition stopped")
         
-        logger.info("\n" + "=" * 70)
-        logger.info("✅ TEST COMPLETE!")
-        logger.info("=" * 70)
+        logger.info(TEST_COMPLETE)
         
     except Exception as e:
         logger.error(f"\n❌ Test failed with error: {e}", exc_info=True)
@@ -18,11 +18,56 @@ import os
 import time
 
 # Add project root to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 from mistyPy.Robot import Robot
 from src.config import get_config
 from src.core.personality_manager import PersonalityManager
+from tests.ci_quick import quick_or_full
+
+# CI_QUICK=1 skips watching the screensaver dance for unattended builds
+DANCE_WATCH_SECONDS = quick_or_full(0, 10)
+
+
+class FakeClock:
+    """Manually advanced stand-in for time.monotonic."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+    
+    def advance(self, seconds: float):
+        """Move the clock forward without sleeping."""
+        self.now += seconds
+
+
+def run_paced(steps):
+    """Run animation steps on a fixed schedule.
+    
+    Each step's display time is measured from when its command was sent,
+    so the REST round-trip to Misty overlaps the time the previous step is
+    on screen instead of being added after it. Steps still run in order.
+    
+    Args:
+        steps: Iterable of (label, action, hold_seconds) tuples
+    """
+    next_at = time.monotonic()
+    for label, action, hold_seconds in steps:
+        delay = next_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        next_at = time.monotonic() + hold_seconds
+        print(f"  {label}")
+        action()
+    
+    # Let the last step finish playing
+    delay = next_at - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
 
 
 def test_expressions(personality: PersonalityManager):
@@ -33,10 +78,10 @@ def test_expressions(personality: PersonalityManager):
     
     expressions = ["joy", "love", "amazement", "surprise", "default"]
     
-    for expr in expressions:
-        print(f"  Showing expression: {expr}")
-        personality.show_expression(expr)
-        time.sleep(2)
+    run_paced(
+        (f"Showing expression: {expr}", lambda expr=expr: personality.show_expression(expr), 2)
+        for expr in expressions
+    )
     
     print("✅ Expression test complete!")
 
@@ -47,21 +92,12 @@ def test_animations(personality: PersonalityManager):
     print("TEST 2: Conversation Animations")
     print("=" * 60)
     
-    print("  Testing listening animation...")
-    personality.listening_animation()
-    time.sleep(2)
-    
-    print("  Testing thinking animation...")
-    personality.thinking_animation()
-    time.sleep(2)
-    
-    print("  Testing speaking animation...")
-    personality.speaking_animation()
-    time.sleep(2)
-    
-    print("  Testing greeting animation...")
-    personality.greeting_animation()
-    time.sleep(3)
+    run_paced([
+        ("Testing listening animation...", personality.listening_animation, 2),
+        ("Testing thinking animation...", personality.thinking_animation, 2),
+        ("Testing speaking animation...", personality.speaking_animation, 2),
+        ("Testing greeting animation...", personality.greeting_animation, 3),
+    ])
     
     print("  Resetting to neutral...")
     personality.reset_to_neutral()
@@ -69,41 +105,55 @@ def test_animations(personality: PersonalityManager):
     print("✅ Animation test complete!")
 
 
-def test_screensaver(personality: PersonalityManager):
-    """Test screensaver mode (shortened for testing)."""
+def test_screensaver(misty: Robot, idle_timeout_seconds: float):
+    """Test screensaver mode on a fake clock, so the idle wait is instant.
+    
+    Args:
+        misty: Robot instance
+        idle_timeout_seconds: Configured idle timeout to simulate
+    """
     print("\n" + "=" * 60)
     print("TEST 3: Screensaver Mode")
     print("=" * 60)
     
-    # Temporarily reduce idle timeout for testing
-    original_timeout = personality.idle_timeout_seconds
-    personality.idle_timeout_seconds = 10  # 10 seconds for testing
-    
-    print(f"  Idle timeout set to {personality.idle_timeout_seconds}s for testing")
-    print("  Waiting for screensaver to activate...")
-    print("  (This would normally take 2 minutes)")
-    
-    # Wait for screensaver to activate
-    time.sleep(12)
+    # A separate manager on a fake clock; its idle monitor thread stays off
+    # and the test runs the idle check itself
+    clock = FakeClock()
+    personality = PersonalityManager(
+        misty=misty,
+        idle_timeout_seconds=idle_timeout_seconds,
+        screensaver_enabled=False,
+        clock=clock
+    )
+    personality.start()
     
-    if personality.in_screensaver:
-        print("✅ Screensaver activated!")
-        print("  Watching dance moves for 10 seconds...")
-        time.sleep(10)
+    try:
+        clock.advance(idle_timeout_seconds - 1)
+        if personality.check_idle():
+            print("❌ Screensaver activated before the idle timeout")
+            return
         
-        print("\n  Simulating interaction (should exit screensaver)...")
-        personality.record_interaction()
-        time.sleep(2)
+        print(f"  Advancing clock past the {idle_timeout_seconds:.0f}s idle timeout...")
+        clock.advance(1)
         
-        if not personality.in_screensaver:
-            print("✅ Screensaver exited successfully!")
+        if personality.check_idle():
+            print("✅ Screensaver activated!")
+            if DANCE_WATCH_SECONDS:
+                print(f"  Watching dance moves for {DANCE_WATCH_SECONDS} seconds...")
+                time.sleep(DANCE_WATCH_SECONDS)
+            
+            # Exiting joins the dance thread, so the state is final on return
+            print("\n  Simulating interaction (should exit screensaver)...")
+            personality.record_interaction()
+            
+            if not personality.in_screensaver:
+                print("✅ Screensaver exited successfully!")
+            else:
+                print("❌ Screensaver didn't exit")
         else:
-            print("❌ Screensaver didn't exit")
-    else:
-        print("❌ Screensaver didn't activate")
-    
-    # Restore original timeout
-    personality.idle_timeout_seconds = original_timeout
+            print("❌ Screensaver didn't activate")
+    finally:
+        personality.stop()
 
 
 def test_dance_moves(personality: PersonalityManager):
@@ -112,21 +162,12 @@ def test_dance_moves(personality: PersonalityManager):
     print("TEST 4: Dance Moves")
     print("=" * 60)
     
-    print("  Dance Move 1: Head shake with arm waves")
-    personality._dance_move_1()
-    time.sleep(2)
-    
-    print("  Dance Move 2: Spin 360")
-    personality._dance_move_2()
-    time.sleep(3)
-    
-    print("  Dance Move 3: Arm wave sequence")
-    personality._dance_move_3()
-    time.sleep(3)
-    
-    print("  Dance Move 4: Look around curiously")
-    personality._dance_move_4()
-    time.sleep(2)
+    run_paced([
+        ("Dance Move 1: Head shake with arm waves", personality._dance_move_1, 2),
+        ("Dance Move 2: Spin 360", personality._dance_move_2, 3),
+        ("Dance Move 3: Arm wave sequence", personality._dance_move_3, 3),
+        ("Dance Move 4: Look around curiously", personality._dance_move_4, 2),
+    ])
     
     print("  Resetting to neutral...")
     personality.reset_to_neutral()
@@ -171,11 +212,11 @@ def main():
         print("\n" + "=" * 60)
         print("SCREENSAVER TEST (Optional)")
         print("=" * 60)
-        print("This test will wait 10 seconds for screensaver to activate.")
+        print("This test will trigger the screensaver and watch it dance.")
         response = input("Run screensaver test? (y/n): ")
         
         if response.lower() == 'y':
-            test_screensaver(personality)
+            test_screensaver(misty, config.personality.idle_timeout_seconds)
         else:
             print("Skipping screensaver test")
         
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Test system prompt assembly for Misty Aicco Assistant.
+
+This script checks that the static system prompt always leads the request
+and stays byte-identical across turns, so provider prefix caching applies.
+"""
+
+import os
+import sys
+import hashlib
+
+# Add project root to path for imports
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+# Roughly the first 1024 tokens (~4 characters per token) - the minimum
+# prefix length OpenAI caches
+CACHED_PREFIX_CHARS = 4096
+
+# Upper bound on the full system prompt; it is prefilled on every turn, so
+# growth past this should be a deliberate decision
+SYSTEM_PROMPT_TOKEN_BUDGET = 3200
+
+# Non-ASCII characters the prompt may use (the degree sign in coordinates)
+ALLOWED_NON_ASCII = {"°"}
+
+RULE = "-" * 60
+
+
+def prefix_hash(messages):
+    """Hash the leading characters of a messages list as sent to the API."""
+    text = "".join(f"{m['role']}:{m['content']}\n" for m in messages)
+    return hashlib.sha256(text[:CACHED_PREFIX_CHARS].encode("utf-8")).hexdigest()
+
+
+try:
+    from src.prompts import UNO_BSAI_SYSTEM_PROMPT, PROMPT_MODULES, build_prompt, count_prompt_tokens
+    from src.core.ai_chat_handler import AIChatHandler
+
+    print("Testing system prompt assembly...")
+    print(RULE)
+
+    # Stray trailing whitespace would silently become part of the cache key
+    assert not any(line != line.rstrip() for line in UNO_BSAI_SYSTEM_PROMPT.split("\n")), \
+        "System prompt has lines with trailing whitespace"
+    print("✅ No trailing whitespace in system prompt")
+
+    # Emoji and arrows cost several tokens each and are never spoken; keep
+    # the prompt ASCII apart from characters that carry information
+    decorative = sorted({c for c in UNO_BSAI_SYSTEM_PROMPT if ord(c) > 127} - ALLOWED_NON_ASCII)
+    assert not decorative, f"System prompt contains decorative characters: {' '.join(decorative)}"
+    print("✅ No decorative Unicode in system prompt")
+
+    assert len(UNO_BSAI_SYSTEM_PROMPT) > CACHED_PREFIX_CHARS, \
+        "System prompt alone should fill the cached prefix"
+
+    prompt_tokens = count_prompt_tokens(UNO_BSAI_SYSTEM_PROMPT)
+    assert prompt_tokens <= SYSTEM_PROMPT_TOKEN_BUDGET, \
+        f"System prompt is {prompt_tokens} tokens, over the {SYSTEM_PROMPT_TOKEN_BUDGET} budget"
+    print(f"✅ System prompt is {prompt_tokens} tokens (budget {SYSTEM_PROMPT_TOKEN_BUDGET})")
+
+    # Modules are emitted in canonical order whatever order they are requested in
+    names = list(PROMPT_MODULES)
+    assert build_prompt() == UNO_BSAI_SYSTEM_PROMPT
+    assert build_prompt(reversed(names[:3])) == build_prompt(names[:3])
+    assert UNO_BSAI_SYSTEM_PROMPT.startswith(build_prompt(names[:3]))
+    print("✅ Prompt modules assemble in canonical order")
+
+    # The system prompt must lead every request, unchanged, with the
+    # per-turn content after it
+    handler = AIChatHandler(openai_api_key="sk-test-key-for-validation")
+    first = handler._build_messages("When does the AI program start?")
+    handler._add_to_history("When does the AI program start?", "Spring 2025!")
+    second = handler._build_messages("What will I learn?")
+
+    assert first[0] == {"role": "system", "content": UNO_BSAI_SYSTEM_PROMPT}
+    assert first[-1] == {"role": "user", "content": "When does the AI program start?"}
+    assert second[-1] == {"role": "user", "content": "What will I learn?"}
+    assert prefix_hash(first) == prefix_hash(second), "Cached prefix changed between turns"
+    print("✅ Static system prompt leads every request and is stable across turns")
+
+    # Once history is full, old exchanges are evicted in batches, so turns
+    # between evictions extend the previous request instead of rewriting it
+    handler.clear_history()
+    for i in range(handler.conversation_history_length + 1):
+        handler._add_to_history(f"Question {i}?", f"Answer {i}.")
+    before = handler._build_messages("Next question?")[:-1]
+    handler._add_to_history("Next question?", "Next answer.")
+    after = handler._build_messages("Another question?")
+    assert len(handler.conversation_history) <= 2 * handler.conversation_history_length
+    assert after[:len(before)] == before, "History prefix changed between evictions"
+    print("✅ History is evicted in batches, keeping the cached prefix stable")
+    
+    # A response that was still being generated when the conversation ended
+    # must not leak into the next visitor's (empty) history
+    generation = handler._history_generation
+    handler.clear_history()
+    handler._add_to_history("Thanks, bye!", "Goodbye! Have a great day.", generation)
+    assert handler.conversation_history == [], "Stale exchange written after clear_history()"
+    assert handler._build_messages("Hi!")[:-1] == [first[0]]
+    print("✅ Responses finished after clear_history() are not recorded")
+
+    print("\n✅ ALL TESTS PASSED!")
+
+except ImportError as e:
+    print(f"❌ Import Error: {e}")
+    print("\nMake sure all dependencies are installed:")
+    print("  pip install -r requirements.txt")
+    sys.exit(1)
+
+except AssertionError as e:
+    print(f"❌ Assertion Failed: {e}")
+    sys.exit(1)
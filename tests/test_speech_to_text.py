@@ -17,18 +17,101 @@ import sys
 import logging
 
 # Add project root to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 from src.config import get_config
 from src.misty_aicco_assistant import MistyAiccoAssistant
 
+SEP = "=" * 70
+
+INTRO_BANNER = "\n".join([
+    SEP,
+    "Phase 4: Speech-to-Text Integration - Test Script",
+    SEP,
+])
+
+TEST_SCENARIOS = "\n".join([
+    f"\n{SEP}",
+    "🎬 TEST SCENARIOS - Phase 4 Success Criteria",
+    SEP,
+    "\n📝 Success Criteria:",
+    "   ✅ Task 4.1: Voice query capture (already implemented)",
+    "      - Recording starts after wake word",
+    "      - Recording stops after 2 seconds of silence",
+    "      - Audio saved successfully",
+    "   ✅ Task 4.2: OpenAI Whisper transcription",
+    "      - Audio transcribed accurately (>90% accuracy)",
+    "      - Transcription latency < 3 seconds",
+    "      - Errors handled gracefully",
+    "\n📝 Test Instructions:",
+    "1. Say 'Hey Misty' to trigger wake word detection",
+    "2. LED will turn purple (listening)",
+    "3. Speak a clear query, for example:",
+    "   - 'What is the weather like today?'",
+    "   - 'Tell me a joke'",
+    "   - 'What time is it?'",
+    "4. Wait for speech capture (LED turns cyan)",
+    "5. Wait for transcription to complete",
+    "6. Verify transcription is accurate",
+    "7. Repeat with different queries to test accuracy",
+    "\n🔍 Monitoring for wake word...",
+    "   Press Ctrl+C to stop\n",
+])
+
+TEST_SUMMARY = "\n".join([
+    f"\n{SEP}",
+    "📊 TEST SUMMARY",
+    SEP,
+    "\n✅ Phase 4 test completed",
+    "   Speech-to-Text integration is active",
+    "   Full pipeline: Wake word → Speech capture → Transcription",
+])
+
+SUCCESS_CRITERIA = "\n".join([
+    f"\n{SEP}",
+    "✅ SUCCESS CRITERIA VERIFICATION",
+    SEP,
+    "✅ Task 4.1: Voice Query Capture",
+    "   - Recording starts after wake word",
+    "   - Silence detection (2s threshold)",
+    "   - LED purple during listening",
+    "✅ Task 4.2: OpenAI Whisper Integration",
+    "   - SpeechToTextHandler initialized",
+    "   - Audio retrieved from Misty",
+    "   - Sent to OpenAI Whisper API",
+    "   - Transcription displayed in logs",
+    "   - Retry logic implemented",
+])
+
+CLOSING_CHECKLIST = "\n".join([
+    "\n📋 MANUAL VERIFICATION CHECKLIST:",
+    "   □ Did wake word detection work?",
+    "   □ Did speech capture complete after your query?",
+    "   □ Was the transcription accurate?",
+    "   □ Was transcription latency acceptable (<3s)?",
+    "   □ Did error handling work (if any errors)?",
+    "   □ Did LED states transition correctly?",
+    "      - Green (idle) → Purple (listening) → Cyan (processing) → Green (idle)",
+    "\n💡 Example queries to test:",
+    "   - 'What is the capital of France?'",
+    "   - 'How are you doing today?'",
+    "   - 'Tell me something interesting'",
+    "   - 'What's two plus two?'",
+    f"\n{SEP}",
+    "✅ TEST COMPLETE!",
+    SEP,
+    "\n💡 Note: Phase 4 (Tasks 4.1 & 4.2) Complete!",
+    "   Next: Phase 5 will add AI response generation and TTS",
+])
+
 
 def setup_logging():
     """Set up logging for the test."""
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+        format='%(relativeCreated)d ms - %(name)s - %(levelname)s - %(message)s'
     )
     return logging.getLogger("SpeechToTextTest")
 
@@ -37,40 +120,12 @@ def test_speech_to_text():
     """Test the speech-to-text integration."""
     logger = setup_logging()
     
-    logger.info("=" * 70)
-    logger.info("Phase 4: Speech-to-Text Integration - Test Script")
-    logger.info("=" * 70)
+    logger.info(INTRO_BANNER)
     
     # Load configuration
     config = get_config()
     
-    logger.info("\n" + "=" * 70)
-    logger.info("🎬 TEST SCENARIOS - Phase 4 Success Criteria")
-    logger.info("=" * 70)
-    
-    logger.info("\n📝 Success Criteria:")
-    logger.info("   ✅ Task 4.1: Voice query capture (already implemented)")
-    logger.info("      - Recording starts after wake word")
-    logger.info("      - Recording stops after 2 seconds of silence")
-    logger.info("      - Audio saved successfully")
-    logger.info("   ✅ Task 4.2: OpenAI Whisper transcription")
-    logger.info("      - Audio transcribed accurately (>90% accuracy)")
-    logger.info("      - Transcription latency < 3 seconds")
-    logger.info("      - Errors handled gracefully")
-    
-    logger.info("\n📝 Test Instructions:")
-    logger.info("1. Say 'Hey Misty' to trigger wake word detection")
-    logger.info("2. LED will turn purple (listening)")
-    logger.info("3. Speak a clear query, for example:")
-    logger.info("   - 'What is the weather like today?'")
-    logger.info("   - 'Tell me a joke'")
-    logger.info("   - 'What time is it?'")
-    logger.info("4. Wait for speech capture (LED turns cyan)")
-    logger.info("5. Wait for transcription to complete")
-    logger.info("6. Verify transcription is accurate")
-    logger.info("7. Repeat with different queries to test accuracy")
-    logger.info("\n🔍 Monitoring for wake word...")
-    logger.info("   Press Ctrl+C to stop\n")
+    logger.info(TEST_SCENARIOS)
     
     try:
         # Create and start the assistant
@@ -88,53 +143,13 @@ def test_speech_to_text():
         sys.exit(1)
     
     # Test summary
-    logger.info("\n" + "=" * 70)
-    logger.info("📊 TEST SUMMARY")
-    logger.info("=" * 70)
-    
-    logger.info("\n✅ Phase 4 test completed")
-    logger.info("   Speech-to-Text integration is active")
-    logger.info("   Full pipeline: Wake word → Speech capture → Transcription")
+    logger.info(TEST_SUMMARY)
     
     # Success criteria verification
-    logger.info("\n" + "=" * 70)
-    logger.info("✅ SUCCESS CRITERIA VERIFICATION")
-    logger.info("=" * 70)
-    
-    logger.info("✅ Task 4.1: Voice Query Capture")
-    logger.info("   - Recording starts after wake word")
-    logger.info("   - Silence detection (2s threshold)")
-    logger.info("   - LED purple during listening")
-    
-    logger.info("✅ Task 4.2: OpenAI Whisper Integration")
-    logger.info("   - SpeechToTextHandler initialized")
-    logger.info("   - Audio retrieved from Misty")
-    logger.info("   - Sent to OpenAI Whisper API")
-    logger.info("   - Transcription displayed in logs")
-    logger.info("   - Retry logic implemented")
+    logger.info(SUCCESS_CRITERIA)
     
     # Manual verification checklist
-    logger.info("\n📋 MANUAL VERIFICATION CHECKLIST:")
-    logger.info("   □ Did wake word detection work?")
-    logger.info("   □ Did speech capture complete after your query?")
-    logger.info("   □ Was the transcription accurate?")
-    logger.info("   □ Was transcription latency acceptable (<3s)?")
-    logger.info("   □ Did error handling work (if any errors)?")
-    logger.info("   □ Did LED states transition correctly?")
-    logger.info("      - Green (idle) → Purple (listening) → Cyan (processing) → Green (idle)")
-    
-    logger.info("\n💡 Example queries to test:")
-    logger.info("   - 'What is the capital of France?'")
-    logger.info("   - 'How are you doing today?'")
-    logger.info("   - 'Tell me something interesting'")
-    logger.info("   - 'What's two plus two?'")
-    
-    logger.info("\n" + "=" * 70)
-    logger.info("✅ TEST COMPLETE!")
-    logger.info("=" * 70)
-    
-    logger.info("\n💡 Note: Phase 4 (Tasks 4.1 & 4.2) Complete!")
-    logger.info("   Next: Phase 5 will add AI response generation and TTS")
+    logger.info(CLOSING_CHECKLIST)
 
 
 if __name__ == "__main__":
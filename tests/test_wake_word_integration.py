@@ -10,34 +10,135 @@ This script tests the full wake word integration with the main application:
 
 Usage:
     python3 test_wake_word_integration.py
+    CI_QUICK=1 python3 test_wake_word_integration.py  # synthetic events, no robot
 """
 
 import os
 import sys
 import time
+import queue
 import logging
+import threading
 
 # Add project root to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 from src.config import get_config
+from src.core.audio_monitor import AudioMonitor
 from src.misty_aicco_assistant import MistyAiccoAssistant
+from tests.ci_quick import CI_QUICK
+
+# CI_QUICK=1 replays synthetic Misty events through the AudioMonitor
+# instead of the 90 second interactive run against the robot
+SYNTHETIC_TRIGGERS = 200
+LATENCY_BUDGET_SECONDS = 0.5
 
 
 def setup_logging():
     """Set up logging for the test."""
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+        format='%(relativeCreated)d ms - %(name)s - %(levelname)s - %(message)s'
     )
     return logging.getLogger("WakeWordIntegrationTest")
 
 
+def run_synthetic_triggers(logger) -> bool:
+    """Replay wake word + speech capture events and check callback latency.
+    
+    Events are posted to a queue and handed to the AudioMonitor by a
+    separate dispatcher thread, the way the SDK's websocket threads deliver
+    them, so each recorded latency covers the cross-thread hand-off from
+    posting the event to the assistant-facing callback. No robot is needed:
+    the event handlers never call back into Misty.
+    
+    Args:
+        logger: Test logger
+    
+    Returns:
+        True if every trigger arrived in order and within budget
+    """
+    latencies = []
+    captured = []
+    delivered = threading.Event()
+    
+    def on_wake_word(message):
+        latencies.append(time.monotonic() - message["sentAt"])
+    
+    def on_speech(audio_data):
+        captured.append(audio_data["filename"])
+        delivered.set()
+    
+    monitor = AudioMonitor(misty=None, on_wake_word_detected=on_wake_word,
+                           on_speech_captured=on_speech)
+    
+    # Callback logging is per trigger; keep it out of the measurement
+    logging.getLogger("AudioMonitor").setLevel(logging.WARNING)
+    
+    events = queue.Queue()
+    
+    def dispatch():
+        while True:
+            item = events.get()
+            if item is None:
+                return
+            handler, event_data = item
+            handler(event_data)
+    
+    dispatcher = threading.Thread(target=dispatch, name="SyntheticDispatcher", daemon=True)
+    dispatcher.start()
+    
+    start = time.monotonic()
+    try:
+        for i in range(SYNTHETIC_TRIGGERS):
+            delivered.clear()
+            events.put((monitor._on_wake_word_event,
+                        {"message": {"confidence": 80, "sentAt": time.monotonic()}}))
+            events.put((monitor._on_voice_record_event,
+                        {"message": {"filename": f"capture_{i}.wav", "success": True}}))
+            if not delivered.wait(LATENCY_BUDGET_SECONDS):
+                logger.error(f"❌ Trigger {i}: speech capture callback never arrived")
+                return False
+    finally:
+        events.put(None)
+        dispatcher.join(LATENCY_BUDGET_SECONDS)
+    elapsed = time.monotonic() - start
+    
+    latencies.sort()
+    p95 = latencies[int(0.95 * (len(latencies) - 1))]
+    logger.info("\n".join([
+        f"📊 {SYNTHETIC_TRIGGERS} synthetic triggers in {elapsed:.2f}s",
+        f"   Wake word callback latency p50: {latencies[len(latencies) // 2] * 1000:.2f}ms",
+        f"   Wake word callback latency p95: {p95 * 1000:.2f}ms",
+        f"   Wake word callback latency max: {latencies[-1] * 1000:.2f}ms",
+    ]))
+    
+    ok = True
+    if len(latencies) != SYNTHETIC_TRIGGERS:
+        logger.error(f"❌ Expected {SYNTHETIC_TRIGGERS} wake word callbacks, got {len(latencies)}")
+        ok = False
+    if captured != [f"capture_{i}.wav" for i in range(SYNTHETIC_TRIGGERS)]:
+        logger.error("❌ Speech capture callbacks missing or out of order")
+        ok = False
+    if p95 >= LATENCY_BUDGET_SECONDS:
+        logger.error(f"❌ p95 latency {p95 * 1000:.0f}ms is over the {LATENCY_BUDGET_SECONDS * 1000:.0f}ms budget")
+        ok = False
+    return ok
+
+
 def test_wake_word_integration():
     """Test the integrated wake word detection system."""
     logger = setup_logging()
     
+    if CI_QUICK:
+        logger.info("🤖 CI_QUICK: replaying synthetic wake word events")
+        if not run_synthetic_triggers(logger):
+            sys.exit(1)
+        logger.info("✅ Synthetic wake word test passed")
+        return
+    
     logger.info("=" * 70)
     logger.info("Task 3.2: Integrate Wake Word Detection - Test Script")
     logger.info("=" * 70)